@@ -0,0 +1,535 @@
+"""On-disk OHLCV bar store with incremental downloads.
+
+Bars are kept per symbol and download interval as a structured NumPy array
+(``<root>/<symbol>/<interval>.npy``, memory-mapped on read) next to a JSON
+sidecar recording how far back the stored history is complete. Once a period is
+covered, later requests only download bars from the last complete stored bar
+onward and merge them in.
+
+Bars are as Yahoo serves them with ``auto_adjust=False``: split-adjusted, not
+dividend-adjusted. Yahoo rewrites that history when a split happens, so a
+download whose closes disagree with the stored bars it overlaps replaces the
+series instead of being merged into it, and every series is downloaded afresh
+once its last full download is older than ``refresh_after``. Series not topped
+up within ``max_age`` are deleted, and the least recently topped up ones once
+the store outgrows ``max_bytes``.
+
+The download source is a :class:`BarProvider`: Yahoo Finance in production,
+:class:`CsvProvider` for tests and offline work.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Protocol, Sequence
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+_BAR_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),  # UTC nanoseconds
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+_FULL_HISTORY = -(2**63)  # covered_from value once period=max was downloaded
+_MAX_CACHED_FRAMES = 32  # decoded series kept in memory, validated against the files' mtimes
+_PRUNE_INTERVAL = 600.0  # seconds between sweeps of the store's size and age bounds
+_CLOSE_TOLERANCE = 1e-3  # relative close difference that marks stored bars as re-based
+DEFAULT_MAX_BYTES = 512 * 2**20
+DEFAULT_MAX_AGE = 30 * 86400.0  # seconds
+DEFAULT_REFRESH_AFTER = 7 * 86400.0  # seconds
+_PERIOD_RE = re.compile(r"^(\d+)(d|wk|mo|y)$")
+_INTERVAL_RE = re.compile(r"^(\d+)(m|h|d|wk|mo)$")
+_INTERVAL_UNITS = {
+    "m": pd.Timedelta(minutes=1),
+    "h": pd.Timedelta(hours=1),
+    "d": pd.Timedelta(days=1),
+    "wk": pd.Timedelta(weeks=1),
+    "mo": pd.Timedelta(days=31),
+}
+# Longest stretch a listed market goes without new bars (a long weekend)
+_MARKET_CLOSURE = pd.Timedelta(days=4)
+# Calendar periods, shortest first, that a start date is widened to
+_RANGE_PERIODS = ("1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "max")
+
+
+def normalise_bars(data: pd.DataFrame) -> pd.DataFrame:
+    """OHLCV columns only, UTC timestamps, sorted, duplicates resolved to the latest row."""
+    if data.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], tz="UTC"), dtype=np.float64)
+    df = data[OHLCV_COLUMNS].copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = [name[0] if isinstance(name, tuple) else name for name in df.columns]
+    df = df.dropna(how="any")
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise ValueError("Returned data is not indexed by timestamp")
+    idx = df.index
+    idx = idx.tz_localize("UTC") if idx.tz is None else idx.tz_convert("UTC")
+    df.index = idx.as_unit("ns")
+    df = df[~df.index.duplicated(keep="last")]
+    return df.sort_index()
+
+
+class BarProvider(Protocol):
+    """Source of raw OHLCV bars: either a yfinance-style ``period`` or everything from ``start``."""
+
+    def download(
+        self, symbol: str, interval: str, *, period: Optional[str] = None, start: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame: ...
+
+    def download_many(self, symbols: Sequence[str], interval: str, *, period: str) -> Dict[str, pd.DataFrame]: ...
+
+
+class YahooProvider:
+    """Downloads bars with ``yf.download``."""
+
+    def download(
+        self, symbol: str, interval: str, *, period: Optional[str] = None, start: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
+        import yfinance as yf
+
+        window = {"start": start.to_pydatetime()} if start is not None else {"period": period}
+        return yf.download(
+            tickers=symbol,
+            interval=interval,
+            auto_adjust=False,
+            actions=False,
+            progress=False,
+            **window,
+        )
+
+    def download_many(self, symbols: Sequence[str], interval: str, *, period: str) -> Dict[str, pd.DataFrame]:
+        """One multi-ticker ``yf.download`` call, split per symbol; symbols Yahoo did not return are left out."""
+        import yfinance as yf
+
+        data = yf.download(
+            tickers=list(symbols),
+            interval=interval,
+            period=period,
+            auto_adjust=False,
+            actions=False,
+            progress=False,
+            group_by="ticker",
+        )
+        if data.empty or not isinstance(data.columns, pd.MultiIndex):
+            return {}
+        returned = set(data.columns.get_level_values(0))
+        # Each ticker's frame spans every ticker's timestamps; normalise_bars drops the empty rows
+        return {symbol: data[symbol] for symbol in symbols if symbol in returned}
+
+
+class CsvProvider:
+    """Serves bars from ``<directory>/<symbol>_<interval>.csv`` (a timestamp column plus OHLCV)."""
+
+    def __init__(self, directory: os.PathLike | str) -> None:
+        self.directory = Path(directory)
+
+    def download(
+        self, symbol: str, interval: str, *, period: Optional[str] = None, start: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
+        path = self.directory / f"{_safe_name(symbol)}_{interval}.csv"
+        if not path.exists():
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        data = normalise_bars(pd.read_csv(path, index_col=0, parse_dates=True))
+        if start is not None:
+            return data[data.index >= start]
+        if period is not None and len(data):
+            bars = _slice_period(data, period, data.index[-1])
+            return data if bars is None else bars
+        return data
+
+    def download_many(self, symbols: Sequence[str], interval: str, *, period: str) -> Dict[str, pd.DataFrame]:
+        frames = {symbol: self.download(symbol, interval, period=period) for symbol in symbols}
+        return {symbol: frame for symbol, frame in frames.items() if not frame.empty}
+
+
+def _safe_name(symbol: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._^=-]", "_", symbol)
+
+
+def _session_count(period: str) -> Optional[int]:
+    """N for an "Nd" period, which Yahoo reads as the last N sessions rather than calendar days."""
+    match = _PERIOD_RE.match(period)
+    return int(match.group(1)) if match is not None and match.group(2) == "d" else None
+
+
+def _interval_length(interval: str) -> Optional[pd.Timedelta]:
+    """Longest span one bar of ``interval`` covers; None for intervals we do not know."""
+    match = _INTERVAL_RE.match(interval)
+    return None if match is None else int(match.group(1)) * _INTERVAL_UNITS[match.group(2)]
+
+
+def _calendar_start(period: str, now: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """Earliest time a calendar ``period`` reaches back to; None for 'max'."""
+    if period == "max":
+        return None
+    if period == "ytd":
+        return now.normalize().replace(month=1, day=1)
+    match = _PERIOD_RE.match(period)
+    if match is None:
+        raise ValueError(f"Unsupported period '{period}'")
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        return now - pd.DateOffset(days=count)
+    if unit == "wk":
+        return now - pd.DateOffset(weeks=count)
+    if unit == "mo":
+        return now - pd.DateOffset(months=count)
+    return now - pd.DateOffset(years=count)
+
+
+def _slice_period(bars: pd.DataFrame, period: str, now: pd.Timestamp) -> Optional[pd.DataFrame]:
+    """Bars the period asks for, or None when ``bars`` may not reach back far enough."""
+    count = _session_count(period)
+    if count is not None:
+        dates = bars.index.normalize().unique()
+        if len(dates) < count:
+            return None
+        return bars[bars.index >= dates[-count]]
+    start = _calendar_start(period, now)
+    return bars if start is None else bars[bars.index >= start]
+
+
+class BarStore:
+    """Persistent per-symbol/interval bars, topped up with delta downloads."""
+
+    def __init__(
+        self,
+        root: os.PathLike | str,
+        provider: BarProvider,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+        refresh_after: float = DEFAULT_REFRESH_AFTER,
+    ) -> None:
+        self.root = Path(root)
+        self.provider = provider
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.refresh_after = refresh_after
+        self._pruned_at = 0.0
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._frames: "OrderedDict[Path, tuple[tuple[int, int], pd.DataFrame, Dict[str, float]]]" = OrderedDict()
+
+    def load(self, symbol: str, interval: str, period: str, now: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Bars of ``symbol`` at ``interval`` for ``period``, downloading only what is missing.
+
+        Invariant: stored bars are complete from ``covered_from`` to the last stored bar.
+        """
+        now = now if now is not None else pd.Timestamp.now(tz="UTC")
+        if period not in ("max", "ytd") and _PERIOD_RE.match(period) is None:
+            # A period we cannot slice locally: pass it straight through
+            return normalise_bars(self.provider.download(symbol, interval, period=period))
+
+        path = self._path(symbol, interval)
+        with self._lock(str(path)):
+            stored, meta = self._read(path)
+            refresh = self._refresh_due(meta)
+            covered_from = None if refresh else meta.get("covered_from")
+            if covered_from is not None and not stored.empty:
+                # The last stored bar may have been partial; the one before it is final
+                anchor = stored.index[-2] if len(stored) > 1 else stored.index[-1]
+                try:
+                    delta = normalise_bars(self.provider.download(symbol, interval, start=anchor))
+                except Exception:
+                    # e.g. the last bar is older than the provider serves at this interval
+                    delta = None
+                if delta is None or delta.empty or not delta.index[0] <= anchor <= delta.index[-1]:
+                    # yfinance reports failed or throttled fetches as an empty frame, so a delta
+                    # that does not overlap the stored bars proves nothing: keep the old bars
+                    # but no longer claim they reach the present
+                    covered_from = None
+                elif _rebased(stored, delta):
+                    covered_from, refresh = None, True
+                else:
+                    stored = _merge(stored, delta)
+                    self._write(path, stored, covered_from, meta["refreshed_at"])
+                    bars = _slice_period(stored, period, now)
+                    if bars is not None and not bars.empty and covered_from <= _needed_from(period, bars, now):
+                        return bars
+
+            fresh = normalise_bars(self.provider.download(symbol, interval, period=period))
+            return self._absorb(path, stored, covered_from, meta, fresh, period, now, refresh)
+
+    def add(
+        self, symbol: str, interval: str, period: str, data: pd.DataFrame, now: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
+        """Store bars downloaded for ``period`` elsewhere (e.g. a multi-ticker download) and return that period."""
+        now = now if now is not None else pd.Timestamp.now(tz="UTC")
+        fresh = normalise_bars(data)
+        if period not in ("max", "ytd") and _PERIOD_RE.match(period) is None:
+            return fresh
+        path = self._path(symbol, interval)
+        with self._lock(str(path)):
+            stored, meta = self._read(path)
+            return self._absorb(
+                path, stored, meta.get("covered_from"), meta, fresh, period, now, self._refresh_due(meta)
+            )
+
+    def _absorb(
+        self,
+        path: Path,
+        stored: pd.DataFrame,
+        covered_from: Optional[int],
+        meta: Dict[str, float],
+        fresh: pd.DataFrame,
+        period: str,
+        now: pd.Timestamp,
+        refresh: bool,
+    ) -> pd.DataFrame:
+        """Merge a full ``period`` download into the stored bars and return the period's bars.
+
+        With ``refresh`` set, or when the download re-based the bars it overlaps,
+        it replaces the stored bars instead.
+        """
+        if fresh.empty:
+            return fresh
+        reached = _needed_from(period, fresh, now)
+        if refresh or _rebased(stored, fresh):
+            stored, covered_from, refreshed_at = fresh, reached, time.time()
+        else:
+            if covered_from is None or stored.empty or stored.index[-1] < fresh.index[0]:
+                # Older bars that do not join up with the download are kept but not claimed complete
+                covered_from = reached
+            else:
+                covered_from = min(covered_from, reached)
+            stored, refreshed_at = _merge(stored, fresh), meta["refreshed_at"]
+        self._write(path, stored, covered_from, refreshed_at)
+        bars = _slice_period(stored, period, now)
+        return bars if bars is not None else stored[stored.index >= fresh.index[0]]
+
+    def peek(
+        self, symbol: str, interval: str, period: str, max_age: float, now: Optional[pd.Timestamp] = None
+    ) -> Optional[pd.DataFrame]:
+        """Stored bars for ``period`` without any download.
+
+        Returns None unless the stored history covers the period, was topped up
+        within the last ``max_age`` seconds and its last bar is recent enough for
+        ``interval`` (the sidecar alone does not prove a download returned new bars).
+        """
+        if period not in ("max", "ytd") and _PERIOD_RE.match(period) is None:
+            return None
+        now = now if now is not None else pd.Timestamp.now(tz="UTC")
+        stored, meta = self._read(self._path(symbol, interval))
+        covered_from = meta.get("covered_from")
+        if covered_from is None or time.time() - meta.get("updated_at", 0.0) > max_age:
+            return None
+        length = _interval_length(interval)
+        if stored.empty or length is None or now - stored.index[-1] > length + _MARKET_CLOSURE:
+            return None
+        return BarWindow(stored, covered_from).slice(period, now=now)
+
+    def prune(self) -> None:
+        """Delete series not topped up within ``max_age``, then the least recently topped up until under ``max_bytes``."""
+        entries = []
+        for path in self.root.glob("*/*.npy"):
+            try:
+                size = path.stat().st_size + path.with_suffix(".json").stat().st_size
+                updated_at = json.loads(path.with_suffix(".json").read_text()).get("updated_at", 0.0)
+            except (OSError, ValueError):
+                continue  # a write in progress
+            entries.append((updated_at, size, path))
+        total = sum(size for _, size, _ in entries)
+        now = time.time()
+        for updated_at, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if now - updated_at <= self.max_age and total <= self.max_bytes:
+                break
+            lock = self._lock(str(path))
+            if not lock.acquire(blocking=False):
+                continue  # being topped up right now
+            try:
+                path.unlink(missing_ok=True)
+                path.with_suffix(".json").unlink(missing_ok=True)
+            finally:
+                lock.release()
+            with self._locks_guard:
+                self._frames.pop(path, None)
+            total -= size
+
+    def _refresh_due(self, meta: Dict[str, float]) -> bool:
+        return time.time() - meta.get("refreshed_at", 0.0) > self.refresh_after
+
+    def _path(self, symbol: str, interval: str) -> Path:
+        return self.root / _safe_name(symbol) / f"{interval}.npy"
+
+    def _lock(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _read(self, path: Path) -> tuple[pd.DataFrame, Dict[str, float]]:
+        try:
+            version = (path.stat().st_mtime_ns, path.with_suffix(".json").stat().st_mtime_ns)
+        except OSError:
+            version = None
+        with self._locks_guard:
+            cached = self._frames.get(path)
+            if cached is not None and cached[0] == version:
+                self._frames.move_to_end(path)
+                return cached[1], cached[2]
+
+        frame, meta = self._load_file(path)
+        if version is not None and meta:
+            with self._locks_guard:
+                self._frames[path] = (version, frame, meta)
+                self._frames.move_to_end(path)
+                while len(self._frames) > _MAX_CACHED_FRAMES:
+                    self._frames.popitem(last=False)
+        return frame, meta
+
+    @staticmethod
+    def _load_file(path: Path) -> tuple[pd.DataFrame, Dict[str, float]]:
+        try:
+            records = np.load(path, mmap_mode="r")
+            meta = json.loads(path.with_suffix(".json").read_text())
+        except (OSError, ValueError):
+            return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], tz="UTC")), {}
+        index = pd.DatetimeIndex(np.asarray(records["time"]).view("datetime64[ns]")).tz_localize("UTC")
+        frame = pd.DataFrame(
+            {
+                column: np.asarray(records[field])
+                for column, field in zip(OHLCV_COLUMNS, ("open", "high", "low", "close", "volume"))
+            },
+            index=index,
+        )
+        return frame, meta
+
+    def _write(self, path: Path, bars: pd.DataFrame, covered_from: Optional[int], refreshed_at: float) -> None:
+        records = np.empty(len(bars), dtype=_BAR_DTYPE)
+        records["time"] = bars.index.as_unit("ns").asi8
+        for column, field in zip(OHLCV_COLUMNS, ("open", "high", "low", "close", "volume")):
+            records[field] = bars[column].to_numpy(dtype=np.float64)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".npy", delete=False) as handle:
+            np.save(handle, records)
+        os.replace(handle.name, path)
+        self._write_meta(path, covered_from, refreshed_at)
+        with self._locks_guard:
+            due = time.time() - self._pruned_at > _PRUNE_INTERVAL
+            if due:
+                self._pruned_at = time.time()
+        if due:
+            self.prune()
+
+    @staticmethod
+    def _write_meta(path: Path, covered_from: Optional[int], refreshed_at: float) -> None:
+        meta = {"covered_from": covered_from, "updated_at": time.time(), "refreshed_at": refreshed_at}
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".json", delete=False) as handle:
+            json.dump(meta, handle)
+        os.replace(handle.name, path.with_suffix(".json"))
+
+
+def _needed_from(period: str, bars: pd.DataFrame, now: pd.Timestamp) -> int:
+    """Earliest time (ns) ``bars`` must be complete from to answer ``period``."""
+    if _session_count(period) is not None:
+        return int(bars.index[0].value)
+    start = _calendar_start(period, now)
+    if start is None:
+        return _FULL_HISTORY
+    return min(int(start.value), int(bars.index[0].value))
+
+
+def _rebased(stored: pd.DataFrame, new: pd.DataFrame) -> bool:
+    """True when ``new`` disagrees with the stored closes it overlaps, as after a split."""
+    common = stored.index[:-1].intersection(new.index)  # the last stored bar may have been partial
+    if common.empty:
+        return False
+    return not np.allclose(
+        new.loc[common, "Close"].to_numpy(), stored.loc[common, "Close"].to_numpy(), rtol=_CLOSE_TOLERANCE
+    )
+
+
+def _merge(stored: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Union of both, preferring ``new`` where timestamps overlap (the last bar may have been partial)."""
+    if stored.empty:
+        return new
+    if new.empty:
+        return stored
+    merged = pd.concat([stored[stored.index < new.index[0]], new, stored[stored.index > new.index[-1]]])
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+@dataclass
+class BarWindow:
+    """Bars complete from ``covered_from`` (UTC ns) to their last bar, which serve any range inside that."""
+
+    bars: pd.DataFrame
+    covered_from: int
+
+    @classmethod
+    def for_period(cls, bars: pd.DataFrame, period: str, now: pd.Timestamp) -> "BarWindow":
+        """Window of ``bars`` downloaded for ``period``."""
+        return cls(bars, _needed_from(period, bars, now) if not bars.empty else int(now.value))
+
+    def slice(
+        self,
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        now: Optional[pd.Timestamp] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Bars for ``period``, or from ``start``, up to ``end``; None when the window does not hold all of them."""
+        if start is not None:
+            if self.covered_from > start.value:
+                return None
+            bars = self.bars[self.bars.index >= start]
+        else:
+            if period is None or (period not in ("max", "ytd") and _PERIOD_RE.match(period) is None):
+                return None
+            now = now if now is not None else pd.Timestamp.now(tz="UTC")
+            bars = _slice_period(self.bars, period, now)
+            if bars is None or bars.empty or self.covered_from > _needed_from(period, bars, now):
+                return None
+        return bars if end is None else bars[bars.index < end]
+
+
+def period_covering(start: pd.Timestamp, now: pd.Timestamp) -> str:
+    """Shortest download period that reaches back to ``start``."""
+    for period in _RANGE_PERIODS[:-1]:
+        if _calendar_start(period, now) <= start:
+            return period
+    return _RANGE_PERIODS[-1]
+
+
+_store: Optional[BarStore] = None
+_store_guard = threading.Lock()
+
+
+def get_bar_store() -> Optional[BarStore]:
+    """Process-wide store under ``BAR_STORE_DIR`` (empty disables it), backed by Yahoo Finance."""
+    global _store
+    root = os.getenv("BAR_STORE_DIR", str(Path(tempfile.gettempdir()) / "three-axis-bars"))
+    if not root:
+        return None
+    with _store_guard:
+        if _store is None or _store.root != Path(root):
+            _store = BarStore(
+                root,
+                YahooProvider(),
+                max_bytes=int(float(os.getenv("BAR_STORE_MAX_MB", DEFAULT_MAX_BYTES / 2**20)) * 2**20),
+                max_age=float(os.getenv("BAR_STORE_MAX_AGE_DAYS", DEFAULT_MAX_AGE / 86400)) * 86400,
+                refresh_after=float(os.getenv("BAR_STORE_REFRESH_DAYS", DEFAULT_REFRESH_AFTER / 86400)) * 86400,
+            )
+        return _store
+
+
+def set_bar_provider(provider: BarProvider) -> None:
+    """Swap the download source of the process-wide store (e.g. CSV fixtures)."""
+    store = get_bar_store()
+    if store is not None:
+        store.provider = provider
@@ -0,0 +1,131 @@
+"""Compact binary encoding for cached monthly payloads.
+
+Version 1 is ``b"M1"`` followed by a zlib-compressed body. The body stores each
+row table of ``_TABLES`` column by column: a uint16 row count, then every column
+packed contiguously. Planet/rashi/nakshatra names become uint8 indices into
+``_NAMES``, small integers a uint8, speeds a float64 and wall-clock timestamps
+fixed 19-byte ASCII. A final byte holds ``swissAvailable``. Payloads that do not
+fit that layout are stored as zlib-compressed JSON under ``b"M0"``.
+"""
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from itertools import repeat
+from typing import Any, Dict, List, Tuple
+
+from .swiss import NAKSHATRA_NAMES, PLANET_IDS, RASHI
+
+_JSON_HEADER = b"M0"
+_PACKED_HEADER = b"M1"
+_COMPRESS_LEVEL = 6
+
+# Append only: a name's index is part of every stored version-1 payload
+_NAMES: Tuple[str, ...] = (
+    *PLANET_IDS,
+    *RASHI,
+    *NAKSHATRA_NAMES,
+    "min",
+    "max",
+    "retrograde",
+)
+_NAME_CODES = {name: code for code, name in enumerate(_NAMES)}
+
+# "YYYY-MM-DD HH:MM:SS": formatting integer seconds back into these strings costs
+# more than json.loads, while zlib removes most of their redundancy anyway
+_TIME_WIDTH = 19
+
+_TABLES: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = (
+    ("moonMonthlyRows", (("timeISO", "time"), ("nakshatra", "name"), ("pada", "small"))),
+    ("sunRows", (("timeISO", "time"), ("from", "name"), ("to", "name"))),
+    ("otherIngressRows", (("body", "name"), ("from", "name"), ("to", "name"), ("timeISO", "time"))),
+    ("stationRows", (("planet", "name"), ("state", "name"), ("startISO", "time"), ("endISO", "time"))),
+    ("combRows", (("startISO", "time"), ("endISO", "time"), ("planet", "name"), ("orbDeg", "small"))),
+    ("velocityRows", (("planet", "name"), ("kind", "name"), ("timeISO", "time"), ("speed", "float"))),
+)
+_PAYLOAD_KEYS = {table for table, _ in _TABLES} | {"swissAvailable"}
+_COUNT = struct.Struct("<H")
+
+
+def _pack_column(kind: str, values: List[Any]) -> bytes:
+    if kind == "time":
+        packed = "".join(values).encode("ascii")
+        if len(packed) != _TIME_WIDTH * len(values):
+            raise ValueError("timestamps must be 'YYYY-MM-DD HH:MM:SS'")
+        return packed
+    if kind == "name":
+        return bytes(_NAME_CODES[value] for value in values)
+    if kind == "small":
+        if any(type(value) is not int for value in values):
+            raise TypeError("small columns hold integers only")
+        return bytes(values)
+    return struct.pack(f"<{len(values)}d", *values)
+
+
+def _unpack_column(kind: str, body: bytes, offset: int, count: int) -> Tuple[List[Any], int]:
+    if kind == "time":
+        end = offset + _TIME_WIDTH * count
+        text = body[offset:end].decode("ascii")
+        return [text[i : i + _TIME_WIDTH] for i in range(0, len(text), _TIME_WIDTH)], end
+    if kind == "name":
+        end = offset + count
+        return [_NAMES[code] for code in body[offset:end]], end
+    if kind == "small":
+        end = offset + count
+        return list(body[offset:end]), end
+    end = offset + 8 * count
+    return list(struct.unpack_from(f"<{count}d", body, offset)), end
+
+
+def _pack(data: Dict[str, Any]) -> bytes:
+    if set(data) != _PAYLOAD_KEYS or not isinstance(data["swissAvailable"], bool):
+        raise ValueError("payload does not match the packed layout")
+    parts: List[bytes] = []
+    for table, fields in _TABLES:
+        rows = data[table]
+        if any(len(row) != len(fields) for row in rows):
+            raise ValueError(f"unexpected {table} row keys")
+        parts.append(_COUNT.pack(len(rows)))
+        for key, kind in fields:
+            parts.append(_pack_column(kind, [row[key] for row in rows]))
+    parts.append(bytes([data["swissAvailable"]]))
+    return b"".join(parts)
+
+
+def _unpack(body: bytes) -> Dict[str, Any]:
+    data: Dict[str, Any] = {}
+    offset = 0
+    for table, fields in _TABLES:
+        (count,) = _COUNT.unpack_from(body, offset)
+        offset += _COUNT.size
+        columns = []
+        for _, kind in fields:
+            column, offset = _unpack_column(kind, body, offset, count)
+            columns.append(column)
+        keys = [key for key, _ in fields]
+        data[table] = list(map(dict, map(zip, repeat(keys), zip(*columns))))
+    data["swissAvailable"] = bool(body[offset])
+    return data
+
+
+def encode_month(data: Dict[str, Any]) -> bytes:
+    """Encode a monthly payload, falling back to compressed JSON when it does not fit the layout."""
+    try:
+        body = _pack(data)
+        # Guard against values the layout would silently alter
+        if _unpack(body) == data:
+            return _PACKED_HEADER + zlib.compress(body, _COMPRESS_LEVEL)
+    except (KeyError, TypeError, ValueError, OverflowError, UnicodeError, struct.error):
+        pass
+    return _JSON_HEADER + zlib.compress(json.dumps(data).encode(), _COMPRESS_LEVEL)
+
+
+def decode_month(blob: bytes) -> Dict[str, Any]:
+    """Decode a payload produced by :func:`encode_month`."""
+    header, body = bytes(blob[:2]), zlib.decompress(blob[2:])
+    if header == _PACKED_HEADER:
+        return _unpack(body)
+    if header == _JSON_HEADER:
+        return json.loads(body)
+    raise ValueError(f"unknown month encoding {header!r}")
@@ -1,14 +1,36 @@
 """Database connection and schema for caching planetary events."""
+import asyncio
 import os
 import hashlib
 import json
+import logging
 from datetime import datetime
-from typing import Optional, Dict, Any
+from itertools import islice
+from typing import Optional, Dict, Any, Sequence, Tuple
 import asyncpg
 
+from .codec import decode_month, encode_month
+from .swiss import ENGINE_VERSION
+
+logger = logging.getLogger(__name__)
+
 # Database connection pool
 _pool: Optional[asyncpg.Pool] = None
 
+# Write-behind queue for computed months, keyed (location_hash, ayanamsa, month_start).
+# Repeated writes of a key coalesce; a background task flushes them in batches.
+WRITE_BATCH_SIZE = 1000
+WRITE_FLUSH_INTERVAL = 0.5  # seconds
+MAX_PENDING_WRITES = 10000  # enqueuers wait for a flush beyond this
+
+_MonthKey = Tuple[str, str, str]
+_pending_months: Dict[_MonthKey, Dict[str, Any]] = {}
+_inflight_months: Dict[_MonthKey, Dict[str, Any]] = {}
+_flush_lock: Optional[asyncio.Lock] = None
+_flush_wakeup: Optional[asyncio.Event] = None
+_writer_task: Optional[asyncio.Task] = None
+_writer_stopping = False
+
 
 async def get_pool() -> Optional[asyncpg.Pool]:
     """Get or create database connection pool."""
@@ -31,32 +53,81 @@ def location_hash(lat: float, lon: float, tz: str, ayanamsa: str = "lahiri") ->
     return hashlib.md5(key.encode()).hexdigest()
 
 
+# Ordered schema migrations, recorded in schema_migrations once applied.
+# Never edit an applied step; append a new one.
+_MIGRATIONS: Tuple[Tuple[int, str], ...] = (
+    (
+        1,
+        """
+        CREATE TABLE IF NOT EXISTS planetary_events (
+            id SERIAL PRIMARY KEY,
+            location_hash VARCHAR(32) NOT NULL,
+            ayanamsa VARCHAR(20) NOT NULL,
+            month_start VARCHAR(7) NOT NULL,
+            data JSONB NOT NULL,
+            computed_at TIMESTAMP DEFAULT NOW(),
+            UNIQUE(location_hash, ayanamsa, month_start)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_location_ayanamsa_month
+        ON planetary_events(location_hash, ayanamsa, month_start);
+
+        -- Location-independent UTC event catalogue, one row per ayanamsa and UTC month
+        CREATE TABLE IF NOT EXISTS event_catalogue (
+            ayanamsa VARCHAR(20) NOT NULL,
+            chunk_start VARCHAR(7) NOT NULL,
+            data JSONB NOT NULL,
+            computed_at TIMESTAMP DEFAULT NOW(),
+            PRIMARY KEY (ayanamsa, chunk_start)
+        );
+        """,
+    ),
+    (
+        2,
+        """
+        -- Rows written before engine versions existed count as version 0 (stale)
+        ALTER TABLE planetary_events ADD COLUMN IF NOT EXISTS engine_version INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE event_catalogue ADD COLUMN IF NOT EXISTS engine_version INTEGER NOT NULL DEFAULT 0;
+
+        -- Month data is encoded by app.codec
+        DO $$
+        BEGIN
+            IF (SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'planetary_events' AND column_name = 'data') = 'jsonb' THEN
+                ALTER TABLE planetary_events ALTER COLUMN data TYPE BYTEA USING convert_to(data::text, 'UTF8');
+            END IF;
+        END $$;
+        """,
+    ),
+)
+
+# Serialises migrations when several app instances start at once
+_MIGRATION_LOCK_ID = 0x7A11_CACE
+
+
 async def init_db():
-    """Initialize database schema."""
+    """Bring the database schema up to date without discarding cached data."""
     pool = await get_pool()
     if pool is None:
         # No database configured - skip initialization
         return
 
     async with pool.acquire() as conn:
-        # Drop old table if exists (since we're changing the schema)
-        await conn.execute("DROP TABLE IF EXISTS planetary_events CASCADE;")
-
-        # Create new table with ayanamsa column
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS planetary_events (
-                id SERIAL PRIMARY KEY,
-                location_hash VARCHAR(32) NOT NULL,
-                ayanamsa VARCHAR(20) NOT NULL,
-                month_start VARCHAR(7) NOT NULL,
-                data JSONB NOT NULL,
-                computed_at TIMESTAMP DEFAULT NOW(),
-                UNIQUE(location_hash, ayanamsa, month_start)
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_location_ayanamsa_month
-            ON planetary_events(location_hash, ayanamsa, month_start);
-        """)
+        async with conn.transaction():
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", _MIGRATION_LOCK_ID)
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version INTEGER PRIMARY KEY,
+                    applied_at TIMESTAMP DEFAULT NOW()
+                );
+            """)
+            applied = {row["version"] for row in await conn.fetch("SELECT version FROM schema_migrations")}
+            for version, sql in _MIGRATIONS:
+                if version in applied:
+                    continue
+                await conn.execute(sql)
+                await conn.execute("INSERT INTO schema_migrations (version) VALUES ($1)", version)
+                logger.info("Applied database migration %d", version)
 
 
 async def get_cached_month(
@@ -68,42 +139,199 @@ async def get_cached_month(
         return None
 
     loc_hash = location_hash(lat, lon, tz, ayanamsa)
+    pending = _pending_write((loc_hash, ayanamsa, month_start_iso[:7]))
+    if pending is not None:
+        return pending
 
     async with pool.acquire() as conn:
         row = await conn.fetchrow(
-            "SELECT data FROM planetary_events WHERE location_hash = $1 AND ayanamsa = $2 AND month_start = $3",
+            "SELECT data FROM planetary_events "
+            "WHERE location_hash = $1 AND ayanamsa = $2 AND month_start = $3 AND engine_version = $4",
             loc_hash,
             ayanamsa,
             month_start_iso[:7],  # Only YYYY-MM
+            ENGINE_VERSION,
         )
 
         if row:
-            return json.loads(row["data"])
+            return decode_month(row["data"])
         return None
 
 
+async def get_cached_months(
+    lat: float, lon: float, tz: str, month_start_isos: Sequence[str], ayanamsa: str = "lahiri"
+) -> Dict[str, Dict[str, Any]]:
+    """Get cached planetary events for several months in one query, keyed by the requested ISO."""
+    pool = await get_pool()
+    if pool is None or not month_start_isos:
+        return {}
+
+    loc_hash = location_hash(lat, lon, tz, ayanamsa)
+    requested: Dict[str, list] = {}
+    for month_iso in month_start_isos:
+        requested.setdefault(month_iso[:7], []).append(month_iso)  # Only YYYY-MM
+
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            "SELECT month_start, data FROM planetary_events "
+            "WHERE location_hash = $1 AND ayanamsa = $2 AND month_start = ANY($3) AND engine_version = $4",
+            loc_hash,
+            ayanamsa,
+            list(requested),
+            ENGINE_VERSION,
+        )
+
+    cached: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        data = decode_month(row["data"])
+        for month_iso in requested[row["month_start"]]:
+            cached[month_iso] = data
+    # Months still waiting in the write-behind queue are newer than their rows
+    for month_key, month_isos in requested.items():
+        pending = _pending_write((loc_hash, ayanamsa, month_key))
+        if pending is not None:
+            for month_iso in month_isos:
+                cached[month_iso] = pending
+    return cached
+
+
 async def cache_month(
     lat: float, lon: float, tz: str, month_start_iso: str, data: Dict[str, Any], ayanamsa: str = "lahiri"
 ):
-    """Cache planetary events for a specific month."""
+    """Queue planetary events for a specific month; written to the database in the background."""
     pool = await get_pool()
     if pool is None:
         return  # No database - skip caching
 
     loc_hash = location_hash(lat, lon, tz, ayanamsa)
+    _pending_months[(loc_hash, ayanamsa, month_start_iso[:7])] = data
+    _ensure_writer()
+    if len(_pending_months) >= MAX_PENDING_WRITES:
+        await flush_pending_writes()
+    elif len(_pending_months) >= WRITE_BATCH_SIZE:
+        _flush_wakeup.set()
+
+
+def _pending_write(key: _MonthKey) -> Optional[Dict[str, Any]]:
+    data = _pending_months.get(key)
+    return data if data is not None else _inflight_months.get(key)
+
+
+def _ensure_writer() -> None:
+    global _flush_lock, _flush_wakeup, _writer_task
+    if _flush_lock is None:
+        _flush_lock = asyncio.Lock()
+        _flush_wakeup = asyncio.Event()
+    if _writer_task is None or _writer_task.done():
+        _writer_task = asyncio.get_running_loop().create_task(_write_behind_loop())
+
+
+async def _write_behind_loop():
+    while not _writer_stopping:
+        try:
+            await asyncio.wait_for(_flush_wakeup.wait(), timeout=WRITE_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        _flush_wakeup.clear()
+        await flush_pending_writes()
+
+
+async def flush_pending_writes() -> int:
+    """Write every queued month to the database; returns the number of rows written.
+
+    A batch that fails is dropped (it is only a cache) so memory stays bounded.
+    """
+    if _flush_lock is None:
+        return 0
+
+    written = 0
+    async with _flush_lock:
+        pool = await get_pool()
+        while _pending_months and pool is not None:
+            keys = list(islice(_pending_months, WRITE_BATCH_SIZE))
+            for key in keys:
+                _inflight_months[key] = _pending_months.pop(key)
+            try:
+                blobs = await asyncio.to_thread(
+                    lambda: [encode_month(_inflight_months[key]) for key in keys]
+                )
+                async with pool.acquire() as conn:
+                    # One statement per batch: unnest the columns, upsert every row
+                    await conn.execute(
+                        """
+                        INSERT INTO planetary_events (location_hash, ayanamsa, month_start, data, engine_version)
+                        SELECT h, a, m, d, $5
+                        FROM unnest($1::text[], $2::text[], $3::text[], $4::bytea[]) AS t(h, a, m, d)
+                        ON CONFLICT (location_hash, ayanamsa, month_start)
+                        DO UPDATE SET data = EXCLUDED.data, engine_version = EXCLUDED.engine_version,
+                                      computed_at = NOW()
+                        """,
+                        [key[0] for key in keys],
+                        [key[1] for key in keys],
+                        [key[2] for key in keys],
+                        blobs,
+                        ENGINE_VERSION,
+                    )
+                written += len(keys)
+            except Exception:
+                logger.exception("Dropping %d queued months after a failed write", len(keys))
+            finally:
+                for key in keys:
+                    _inflight_months.pop(key, None)
+    return written
+
+
+async def close_db():
+    """Flush queued writes, stop the background writer and close the pool."""
+    global _pool, _writer_task, _writer_stopping, _flush_lock, _flush_wakeup
+    if _writer_task is not None:
+        # Let the writer finish its current batch rather than cancelling it mid-write
+        _writer_stopping = True
+        _flush_wakeup.set()
+        await _writer_task
+        _writer_task = None
+    await flush_pending_writes()
+    _writer_stopping = False
+    _flush_lock = _flush_wakeup = None
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+async def get_catalogue_chunks(
+    ayanamsa: str, chunk_keys: Sequence[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Get stored UTC event catalogue chunks ('YYYY-MM' keys) for an ayanamsa."""
+    pool = await get_pool()
+    if pool is None or not chunk_keys:
+        return {}
 
     async with pool.acquire() as conn:
-        await conn.execute(
+        rows = await conn.fetch(
+            "SELECT chunk_start, data FROM event_catalogue "
+            "WHERE ayanamsa = $1 AND chunk_start = ANY($2) AND engine_version = $3",
+            ayanamsa,
+            list(chunk_keys),
+            ENGINE_VERSION,
+        )
+        return {row["chunk_start"]: json.loads(row["data"]) for row in rows}
+
+
+async def cache_catalogue_chunks(ayanamsa: str, chunks: Dict[str, Dict[str, Any]]):
+    """Store UTC event catalogue chunks for an ayanamsa."""
+    pool = await get_pool()
+    if pool is None or not chunks:
+        return  # No database - skip caching
+
+    async with pool.acquire() as conn:
+        await conn.executemany(
             """
-            INSERT INTO planetary_events (location_hash, ayanamsa, month_start, data)
+            INSERT INTO event_catalogue (ayanamsa, chunk_start, data, engine_version)
             VALUES ($1, $2, $3, $4)
-            ON CONFLICT (location_hash, ayanamsa, month_start)
-            DO UPDATE SET data = $4, computed_at = NOW()
+            ON CONFLICT (ayanamsa, chunk_start)
+            DO UPDATE SET data = $3, engine_version = $4, computed_at = NOW()
             """,
-            loc_hash,
-            ayanamsa,
-            month_start_iso[:7],
-            json.dumps(data),
+            [(ayanamsa, key, json.dumps(data), ENGINE_VERSION) for key, data in chunks.items()],
         )
 
 
@@ -115,6 +343,9 @@ async def get_cache_stats() -> Dict[str, Any]:
             "total_months_cached": 0,
             "unique_locations": 0,
             "cache_started": None,
+            "catalogue_chunks_cached": 0,
+            "stale_months": 0,
+            "engine_version": ENGINE_VERSION,
             "database_enabled": False,
         }
 
@@ -126,10 +357,18 @@ async def get_cache_stats() -> Dict[str, Any]:
         oldest = await conn.fetchval(
             "SELECT MIN(computed_at) FROM planetary_events"
         )
+        chunks = await conn.fetchval("SELECT COUNT(*) FROM event_catalogue")
+        # Rows from other engine versions are never served; they are overwritten on recompute
+        stale = await conn.fetchval(
+            "SELECT COUNT(*) FROM planetary_events WHERE engine_version <> $1", ENGINE_VERSION
+        )
 
         return {
             "total_months_cached": total,
             "unique_locations": locations,
             "cache_started": oldest.isoformat() if oldest else None,
+            "catalogue_chunks_cached": chunks,
+            "stale_months": stale,
+            "engine_version": ENGINE_VERSION,
             "database_enabled": True,
         }
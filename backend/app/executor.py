@@ -0,0 +1,205 @@
+"""Process pool for the CPU-bound ephemeris, overlay and force computations.
+
+The Swiss scans are pure-Python loops that hold the GIL, so running them on
+``anyio`` worker threads serialises every request. ``run_cpu`` sends them to a
+pool of worker processes instead. Set ``COMPUTE_WORKERS`` to size the pool
+(default: one per available core, as many as fit ``WORKER_MEMORY_BYTES`` each in
+half the memory available, since every worker loads its own astropy, swisseph
+and NumPy); ``0`` keeps the old thread behaviour.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+import anyio
+
+T = TypeVar("T")
+
+WORKER_MEMORY_BYTES = 256 * 2**20  # per worker: the loaded modules plus working arrays
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_started_at = time.monotonic()
+_stats: Dict[str, float] = {
+    "submitted": 0,
+    "completed": 0,
+    "failed": 0,
+    "in_flight": 0,
+    "busy_seconds": 0.0,
+}
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (respects affinity masks and container cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:  # not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def _available_memory() -> Optional[int]:
+    """Bytes this process may use: its cgroup limit if it has one, else physical memory; None if unknown."""
+    for limit in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            raw = Path(limit).read_text().strip()
+        except OSError:
+            continue
+        if raw.isdigit() and int(raw) < 2**60:  # cgroup v1 reports "no limit" as a huge number
+            return int(raw)
+        break
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _default_workers() -> int:
+    """One worker per available CPU, as long as they fit in half the available memory."""
+    cpus = _available_cpus()
+    memory = _available_memory()
+    if memory is None:
+        return cpus
+    return max(1, min(cpus, memory // 2 // WORKER_MEMORY_BYTES))
+
+
+def worker_count() -> int:
+    """Configured number of worker processes (0 = run on threads)."""
+    default = _default_workers()
+    raw = os.getenv("COMPUTE_WORKERS")
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return default
+
+
+def _initialise_worker() -> None:
+    """Load the ephemeris modules once per worker so the first request is not slowed."""
+    from . import orbital, overlays  # noqa: F401  (heavy astropy imports)
+    from .planetary_forces import initialize_ephemeris
+    from .spk import load_kernel
+    from .swiss import _initialise_once
+
+    _initialise_once()
+    initialize_ephemeris()
+    load_kernel(orbital.EPHEMERIS_PATH)
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _timed_call(fn: Callable[..., T], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[T, float]:
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    workers = worker_count()
+    if workers == 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # spawn: forking a process that already runs the event loop and DB pool is unsafe
+                _pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_initialise_worker,
+                )
+    return _pool
+
+
+async def start_pool() -> None:
+    """Create the pool and start every worker up front."""
+    pool = _get_pool()
+    if pool is None:
+        return
+    loop = asyncio.get_running_loop()
+    # Submitting one task per worker before any is idle makes the pool spawn them all
+    await asyncio.gather(*(loop.run_in_executor(pool, _ready) for _ in range(worker_count())))
+
+
+def _replace_broken_pool(broken: ProcessPoolExecutor) -> Optional[ProcessPoolExecutor]:
+    """Discard ``broken`` unless another caller already replaced it, and return the current pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+            broken.shutdown(wait=False, cancel_futures=True)
+    return _get_pool()
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+async def run_cpu(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` in the process pool and return its result.
+
+    ``fn`` and its arguments must be picklable (module-level functions). A
+    broken pool is discarded and the call retried once on a fresh one.
+    """
+    pool = _get_pool()
+    if pool is None:
+        return await anyio.to_thread.run_sync(partial(fn, *args, **kwargs))
+
+    with _stats_lock:
+        _stats["submitted"] += 1
+        _stats["in_flight"] += 1
+    loop = asyncio.get_running_loop()
+    try:
+        try:
+            result, elapsed = await loop.run_in_executor(pool, _timed_call, fn, args, kwargs)
+        except BrokenProcessPool:
+            pool = _replace_broken_pool(pool)
+            result, elapsed = await loop.run_in_executor(pool, _timed_call, fn, args, kwargs)
+    except BaseException:
+        with _stats_lock:
+            _stats["failed"] += 1
+        raise
+    else:
+        with _stats_lock:
+            _stats["completed"] += 1
+            _stats["busy_seconds"] += elapsed
+        return result
+    finally:
+        with _stats_lock:
+            _stats["in_flight"] -= 1
+
+
+def pool_stats() -> Dict[str, object]:
+    """Queue depth and worker utilisation since the process started."""
+    workers = worker_count()
+    with _stats_lock:
+        stats = dict(_stats)
+    in_flight = int(stats["in_flight"])
+    uptime = max(time.monotonic() - _started_at, 1e-9)
+    return {
+        "mode": "process" if workers else "thread",
+        "workers": workers,
+        "running": min(in_flight, workers) if workers else in_flight,
+        "queue_depth": max(0, in_flight - workers) if workers else 0,
+        "submitted": int(stats["submitted"]),
+        "completed": int(stats["completed"]),
+        "failed": int(stats["failed"]),
+        "busy_seconds": round(stats["busy_seconds"], 3),
+        "utilisation": round(stats["busy_seconds"] / (workers * uptime), 4) if workers else None,
+    }
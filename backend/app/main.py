@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import anyio
+import asyncio
 from datetime import datetime, timedelta
 from functools import partial
+import json
+import anyio
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import httpx
+import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from typing import List, Literal
+from typing import Dict, List, Literal, Optional
 import warnings
 
 warnings.filterwarnings("ignore", category=FutureWarning, module="yfinance")
@@ -18,13 +22,40 @@ from .utils import (
     PANDAS_FREQ,
     FetchError,
     ResponseCache,
+    SingleFlight,
     dataframe_to_candles,
-    fetch_bars,
+    dataframe_to_columns,
+    fetch_bars_async,
+    fetch_bars_many_async,
     normalize_symbol,
 )
-from .swiss import compute_horizon, compute_monthly, compute_planetary_timeseries
-from .orbital import compute_overlay_series
-from .database import init_db, get_cached_month, cache_month, get_cache_stats
+from .bar_store import BarWindow, period_covering
+from .swiss import (
+    EventCatalogue,
+    catalogue_chunk_keys,
+    compute_catalogue_chunk_sets,
+    compute_horizon,
+    compute_planetary_timeseries,
+    localise_months,
+)
+from .orbital import (
+    ObjectTile,
+    OverlaySeries,
+    compute_object_tiles,
+    overlay_series,
+    overlay_window,
+)
+from .tiles import TileSpan, cover_spans, grid_key, load_tiles, window_slice
+from .executor import pool_stats, run_cpu, shutdown_pool, start_pool, worker_count
+from .database import (
+    init_db,
+    close_db,
+    get_cached_months,
+    cache_month,
+    get_catalogue_chunks,
+    cache_catalogue_chunks,
+    get_cache_stats,
+)
 from .overlays import (
     calculate_sunspot_overlay,
     calculate_tidal_overlay,
@@ -39,8 +70,20 @@ app = FastAPI(title="Candlestick Service", version="0.1.0")
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup."""
+    """Initialize database, warm the compute workers and start cache expiry on startup."""
+    global _prune_task
     await init_db()
+    await start_pool()
+    _prune_task = asyncio.create_task(_prune_caches_periodically())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write queued months to the database and stop the compute workers."""
+    if _prune_task is not None:
+        _prune_task.cancel()
+    await close_db()
+    shutdown_pool()
 
 app.add_middleware(
     CORSMiddleware,
@@ -50,11 +93,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-cache = ResponseCache(ttl_seconds=120)
-# Long-term cache for planetary events (1 hour - data doesn't change)
-events_cache = ResponseCache(ttl_seconds=3600)
+MB = 1024 * 1024
+
+cache = ResponseCache(ttl_seconds=120, max_entries=512, max_bytes=48 * MB)
+# Bars behind recent OHLC responses, per symbol and interval: any period or range
+# inside the widest one fetched is served by slicing
+bars_cache = ResponseCache(ttl_seconds=120, max_entries=256, max_bytes=64 * MB)
+# Long-term cache for planetary events (1 day - data doesn't change, size is bounded)
+events_cache = ResponseCache(ttl_seconds=86400, max_entries=4096, max_bytes=96 * MB)
 # Search cache (5 minutes - symbols don't change often)
-search_cache = ResponseCache(ttl_seconds=300)
+search_cache = ResponseCache(ttl_seconds=300, max_entries=2048, max_bytes=8 * MB)
+# UTC event catalogue chunks (per ayanamsa + UTC month) - shared by every location
+catalogue_cache = ResponseCache(ttl_seconds=86400, max_entries=1024, max_bytes=48 * MB)
+# Tiles of overlay series: panned windows and changed flags or weights reuse them
+tile_cache = ResponseCache(ttl_seconds=86400, max_entries=4096, max_bytes=128 * MB)
+
+MEMORY_CACHES: Dict[str, ResponseCache] = {
+    "responses": cache,
+    "bars": bars_cache,
+    "events": events_cache,
+    "search": search_cache,
+    "catalogue": catalogue_cache,
+    "tiles": tile_cache,
+}
+# Concurrent identical cache misses share one computation, keyed by their cache key
+inflight = SingleFlight()
+
+CACHE_PRUNE_INTERVAL = 60  # seconds
+_prune_task: Optional[asyncio.Task] = None
+
+
+async def _prune_caches_periodically() -> None:
+    """Drop expired entries so idle keys do not hold memory until their next lookup."""
+    while True:
+        await asyncio.sleep(CACHE_PRUNE_INTERVAL)
+        for memory_cache in MEMORY_CACHES.values():
+            memory_cache.prune()
 
 
 class SwissHorizonPayload(BaseModel):
@@ -87,6 +161,8 @@ class SwissMonthlyBatchPayload(BaseModel):
     tz: str
     month_start_isos: List[str] = Field(alias="monthStartISOs", min_length=1, max_length=60)
     ayanamsa: Literal["lahiri", "raman", "tropical"] = "tropical"
+    # Further systems computed from the same ephemeris scan, returned under "systems"
+    ayanamsas: Optional[List[Literal["lahiri", "raman", "tropical"]]] = Field(default=None, max_length=3)
 
 
 class OrbitalOverlayPayload(BaseModel):
@@ -105,6 +181,13 @@ class OrbitalOverlayPayload(BaseModel):
     weights: dict[str, float] | None = None
 
 
+class OhlcBatchPayload(BaseModel):
+    symbols: List[str] = Field(min_length=1, max_length=100)
+    interval: str
+    period: str = DEFAULT_PERIOD
+    format: Literal["rows", "columns"] = "rows"
+
+
 class PlanetaryTimeseriesPayload(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
@@ -119,9 +202,16 @@ async def healthcheck() -> dict[str, str]:
 
 @app.get("/api/cache/stats")
 async def cache_stats():
-    """Get database cache statistics."""
+    """Get database and in-memory cache statistics."""
     stats = await get_cache_stats()
-    return {"ok": True, **stats}
+    memory = {name: memory_cache.stats() for name, memory_cache in MEMORY_CACHES.items()}
+    return {"ok": True, **stats, "memory": memory, "inflight": inflight.stats()}
+
+
+@app.get("/api/compute/stats")
+async def compute_stats():
+    """Queue depth and utilisation of the compute worker pool."""
+    return {"ok": True, **pool_stats()}
 
 
 @app.get("/api/search")
@@ -134,7 +224,10 @@ async def search_symbols(
     cached = search_cache.get(cache_key)
     if cached is not None:
         return cached
+    return await inflight.run(cache_key, lambda: _search_upstream(q, limit, cache_key))
+
 
+async def _search_upstream(q: str, limit: int, cache_key: str):
     params = {"q": q, "quotesCount": limit, "newsCount": 0}
     headers = {"User-Agent": "jupiter-terminal/1.0", "Accept": "application/json"}
     try:
@@ -180,38 +273,209 @@ async def get_ohlc(
     symbol: str = Query(..., description="Yahoo Finance symbol e.g. AAPL or BTC USD"),
     interval: str = Query(..., description="One of 5m, 15m, 1h, 4h, 1d, 1wk, 1mo, 3mo"),
     period: str = Query(DEFAULT_PERIOD, description="History period such as 6mo or 1y"),
+    start: Optional[int] = Query(None, description="Unix seconds; return bars from here instead of a period"),
+    end: Optional[int] = Query(None, description="Unix seconds; return bars before this time"),
+    format: Literal["rows", "columns"] = Query(
+        "rows", description="'rows' for candle objects, 'columns' for parallel arrays keyed by field"
+    ),
 ):
     requested_interval = interval.lower()
     requested_period = (period or DEFAULT_PERIOD).lower()
 
     if requested_interval not in PANDAS_FREQ:
         raise HTTPException(status_code=400, detail=f"Unsupported interval '{interval}'")
+    if start is not None and end is not None and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
 
     normalized_symbol = normalize_symbol(symbol)
-    cache_key = f"{normalized_symbol}|{requested_interval}|{requested_period}"
+    start_at = pd.Timestamp(start, unit="s", tz="UTC") if start is not None else None
+    end_at = pd.Timestamp(end, unit="s", tz="UTC") if end is not None else None
+    window = requested_period if start is None else f"from {start}"
+    cache_key = f"{normalized_symbol}|{requested_interval}|{window}|{end or ''}|{format}"
+    cached = _cached_ohlc(normalized_symbol, requested_interval, requested_period, start_at, end_at, format, cache_key)
+    if cached is not None:
+        return cached
+    return await inflight.run(
+        f"ohlc|{cache_key}",
+        lambda: _load_ohlc(
+            normalized_symbol, requested_interval, requested_period, start_at, end_at, format, cache_key
+        ),
+    )
+
+
+def _cached_ohlc(
+    symbol: str,
+    interval: str,
+    period: str,
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+    format: str,
+    cache_key: str,
+):
+    """The cached response, or one sliced from cached wider bars; None on a miss."""
     cached = cache.get(cache_key)
     if cached is not None:
         return cached
-
+    stored = bars_cache.get(f"{symbol}|{interval}")
+    if stored is not None:
+        frame = stored.slice(period, start, end)
+        if frame is not None:
+            return _ohlc_payload(frame, format, cache_key)
+    return None
+
+
+async def _load_ohlc(
+    symbol: str,
+    interval: str,
+    period: str,
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+    format: str,
+    cache_key: str,
+):
+    now = pd.Timestamp.now(tz="UTC")
+    fetch_period = period if start is None else period_covering(start, now)
     try:
-        frame = fetch_bars(normalized_symbol, requested_interval, requested_period)
+        frame = await fetch_bars_async(symbol, interval, fetch_period)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except FetchError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
 
-    payload = dataframe_to_candles(frame)
-    if not payload:
-        raise HTTPException(status_code=404, detail="No data available for the request")
+    _remember_bars(symbol, interval, fetch_period, frame, now)
+    if start is not None:
+        frame = frame[frame.index >= start]
+    if end is not None:
+        frame = frame[frame.index < end]
+    payload = await anyio.to_thread.run_sync(_ohlc_columns, frame, format)
+    cache.set(cache_key, payload)
+    return payload
 
+
+def _remember_bars(symbol: str, interval: str, period: str, frame: pd.DataFrame, now: pd.Timestamp) -> None:
+    """Cache the bars fetched for ``period`` unless a window reaching further back is cached."""
+    if frame.empty:
+        return
+    window = BarWindow.for_period(frame, period, now)
+    bars_key = f"{symbol}|{interval}"
+    stored = bars_cache.get(bars_key)
+    if stored is None or window.covered_from <= stored.covered_from:
+        bars_cache.set(bars_key, window)
+
+
+def _ohlc_payload(frame: pd.DataFrame, format: str, cache_key: str):
+    payload = _ohlc_columns(frame, format)
     cache.set(cache_key, payload)
     return payload
 
 
+def _ohlc_columns(frame: pd.DataFrame, format: str):
+    """Response body for ``frame``; pure, so it can run off the event loop."""
+    if format == "columns":
+        payload = dataframe_to_columns(frame)
+        empty = not payload["time"]
+    else:
+        payload = dataframe_to_candles(frame)
+        empty = not payload
+    if empty:
+        raise HTTPException(status_code=404, detail="No data available for the request")
+    return payload
+
+
+@app.post("/api/ohlc/batch")
+async def get_ohlc_batch(payload: OhlcBatchPayload):
+    """Candles for many symbols at one interval and period, streamed as NDJSON.
+
+    Each line is ``{"symbol", "candles"}`` or ``{"symbol", "error", "status"}`` and
+    is sent as soon as that symbol is ready: cached symbols first, then everything
+    one multi-ticker download returned, then per-symbol fallbacks.
+    """
+    interval = payload.interval.lower()
+    period = (payload.period or DEFAULT_PERIOD).lower()
+    if interval not in PANDAS_FREQ:
+        raise HTTPException(status_code=400, detail=f"Unsupported interval '{payload.interval}'")
+    symbols = list(dict.fromkeys(normalize_symbol(symbol) for symbol in payload.symbols if symbol.strip()))
+    return StreamingResponse(
+        _stream_ohlc_batch(symbols, interval, period, payload.format),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _stream_ohlc_batch(symbols: List[str], interval: str, period: str, format: str):
+    def line(symbol: str, candles=None, error: Optional[HTTPException] = None) -> str:
+        if error is not None:
+            return json.dumps({"symbol": symbol, "error": error.detail, "status": error.status_code}) + "\n"
+        return json.dumps({"symbol": symbol, "candles": candles}) + "\n"
+
+    def cache_key(symbol: str) -> str:
+        return f"{symbol}|{interval}|{period}||{format}"
+
+    def encode(symbol: str, frame: pd.DataFrame):
+        candles = _ohlc_columns(frame, format)
+        return candles, line(symbol, candles)
+
+    async def converted(symbol: str, frame: pd.DataFrame) -> str:
+        # Converting and serialising a long history takes long enough to stall other requests
+        try:
+            candles, text = await anyio.to_thread.run_sync(encode, symbol, frame)
+        except HTTPException as exc:
+            return line(symbol, error=exc)
+        cache.set(cache_key(symbol), candles)
+        return text
+
+    pending: List[str] = []
+    for symbol in symbols:
+        cached = cache.get(cache_key(symbol))
+        if cached is not None:
+            yield line(symbol, cached)
+            continue
+        stored = bars_cache.get(f"{symbol}|{interval}")
+        frame = stored.slice(period) if stored is not None else None
+        if frame is not None:
+            yield await converted(symbol, frame)
+        else:
+            pending.append(symbol)
+    if not pending:
+        return
+
+    now = pd.Timestamp.now(tz="UTC")
+    try:
+        frames = await fetch_bars_many_async(pending, interval, period)
+    except Exception:
+        # Lines were already streamed: every pending symbol falls back to its own fetch
+        frames = {}
+    remaining: List[str] = []
+    for symbol in pending:
+        frame = frames.get(symbol)
+        if frame is None:
+            remaining.append(symbol)
+            continue
+        _remember_bars(symbol, interval, period, frame, now)
+        yield await converted(symbol, frame)
+
+    async def load_one(symbol: str) -> str:
+        key = cache_key(symbol)
+        try:
+            candles = await inflight.run(
+                f"ohlc|{key}", lambda: _load_ohlc(symbol, interval, period, None, None, format, key)
+            )
+        except HTTPException as exc:
+            return line(symbol, error=exc)
+        return line(symbol, candles)
+
+    tasks = [asyncio.ensure_future(load_one(symbol)) for symbol in remaining]
+    try:
+        for next_line in asyncio.as_completed(tasks):
+            yield await next_line
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 @app.post("/api/swiss/horizon")
 async def swiss_horizon(payload: SwissHorizonPayload):
     try:
-        data = await anyio.to_thread.run_sync(
+        data = await run_cpu(
             compute_horizon,
             payload.lat,
             payload.lon,
@@ -228,6 +492,99 @@ async def swiss_horizon(payload: SwissHorizonPayload):
     return {"ok": True, **data}
 
 
+# Shorter windows are not worth a worker of their own
+MIN_CHUNKS_PER_WORKER = 3
+
+
+def _split_chunk_keys(chunk_keys: List[str], parts: int) -> List[List[str]]:
+    """Cut sorted chunk keys into at most ``parts`` contiguous groups."""
+    keys = sorted(set(chunk_keys))
+    parts = max(1, min(parts, len(keys) // MIN_CHUNKS_PER_WORKER))
+    size, extra = divmod(len(keys), parts)
+    groups: List[List[str]] = []
+    start = 0
+    for index in range(parts):
+        end = start + size + (1 if index < extra else 0)
+        groups.append(keys[start:end])
+        start = end
+    return groups
+
+
+async def _load_catalogue_chunks(
+    chunk_keys: List[str], ayanamsas: List[str]
+) -> Dict[str, Dict[str, EventCatalogue]]:
+    """Resolve UTC catalogue chunks per ayanamsa from memory, then the database, computing the rest.
+
+    Chunks missing for several systems are computed from one shared ephemeris scan.
+    """
+    sets: Dict[str, Dict[str, EventCatalogue]] = {ayanamsa: {} for ayanamsa in ayanamsas}
+    missing: Dict[str, List[str]] = {}
+    for ayanamsa in ayanamsas:
+        absent = []
+        for key in chunk_keys:
+            cached = catalogue_cache.get(f"catalogue|{ayanamsa}|{key}")
+            if cached is not None:
+                sets[ayanamsa][key] = cached
+            else:
+                absent.append(key)
+
+        if absent:
+            stored = await get_catalogue_chunks(ayanamsa, absent)
+            for key, data in stored.items():
+                sets[ayanamsa][key] = EventCatalogue.from_dict(data)
+                catalogue_cache.set(f"catalogue|{ayanamsa}|{key}", sets[ayanamsa][key])
+            absent = [key for key in absent if key not in stored]
+        if absent:
+            missing[ayanamsa] = absent
+
+    if missing:
+        keys = sorted({key for absent in missing.values() for key in absent})
+        systems = list(missing)
+        computed = await inflight.run(
+            f"catalogue|{'+'.join(systems)}|{'+'.join(keys)}",
+            lambda: _compute_catalogue_chunks(keys, systems),
+        )
+        for ayanamsa, absent in missing.items():
+            for key in absent:
+                sets[ayanamsa][key] = computed[ayanamsa][key]
+
+    return sets
+
+
+async def _compute_catalogue_chunks(
+    keys: List[str], systems: List[str]
+) -> Dict[str, Dict[str, EventCatalogue]]:
+    """Compute catalogue chunks for every system and store them in memory and the database."""
+    # Consecutive chunks are scanned as one contiguous window; long batches are
+    # cut into one window per worker so they scale with the core count
+    parts = await asyncio.gather(
+        *(
+            run_cpu(compute_catalogue_chunk_sets, group, systems)
+            for group in _split_chunk_keys(keys, max(1, worker_count()))
+        )
+    )
+    computed: Dict[str, Dict[str, EventCatalogue]] = {ayanamsa: {} for ayanamsa in systems}
+    for part in parts:
+        for ayanamsa, chunks in part.items():
+            computed[ayanamsa].update(chunks)
+    for ayanamsa, chunks in computed.items():
+        for key, chunk in chunks.items():
+            catalogue_cache.set(f"catalogue|{ayanamsa}|{key}", chunk)
+        await cache_catalogue_chunks(ayanamsa, {key: chunk.to_dict() for key, chunk in chunks.items()})
+    return computed
+
+
+async def _compute_months(
+    tz: str, month_isos: List[str], ayanamsas: List[str]
+) -> Dict[str, Dict[str, Dict[str, object]]]:
+    """Localise months for one timezone from the location-independent catalogue, per ayanamsa."""
+    chunk_sets = await _load_catalogue_chunks(catalogue_chunk_keys(month_isos, tz), ayanamsas)
+    localised = await asyncio.gather(
+        *(run_cpu(localise_months, chunk_sets[ayanamsa], tz, month_isos) for ayanamsa in ayanamsas)
+    )
+    return dict(zip(ayanamsas, localised))
+
+
 @app.post("/api/swiss/monthly")
 async def swiss_monthly(payload: SwissMonthlyPayload):
     # Check cache first (include ayanamsa in key)
@@ -235,16 +592,13 @@ async def swiss_monthly(payload: SwissMonthlyPayload):
     cached = events_cache.get(cache_key)
     if cached is not None:
         return cached
+    return await inflight.run(cache_key, lambda: _load_monthly(payload, cache_key))
+
 
+async def _load_monthly(payload: SwissMonthlyPayload, cache_key: str):
     try:
-        data = await anyio.to_thread.run_sync(
-            compute_monthly,
-            payload.lat,
-            payload.lon,
-            payload.tz,
-            payload.month_start_iso,
-            payload.ayanamsa,  # Pass ayanamsa parameter
-        )
+        systems = await _compute_months(payload.tz, [payload.month_start_iso], [payload.ayanamsa])
+        data = systems[payload.ayanamsa][payload.month_start_iso]
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:  # pragma: no cover
@@ -261,69 +615,65 @@ async def swiss_monthly_batch(payload: SwissMonthlyBatchPayload):
     Batch endpoint to compute multiple months at once.
     Much faster than calling /monthly 60 times for 5 years!
     Returns cached data when available (checks DB first, then memory cache).
+    With ``ayanamsas`` every listed system is computed from the same ephemeris
+    scan and returned under ``systems``; ``months`` stays the ``ayanamsa`` result.
     """
-    results = {}
+    systems = list(dict.fromkeys([payload.ayanamsa, *(payload.ayanamsas or [])]))
+    results: Dict[str, Dict[str, object]] = {ayanamsa: {} for ayanamsa in systems}
 
     # Check which months are already cached (DB first, then memory)
-    uncached_months = []
-    for month_iso in payload.month_start_isos:
-        # Try database first (permanent cache) - include ayanamsa
-        db_cached = await get_cached_month(payload.lat, payload.lon, payload.tz, month_iso, payload.ayanamsa)
-        if db_cached is not None:
-            results[month_iso] = {"ok": True, **db_cached}
-            continue
-
-        # Try memory cache (faster but temporary) - include ayanamsa in key
-        cache_key = f"monthly|{payload.lat}|{payload.lon}|{payload.tz}|{month_iso}|{payload.ayanamsa}"
-        cached = events_cache.get(cache_key)
-        if cached is not None:
-            results[month_iso] = cached
-        else:
-            uncached_months.append(month_iso)
-
-    # Compute uncached months in parallel
-    if uncached_months:
-        async def compute_one_month(month_iso: str):
-            try:
-                data = await anyio.to_thread.run_sync(
-                    compute_monthly,
-                    payload.lat,
-                    payload.lon,
-                    payload.tz,
-                    month_iso,
-                    payload.ayanamsa,  # Pass ayanamsa parameter
-                )
+    uncached: Dict[str, List[str]] = {}
+    for ayanamsa in systems:
+        # Try database first (permanent cache), one query for the whole batch - include ayanamsa
+        db_months = await get_cached_months(
+            payload.lat, payload.lon, payload.tz, payload.month_start_isos, ayanamsa
+        )
+        for month_iso in payload.month_start_isos:
+            db_cached = db_months.get(month_iso)
+            if db_cached is not None:
+                results[ayanamsa][month_iso] = {"ok": True, **db_cached}
+                continue
+
+            # Try memory cache (faster but temporary) - include ayanamsa in key
+            cache_key = f"monthly|{payload.lat}|{payload.lon}|{payload.tz}|{month_iso}|{ayanamsa}"
+            cached = events_cache.get(cache_key)
+            if cached is not None:
+                results[ayanamsa][month_iso] = cached
+            else:
+                uncached.setdefault(ayanamsa, []).append(month_iso)
+
+    # Localise uncached months from the shared UTC catalogue (computed once for all locations)
+    if uncached:
+        month_isos = [
+            month_iso
+            for month_iso in payload.month_start_isos
+            if any(month_iso in pending for pending in uncached.values())
+        ]
+        try:
+            computed = await _compute_months(payload.tz, month_isos, list(uncached))
+        except Exception as exc:
+            # Return error for the months of this batch that had to be computed
+            for ayanamsa, pending in uncached.items():
+                for month_iso in pending:
+                    results[ayanamsa][month_iso] = {"ok": False, "error": str(exc)}
+            computed = {}
+
+        for ayanamsa, months in computed.items():
+            for month_iso in uncached[ayanamsa]:
+                data = months[month_iso]
                 result = {"ok": True, **data}
 
                 # Store in both memory cache and database - include ayanamsa
-                cache_key = f"monthly|{payload.lat}|{payload.lon}|{payload.tz}|{month_iso}|{payload.ayanamsa}"
+                cache_key = f"monthly|{payload.lat}|{payload.lon}|{payload.tz}|{month_iso}|{ayanamsa}"
                 events_cache.set(cache_key, result)
-                await cache_month(payload.lat, payload.lon, payload.tz, month_iso, data, payload.ayanamsa)
-
-                return month_iso, result
-            except Exception as exc:
-                # Return error for this specific month
-                return month_iso, {"ok": False, "error": str(exc)}
-
-        # Compute all uncached months with limited concurrency to prevent memory spikes
-        import asyncio
-        from asyncio import Semaphore
-
-        # Limit to 6 concurrent computations - balances speed with memory usage
-        # Railway Hobby: 512MB RAM, each computation ~50-80MB
-        semaphore = Semaphore(6)
+                await cache_month(payload.lat, payload.lon, payload.tz, month_iso, data, ayanamsa)
 
-        async def compute_with_limit(month_iso: str):
-            async with semaphore:
-                return await compute_one_month(month_iso)
+                results[ayanamsa][month_iso] = result
 
-        tasks = [compute_with_limit(month_iso) for month_iso in uncached_months]
-        computed_results = await asyncio.gather(*tasks)
-
-        for month_iso, result in computed_results:
-            results[month_iso] = result
-
-    return {"ok": True, "months": results}
+    response: Dict[str, object] = {"ok": True, "months": results[payload.ayanamsa]}
+    if payload.ayanamsas:
+        response["systems"] = results
+    return response
 
 
 @app.post("/api/orbit/overlay")
@@ -338,14 +688,57 @@ async def orbital_overlay(payload: OrbitalOverlayPayload):
     cached = events_cache.get(cache_key)
     if cached is not None:
         return cached
+    return await inflight.run(cache_key, lambda: _load_overlay(payload, cache_key))
 
+
+async def _load_overlay(payload: OrbitalOverlayPayload, cache_key: str):
+    """Assemble the overlay from per-object tiles, computing only the missing ones.
+
+    Tiles hold every metric unweighted, so changing flags or weights or panning,
+    widening or zooming the window only computes tiles not seen before.
+    """
+    objects = list(dict.fromkeys(obj.strip().lower() for obj in payload.objects if obj.strip()))
     try:
-        worker = partial(
-            compute_overlay_series,
-            objects=payload.objects,
-            start_iso=payload.start_iso,
-            duration_unit=payload.duration_unit,
-            duration_value=payload.duration_value,
+        if not objects:
+            raise ValueError("At least one object is required")
+        start, end = overlay_window(payload.start_iso, payload.duration_unit, payload.duration_value)
+        step = timedelta(days=1)
+        prefix = f"orbit|{grid_key(start, step)}"
+
+        parts: Dict[str, Dict[TileSpan, ObjectTile]] = {obj: {} for obj in objects}
+
+        def cached(obj: str, span: TileSpan) -> bool:
+            tile = tile_cache.get(f"{prefix}|{obj}|{span.key}")
+            if tile is not None:
+                parts[obj][span] = tile
+            return tile is not None
+
+        spans = {obj: cover_spans(start, end, step, partial(cached, obj)) for obj in objects}
+        missing: Dict[TileSpan, List[str]] = {}
+        for obj in objects:
+            for span in spans[obj]:
+                if span not in parts[obj]:
+                    missing.setdefault(span, []).append(obj)
+        computed = await asyncio.gather(
+            *(
+                run_cpu(compute_object_tiles, objects=span_objects, first=span.first, count=span.count)
+                for span, span_objects in missing.items()
+            )
+        )
+        for span, tiles in zip(missing, computed):
+            for obj, tile in tiles.items():
+                tile_cache.set(f"{prefix}|{obj}|{span.key}", tile)
+                parts[obj][span] = tile
+
+        window = {
+            obj: ObjectTile.join(
+                [parts[obj][span].slice(window_slice(span, start, end, step)) for span in spans[obj]]
+            )
+            for obj in objects
+        }
+        series = overlay_series(
+            window,
+            objects=objects,
             plot_speed=payload.plot_speed,
             plot_grav_force=payload.plot_grav_force,
             plot_geo_declination=payload.plot_geo_declination,
@@ -354,13 +747,20 @@ async def orbital_overlay(payload: OrbitalOverlayPayload):
             plot_weighted_helio=payload.plot_weighted_helio,
             weights=payload.weights,
         )
-        series = await anyio.to_thread.run_sync(worker)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Orbital overlay failed: {exc}") from exc
 
-    response = {
+    response = _overlay_response(series)
+
+    # Cache the response
+    events_cache.set(cache_key, response)
+    return response
+
+
+def _overlay_response(series: List[OverlaySeries]):
+    return {
         "series": [
             {
                 "name": item.name,
@@ -373,15 +773,11 @@ async def orbital_overlay(payload: OrbitalOverlayPayload):
         ]
     }
 
-    # Cache the response
-    events_cache.set(cache_key, response)
-    return response
-
 
 @app.post("/api/planetary/timeseries")
 async def planetary_timeseries(payload: PlanetaryTimeseriesPayload):
     try:
-        data = await anyio.to_thread.run_sync(
+        data = await run_cpu(
             compute_planetary_timeseries,
             payload.planet,
             payload.timestamps,
@@ -404,19 +800,40 @@ class AdvancedOverlayPayload(BaseModel):
     interval_hours: int = Field(alias="intervalHours", default=24, ge=1, le=720)
 
 
+def _advanced_window(payload: AdvancedOverlayPayload) -> tuple[datetime, datetime]:
+    start_dt = datetime.fromisoformat(payload.start_iso)
+
+    if payload.duration_unit == "days":
+        end_dt = start_dt + timedelta(days=payload.duration_value)
+    elif payload.duration_unit == "months":
+        end_dt = start_dt + timedelta(days=payload.duration_value * 30)
+    else:  # years
+        end_dt = start_dt + timedelta(days=payload.duration_value * 365)
+    return start_dt, end_dt
+
+
+async def _tiled_overlay_rows(name: str, calculate, payload: AdvancedOverlayPayload) -> List[Dict]:
+    """Rows of ``calculate`` for the payload window, assembled from cached tiles.
+
+    Every row depends on its own timestamp only, so tiles of the same grid are
+    reused by any window that overlaps them.
+    """
+    start_dt, end_dt = _advanced_window(payload)
+    step = timedelta(hours=payload.interval_hours)
+
+    async def compute(span: TileSpan) -> List[Dict]:
+        last = span.first + (span.count - 1) * step
+        return await run_cpu(calculate, span.first, last, payload.interval_hours)
+
+    tiles = await load_tiles(tile_cache, f"{name}|{grid_key(start_dt, step)}", start_dt, end_dt, step, compute)
+    return [row for span, tile in tiles for row in tile[window_slice(span, start_dt, end_dt, step)]]
+
+
 @app.post("/api/overlay/sunspot")
 async def sunspot_overlay(payload: AdvancedOverlayPayload):
     """Get sunspot cycle overlay data."""
     try:
-        start_dt = datetime.fromisoformat(payload.start_iso)
-
-        if payload.duration_unit == "days":
-            end_dt = start_dt + timedelta(days=payload.duration_value)
-        elif payload.duration_unit == "months":
-            end_dt = start_dt + timedelta(days=payload.duration_value * 30)
-        else:  # years
-            end_dt = start_dt + timedelta(days=payload.duration_value * 365)
-
+        start_dt, end_dt = _advanced_window(payload)
         data = await calculate_sunspot_overlay(start_dt, end_dt, payload.interval_hours)
 
         return {
@@ -443,18 +860,7 @@ async def sunspot_overlay(payload: AdvancedOverlayPayload):
 async def tidal_overlay(payload: AdvancedOverlayPayload):
     """Get tidal forces overlay data."""
     try:
-        start_dt = datetime.fromisoformat(payload.start_iso)
-
-        if payload.duration_unit == "days":
-            end_dt = start_dt + timedelta(days=payload.duration_value)
-        elif payload.duration_unit == "months":
-            end_dt = start_dt + timedelta(days=payload.duration_value * 30)
-        else:  # years
-            end_dt = start_dt + timedelta(days=payload.duration_value * 365)
-
-        data = await anyio.to_thread.run_sync(
-            calculate_tidal_overlay, start_dt, end_dt, payload.interval_hours
-        )
+        data = await _tiled_overlay_rows("tidal", calculate_tidal_overlay, payload)
 
         return {
             "ok": True,
@@ -486,18 +892,7 @@ async def tidal_overlay(payload: AdvancedOverlayPayload):
 async def barycenter_overlay(payload: AdvancedOverlayPayload):
     """Get solar system barycenter wobble overlay."""
     try:
-        start_dt = datetime.fromisoformat(payload.start_iso)
-
-        if payload.duration_unit == "days":
-            end_dt = start_dt + timedelta(days=payload.duration_value)
-        elif payload.duration_unit == "months":
-            end_dt = start_dt + timedelta(days=payload.duration_value * 30)
-        else:  # years
-            end_dt = start_dt + timedelta(days=payload.duration_value * 365)
-
-        data = await anyio.to_thread.run_sync(
-            calculate_barycenter_overlay, start_dt, end_dt, payload.interval_hours
-        )
+        data = await _tiled_overlay_rows("barycenter", calculate_barycenter_overlay, payload)
 
         return {
             "ok": True,
@@ -517,18 +912,7 @@ async def barycenter_overlay(payload: AdvancedOverlayPayload):
 async def gravitational_overlay(payload: AdvancedOverlayPayload):
     """Get net gravitational force overlay."""
     try:
-        start_dt = datetime.fromisoformat(payload.start_iso)
-
-        if payload.duration_unit == "days":
-            end_dt = start_dt + timedelta(days=payload.duration_value)
-        elif payload.duration_unit == "months":
-            end_dt = start_dt + timedelta(days=payload.duration_value * 30)
-        else:  # years
-            end_dt = start_dt + timedelta(days=payload.duration_value * 365)
-
-        data = await anyio.to_thread.run_sync(
-            calculate_gravitational_overlay, start_dt, end_dt, payload.interval_hours
-        )
+        data = await _tiled_overlay_rows("gravitational", calculate_gravitational_overlay, payload)
 
         return {
             "ok": True,
@@ -548,18 +932,7 @@ async def gravitational_overlay(payload: AdvancedOverlayPayload):
 async def bradley_overlay(payload: AdvancedOverlayPayload):
     """Get Bradley Siderograph overlay."""
     try:
-        start_dt = datetime.fromisoformat(payload.start_iso)
-
-        if payload.duration_unit == "days":
-            end_dt = start_dt + timedelta(days=payload.duration_value)
-        elif payload.duration_unit == "months":
-            end_dt = start_dt + timedelta(days=payload.duration_value * 30)
-        else:  # years
-            end_dt = start_dt + timedelta(days=payload.duration_value * 365)
-
-        data = await anyio.to_thread.run_sync(
-            calculate_bradley_siderograph, start_dt, end_dt, payload.interval_hours
-        )
+        data = await _tiled_overlay_rows("bradley", calculate_bradley_siderograph, payload)
 
         return {
             "ok": True,
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Iterable, List, Sequence
+from datetime import datetime, timedelta
+from typing import List, Sequence
 
 import numpy as np
 import certifi  # type: ignore
+from astropy import units as u
 from astropy.constants import G, M_earth, M_sun
 from astropy.coordinates import (
-    GCRS,
-    ICRS,
-    SkyCoord,
     get_body,
     get_sun,
     solar_system_ephemeris,
@@ -19,6 +19,8 @@ from astropy.coordinates import (
 from astropy.coordinates.solar_system import get_body_barycentric
 from astropy.time import Time
 
+from .spk import SpkKernel, declination_degrees, distances_km, load_kernel
+
 CERT_PATH = certifi.where()
 if CERT_PATH:
     os.environ.setdefault("SSL_CERT_FILE", CERT_PATH)
@@ -44,8 +46,8 @@ def _ephem_ctx():
     return solar_system_ephemeris.set("builtin")
 
 
-def _rescale_to_bounds(values: Iterable[float], lo: float, hi: float) -> np.ndarray:
-    arr = np.asarray(list(values), dtype=float)
+def _rescale_to_bounds(values: Sequence[float] | np.ndarray, lo: float, hi: float) -> np.ndarray:
+    arr = np.asarray(values, dtype=float)
     with np.errstate(invalid="ignore"):
         vmin = np.nanmin(arr)
         vmax = np.nanmax(arr)
@@ -61,15 +63,16 @@ def _get_moon(time: Time):
         return get_body("moon", time)
 
 
-def _orbital_speed(distance_m: float, mu_sun: float) -> float:
-    return float(np.sqrt(mu_sun / distance_m))
+def _orbital_speed(distance_m: np.ndarray, mu_sun: float) -> np.ndarray:
+    return np.sqrt(mu_sun / distance_m)
 
 
-def _gravitational_force(m1: float, m2: float, distance_m: float) -> float:
+def _gravitational_force(m1: float, m2: float, distance_m: np.ndarray) -> np.ndarray:
     return (G.value * m1 * m2) / (distance_m ** 2)
 
 
 def _body_position(name: str, time: Time):
+    """Geocentric (GCRS) position of ``name``; ``time`` may be array-valued."""
     if name == "sun":
         return get_sun(time)
     if name == "moon":
@@ -78,30 +81,100 @@ def _body_position(name: str, time: Time):
         return get_body(name, time)
 
 
-def _declination_geocentric(name: str, time: Time) -> float:
-    if name == "sun":
-        pos = get_sun(time)
-    elif name == "moon":
-        pos = _get_moon(time)
-    else:
+def _sun_barycentric(time: Time):
+    with _ephem_ctx():
+        return get_body_barycentric("sun", time)
+
+
+class _AstropyEphemeris:
+    """Position matrices through astropy, used when no JPL kernel is available."""
+
+    name = "astropy"
+
+    def __init__(self, times: Time) -> None:
+        self.times = times
+        self._sun_vec = None
+
+    def geocentric(self, obj: str) -> np.ndarray:
+        """(3, n) km apparent GCRS position."""
+        return _body_position(obj, self.times).cartesian.xyz.to_value(u.km)
+
+    def heliocentric(self, obj: str) -> np.ndarray:
+        """(3, n) km ICRS position relative to the Sun."""
+        if self._sun_vec is None:
+            self._sun_vec = _sun_barycentric(self.times)
         with _ephem_ctx():
-            pos = get_body(name, time)
-    coord = SkyCoord(pos)
-    return coord.transform_to(GCRS(obstime=time)).dec.degree
+            body_vec = get_body_barycentric(obj, self.times)
+        return (body_vec - self._sun_vec).xyz.to_value(u.km)
 
 
-def _declination_heliocentric(name: str, time: Time) -> float:
-    with _ephem_ctx():
-        body_vec = get_body_barycentric(name, time)
-        sun_vec = get_body_barycentric("sun", time)
-    rel = body_vec - sun_vec
-    icrs = ICRS(
-        x=rel.x,
-        y=rel.y,
-        z=rel.z,
-        representation_type="cartesian",
-    )
-    return icrs.spherical.lat.degree
+class _KernelEphemeris:
+    """Position matrices evaluated straight from the memory-mapped SPK kernel.
+
+    Geocentric positions are astrometric (light-time corrected, no aberration),
+    which shifts declinations by at most ~0.006° against astropy's apparent GCRS.
+    """
+
+    def __init__(self, kernel: SpkKernel, times: Time) -> None:
+        self.kernel = kernel
+        self.name = kernel.path
+        tdb = times.tdb
+        self._jd = (tdb.jd1, tdb.jd2)
+        self._earth = None
+        self._sun = None
+
+    def geocentric(self, obj: str) -> np.ndarray:
+        if self._earth is None:
+            self._earth = self.kernel.barycentric("earth", *self._jd)
+        return self.kernel.geocentric(obj, *self._jd, earth=self._earth)
+
+    def heliocentric(self, obj: str) -> np.ndarray:
+        if self._sun is None:
+            self._sun = self.kernel.barycentric("sun", *self._jd)
+        return self.kernel.barycentric(obj, *self._jd) - self._sun
+
+
+# Position matrices of recent requests, keyed by ephemeris, kind, object and time grid
+POSITION_CACHE_ENTRIES = 128
+_position_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_position_cache_lock = threading.Lock()
+
+
+class _Positions:
+    """Every series of one request reads its body positions from here.
+
+    Each (object, kind) matrix is computed once over the whole time grid and kept
+    in a small process-wide LRU, so overlapping requests reuse it too.
+    """
+
+    def __init__(self, times: Time, grid_key: tuple) -> None:
+        kernel = load_kernel(EPHEMERIS_PATH)
+        self._ephemeris = _KernelEphemeris(kernel, times) if kernel is not None else _AstropyEphemeris(times)
+        self._grid_key = grid_key
+
+    def _matrix(self, kind: str, obj: str) -> np.ndarray:
+        key = (self._ephemeris.name, kind, obj, self._grid_key)
+        with _position_cache_lock:
+            cached = _position_cache.get(key)
+            if cached is not None:
+                _position_cache.move_to_end(key)
+                return cached
+        matrix = getattr(self._ephemeris, kind)(obj)
+        matrix.setflags(write=False)
+        with _position_cache_lock:
+            _position_cache[key] = matrix
+            while len(_position_cache) > POSITION_CACHE_ENTRIES:
+                _position_cache.popitem(last=False)
+        return matrix
+
+    def distance_m(self, obj: str) -> np.ndarray:
+        return distances_km(self._matrix("geocentric", obj)) * 1000.0
+
+    def geo_dec(self, obj: str) -> np.ndarray:
+        return declination_degrees(self._matrix("geocentric", obj))
+
+    def helio_dec(self, obj: str) -> np.ndarray:
+        return declination_degrees(self._matrix("heliocentric", obj))
 
 
 MASS_LOOKUP = {
@@ -125,27 +198,17 @@ def _unit_days(unit: str) -> int:
     return mapping[unit]
 
 
-def compute_overlay_series(
-    *,
-    objects: Sequence[str],
-    start_iso: str,
-    duration_unit: str,
-    duration_value: int,
-    plot_speed: bool,
-    plot_grav_force: bool,
-    plot_geo_declination: bool,
-    plot_helio_declination: bool,
-    plot_weighted_geo: bool,
-    plot_weighted_helio: bool,
-    weights: dict[str, float] | None = None,
-) -> List[OverlaySeries]:
-    if duration_value <= 0:
-        raise ValueError("duration_value must be positive")
+def _normalise_objects(objects: Sequence[str]) -> List[str]:
     normalized = [obj.strip().lower() for obj in objects if obj.strip()]
     if not normalized:
         raise ValueError("At least one object is required")
+    return normalized
+
 
-    # Build observation window at one-day cadence
+def _observation_grid(start_iso: str, duration_unit: str, duration_value: int) -> tuple[Time, List[datetime], tuple]:
+    """One-day cadence times, their datetimes, and a key identifying the grid."""
+    if duration_value <= 0:
+        raise ValueError("duration_value must be positive")
     base_time = Time(start_iso)
     total_days = _unit_days(duration_unit) * duration_value
     if total_days <= 0:
@@ -158,106 +221,184 @@ def compute_overlay_series(
     timestamps = list(obs_times.datetime)
     if not timestamps:
         raise ValueError("No timestamps generated for overlay request")
+    return obs_times, timestamps, (base_time.jd1, base_time.jd2, total_days)
+
 
+def overlay_window(start_iso: str, duration_unit: str, duration_value: int) -> tuple[datetime, datetime]:
+    """First and last point (UTC) of the daily grid an overlay request covers."""
+    if duration_value <= 0:
+        raise ValueError("duration_value must be positive")
+    total_days = _unit_days(duration_unit) * duration_value
+    start = Time(start_iso).to_datetime()
+    return start, start + timedelta(days=total_days)
+
+
+def _finite_series(
+    name: str, key: str, values: Sequence[float] | np.ndarray, objects: Sequence[str], timestamps: List[datetime]
+) -> OverlaySeries | None:
+    array = np.asarray(values, dtype=float)
+    mask = np.isfinite(array)
+    if not mask.any():
+        return None
+    return OverlaySeries(
+        name=name,
+        key=key,
+        objects=list(objects),
+        timestamps=[timestamps[idx] for idx in np.flatnonzero(mask)],
+        values=array[mask].tolist(),
+    )
+
+
+@dataclass(slots=True)
+class ObjectTile:
+    """Every overlay metric of one object over a stretch of the daily grid (NaN where undefined)."""
+
+    timestamps: List[datetime]
+    speed: np.ndarray
+    force: np.ndarray
+    geo_dec: np.ndarray
+    helio_dec: np.ndarray
+
+    def slice(self, positions: slice) -> "ObjectTile":
+        return ObjectTile(
+            self.timestamps[positions],
+            self.speed[positions],
+            self.force[positions],
+            self.geo_dec[positions],
+            self.helio_dec[positions],
+        )
+
+    @classmethod
+    def join(cls, parts: Sequence["ObjectTile"]) -> "ObjectTile":
+        return cls(
+            [ts for part in parts for ts in part.timestamps],
+            np.concatenate([part.speed for part in parts]),
+            np.concatenate([part.force for part in parts]),
+            np.concatenate([part.geo_dec for part in parts]),
+            np.concatenate([part.helio_dec for part in parts]),
+        )
+
+
+def _object_tiles(
+    objects: Sequence[str], obs_times: Time, timestamps: List[datetime], grid_key: tuple
+) -> dict[str, ObjectTile]:
+    # Each ephemeris query covers the whole time grid at once, and is shared by every metric using it
+    positions = _Positions(obs_times, grid_key)
     mu_sun = G.value * M_sun.value
-    series: List[OverlaySeries] = []
-    weights = {k.lower(): float(v) for k, v in (weights or {}).items()}
-
-    def add_series(name: str, key: str, values: Sequence[float], series_objects: Sequence[str]):
-        array = np.asarray(list(values), dtype=float)
-        mask = np.isfinite(array)
-        if not mask.any():
-            return
-        filtered_ts = [timestamps[idx] for idx, ok in enumerate(mask) if ok]
-        filtered_vals = array[mask].tolist()
-        if not filtered_ts:
-            return
-        series.append(
-            OverlaySeries(
-                name=name,
-                key=key,
-                objects=list(series_objects),
-                timestamps=filtered_ts,
-                values=filtered_vals,
-            ),
+    tiles = {}
+    for obj in objects:
+        distance = positions.distance_m(obj)
+        if obj in MASS_LOOKUP:
+            force = _gravitational_force(MASS_LOOKUP[obj], M_sun.value, distance)
+        else:
+            force = np.full(len(timestamps), np.nan)
+        tiles[obj] = ObjectTile(
+            timestamps=timestamps,
+            speed=_orbital_speed(distance, mu_sun),
+            force=force,
+            geo_dec=positions.geo_dec(obj),
+            helio_dec=positions.helio_dec(obj),
         )
+    return tiles
+
+
+def compute_object_tiles(*, objects: Sequence[str], first: datetime, count: int) -> dict[str, ObjectTile]:
+    """Metrics of every object at ``count`` daily points from ``first`` (UTC)."""
+    normalized = _normalise_objects(objects)
+    base_time = Time(first, scale="utc")
+    obs_times = Time(base_time.jd + np.arange(count, dtype=float), format="jd")
+    timestamps = [first + timedelta(days=day) for day in range(count)]
+    return _object_tiles(normalized, obs_times, timestamps, (base_time.jd1, base_time.jd2, count - 1))
+
+
+def overlay_series(
+    tiles: dict[str, ObjectTile],
+    *,
+    objects: Sequence[str],
+    plot_speed: bool,
+    plot_grav_force: bool,
+    plot_geo_declination: bool,
+    plot_helio_declination: bool,
+    plot_weighted_geo: bool,
+    plot_weighted_helio: bool,
+    weights: dict[str, float] | None = None,
+) -> List[OverlaySeries]:
+    """The requested series from per-object tiles that share one set of timestamps.
+
+    Weighted composites are a weighted sum per time rescaled to ±23.44°, so changing
+    only the weights needs no ephemeris work.
+    """
+    normalized = _normalise_objects(objects)
+    series: List[OverlaySeries] = []
+
+    def add_series(name: str, key: str, values: Sequence[float] | np.ndarray, series_objects: Sequence[str]):
+        item = _finite_series(name, key, values, series_objects, tiles[normalized[0]].timestamps)
+        if item is not None:
+            series.append(item)
 
     if plot_weighted_geo or plot_weighted_helio:
-        if plot_weighted_geo:
-            raw = []
-            for time in obs_times:
-                total = 0.0
-                for obj in normalized:
-                    total += weights.get(obj, 0.0) * _declination_geocentric(obj, time)
-                raw.append(total)
-            add_series(
-                "Weighted Geo-Dec (±23.44°)",
-                "weighted_geo_declination",
-                _rescale_to_bounds(raw, -23.44, 23.44),
-                normalized,
-            )
-
-        if plot_weighted_helio:
-            raw = []
-            for time in obs_times:
-                total = 0.0
-                for obj in normalized:
-                    total += weights.get(obj, 0.0) * _declination_heliocentric(obj, time)
-                raw.append(total)
-            add_series(
-                "Weighted Helio-Dec (±23.44°)",
-                "weighted_helio_declination",
-                _rescale_to_bounds(raw, -23.44, 23.44),
-                normalized,
-            )
+        weights = {k.lower(): float(v) for k, v in (weights or {}).items()}
+        for enabled, metric, name, key in (
+            (plot_weighted_geo, "geo_dec", "Weighted Geo-Dec (±23.44°)", "weighted_geo_declination"),
+            (plot_weighted_helio, "helio_dec", "Weighted Helio-Dec (±23.44°)", "weighted_helio_declination"),
+        ):
+            if not enabled:
+                continue
+            raw = np.zeros(len(tiles[normalized[0]].timestamps))
+            for obj in normalized:
+                raw += weights.get(obj, 0.0) * getattr(tiles[obj], metric)
+            add_series(name, key, _rescale_to_bounds(raw, -23.44, 23.44), normalized)
         return series
 
     if plot_speed:
         for obj in normalized:
-            vals = []
-            for time in obs_times:
-                dist = _body_position(obj, time).distance.to("m").value
-                vals.append(_orbital_speed(dist, mu_sun))
-            add_series(
-                f"{obj.capitalize()} Speed (m/s)",
-                f"{obj}_speed",
-                vals,
-                [obj],
-            )
+            add_series(f"{obj.capitalize()} Speed (m/s)", f"{obj}_speed", tiles[obj].speed, [obj])
 
     if plot_grav_force:
         for obj in normalized:
             if obj not in MASS_LOOKUP:
                 raise ValueError(f"Unknown mass for object '{obj}'")
-            vals = []
-            for time in obs_times:
-                dist = _body_position(obj, time).distance.to("m").value
-                vals.append(_gravitational_force(MASS_LOOKUP[obj], M_sun.value, dist))
-            add_series(
-                f"{obj.capitalize()} Force (N)",
-                f"{obj}_force",
-                vals,
-                [obj],
-            )
+            add_series(f"{obj.capitalize()} Force (N)", f"{obj}_force", tiles[obj].force, [obj])
 
     if plot_geo_declination:
         for obj in normalized:
-            vals = [_declination_geocentric(obj, time) for time in obs_times]
-            add_series(
-                f"{obj.capitalize()} Geo-Dec (°)",
-                f"{obj}_geo_dec",
-                vals,
-                [obj],
-            )
+            add_series(f"{obj.capitalize()} Geo-Dec (°)", f"{obj}_geo_dec", tiles[obj].geo_dec, [obj])
 
     if plot_helio_declination:
         for obj in normalized:
-            vals = [_declination_heliocentric(obj, time) for time in obs_times]
-            add_series(
-                f"{obj.capitalize()} Helio-Dec (°)",
-                f"{obj}_helio_dec",
-                vals,
-                [obj],
-            )
+            add_series(f"{obj.capitalize()} Helio-Dec (°)", f"{obj}_helio_dec", tiles[obj].helio_dec, [obj])
 
     return series
+
+
+def compute_overlay_series(
+    *,
+    objects: Sequence[str],
+    start_iso: str,
+    duration_unit: str,
+    duration_value: int,
+    plot_speed: bool,
+    plot_grav_force: bool,
+    plot_geo_declination: bool,
+    plot_helio_declination: bool,
+    plot_weighted_geo: bool,
+    plot_weighted_helio: bool,
+    weights: dict[str, float] | None = None,
+) -> List[OverlaySeries]:
+    normalized = _normalise_objects(objects)
+    if plot_grav_force and not (plot_weighted_geo or plot_weighted_helio):
+        for obj in normalized:
+            if obj not in MASS_LOOKUP:
+                raise ValueError(f"Unknown mass for object '{obj}'")
+    obs_times, timestamps, grid_key = _observation_grid(start_iso, duration_unit, duration_value)
+    return overlay_series(
+        _object_tiles(normalized, obs_times, timestamps, grid_key),
+        objects=normalized,
+        plot_speed=plot_speed,
+        plot_grav_force=plot_grav_force,
+        plot_geo_declination=plot_geo_declination,
+        plot_helio_declination=plot_helio_declination,
+        plot_weighted_geo=plot_weighted_geo,
+        plot_weighted_helio=plot_weighted_helio,
+        weights=weights,
+    )
@@ -0,0 +1,188 @@
+"""Memory-mapped reader for JPL SPK kernels such as ``de421.bsp``.
+
+Only what the orbital overlays need is supported: DAF summaries and type 2
+(Chebyshev position) segments. The kernel is mapped once per process with
+``np.memmap``, so just the pages covering the requested dates are read, and
+positions are evaluated for whole NumPy arrays of times at once. Vectors are
+kilometres in the ICRF; times are TDB Julian dates split in two parts like
+``Time.jd1``/``Time.jd2``.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+J2000 = 2451545.0
+SECONDS_PER_DAY = 86400.0
+C_KM_S = 299792.458
+
+_RECORD_BYTES = 1024
+_CHEBYSHEV_POSITION = 2
+
+# Segment chains from the solar-system barycentre (0), as astropy resolves body names
+BODY_CHAINS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    "sun": ((0, 10),),
+    "mercury": ((0, 1), (1, 199)),
+    "venus": ((0, 2), (2, 299)),
+    "earth-moon-barycenter": ((0, 3),),
+    "earth": ((0, 3), (3, 399)),
+    "moon": ((0, 3), (3, 301)),
+    "mars": ((0, 4),),
+    "jupiter": ((0, 5),),
+    "saturn": ((0, 6),),
+    "uranus": ((0, 7),),
+    "neptune": ((0, 8),),
+    "pluto": ((0, 9),),
+}
+
+
+@dataclass(frozen=True)
+class _Segment:
+    start: float  # seconds past J2000 TDB
+    end: float
+    init: float
+    interval: float
+    records: np.ndarray  # (count, rsize) view into the mapped file
+
+    def position(self, seconds: np.ndarray) -> np.ndarray:
+        """(3, n) position for ``seconds`` past J2000, all inside the segment."""
+        index = np.floor((seconds - self.init) / self.interval).astype(np.int64)
+        np.clip(index, 0, len(self.records) - 1, out=index)
+        records = np.asarray(self.records[index])
+        coefficients = (records.shape[1] - 2) // 3
+        s = (seconds - records[:, 0]) / records[:, 1]
+        # Clenshaw recurrence for all three axes and every time at once
+        c = records[:, 2:].reshape(len(seconds), 3, coefficients)
+        b1 = np.zeros((len(seconds), 3))
+        b2 = np.zeros((len(seconds), 3))
+        two_s = (2.0 * s)[:, None]
+        for k in range(coefficients - 1, 0, -1):
+            b1, b2 = two_s * b1 - b2 + c[:, :, k], b1
+        return (s[:, None] * b1 - b2 + c[:, :, 0]).T
+
+
+class SpkKernel:
+    """Type 2 segments of one SPK file, keyed by (center, target)."""
+
+    def __init__(self, path: os.PathLike | str) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as handle:
+            header = handle.read(_RECORD_BYTES)
+        if header[:7] != b"DAF/SPK":
+            raise ValueError(f"{self.path} is not an SPK kernel")
+        fmt = header[88:96]
+        if fmt == b"LTL-IEEE":
+            order = "<"
+        elif fmt == b"BIG-IEEE":
+            order = ">"
+        else:
+            raise ValueError(f"Unsupported DAF number format {fmt!r}")
+        nd, ni = (int(value) for value in np.frombuffer(header, dtype=f"{order}i4", count=2, offset=8))
+        forward = int(np.frombuffer(header, dtype=f"{order}i4", count=1, offset=76)[0])
+        if (nd, ni) != (2, 6):
+            raise ValueError("SPK summaries must hold 2 doubles and 6 integers")
+
+        self._words = np.memmap(self.path, dtype=f"{order}f8", mode="r")
+        self._segments: Dict[Tuple[int, int], List[_Segment]] = {}
+        summary_words = nd + (ni + 1) // 2
+        record = forward
+        while record:
+            base = (record - 1) * _RECORD_BYTES // 8
+            control = self._words[base : base + 3]
+            next_record, count = int(control[0]), int(control[2])
+            for slot in range(count):
+                offset = base + 3 + slot * summary_words
+                start, end = (float(value) for value in self._words[offset : offset + 2])
+                ints = np.asarray(self._words[offset + 2 : offset + summary_words]).view(f"{order}i4")
+                target, center, _frame, data_type, first, last = (int(value) for value in ints[:6])
+                if data_type == _CHEBYSHEV_POSITION:
+                    self._add_segment(center, target, start, end, first, last)
+            record = next_record
+
+    def _add_segment(self, center: int, target: int, start: float, end: float, first: int, last: int) -> None:
+        init, interval, rsize, count = (float(value) for value in self._words[last - 4 : last])
+        rsize, count = int(rsize), int(count)
+        records = self._words[first - 1 : first - 1 + rsize * count].reshape(count, rsize)
+        self._segments.setdefault((center, target), []).append(_Segment(start, end, init, interval, records))
+
+    def segment_position(self, center: int, target: int, jd1: np.ndarray, jd2: np.ndarray) -> np.ndarray:
+        """(3, n) km position of ``target`` relative to ``center`` at TDB Julian dates ``jd1 + jd2``."""
+        segments = self._segments.get((center, target))
+        if not segments:
+            raise KeyError(f"No segment for target {target} relative to {center} in {self.path}")
+        seconds = np.atleast_1d((np.asarray(jd1, dtype=float) - J2000) * SECONDS_PER_DAY) + np.asarray(
+            jd2, dtype=float
+        ) * SECONDS_PER_DAY
+        result = np.empty((3, len(seconds)))
+        pending = np.ones(len(seconds), dtype=bool)
+        # Later segments take precedence, as in SPICE
+        for segment in reversed(segments):
+            inside = pending & (seconds >= segment.start) & (seconds <= segment.end)
+            if inside.any():
+                result[:, inside] = segment.position(seconds[inside])
+                pending &= ~inside
+        if pending.any():
+            raise ValueError(f"{self.path} does not cover every requested time")
+        return result
+
+    def barycentric(self, body: str, jd1: np.ndarray, jd2: np.ndarray) -> np.ndarray:
+        """(3, n) km position of ``body`` relative to the solar-system barycentre."""
+        try:
+            chain = BODY_CHAINS[body]
+        except KeyError:
+            raise KeyError(f"{body}'s position cannot be calculated with {self.path}") from None
+        total = self.segment_position(*chain[0], jd1, jd2)
+        for center, target in chain[1:]:
+            total += self.segment_position(center, target, jd1, jd2)
+        return total
+
+    def heliocentric(self, body: str, jd1: np.ndarray, jd2: np.ndarray) -> np.ndarray:
+        """(3, n) km position of ``body`` relative to the Sun."""
+        return self.barycentric(body, jd1, jd2) - self.barycentric("sun", jd1, jd2)
+
+    def geocentric(
+        self, body: str, jd1: np.ndarray, jd2: np.ndarray, earth: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """(3, n) km astrometric position of ``body`` seen from the geocentre, corrected for light time."""
+        if earth is None:
+            earth = self.barycentric("earth", jd1, jd2)
+        jd1 = np.asarray(jd1, dtype=float)
+        jd2 = np.asarray(jd2, dtype=float)
+        position = self.barycentric(body, jd1, jd2) - earth
+        for _ in range(3):
+            delay_days = np.linalg.norm(position, axis=0) / C_KM_S / SECONDS_PER_DAY
+            position = self.barycentric(body, jd1, jd2 - delay_days) - earth
+        return position
+
+
+_kernels: Dict[str, Optional[SpkKernel]] = {}
+_kernels_guard = threading.Lock()
+
+
+def load_kernel(path: os.PathLike | str) -> Optional[SpkKernel]:
+    """Kernel at ``path``, mapped once per process; None while it is missing or if it is unreadable."""
+    key = os.path.abspath(path)
+    with _kernels_guard:
+        if key not in _kernels:
+            try:
+                _kernels[key] = SpkKernel(key)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError):
+                _kernels[key] = None
+        return _kernels[key]
+
+
+def declination_degrees(vectors: np.ndarray) -> np.ndarray:
+    """Declination of (3, n) ICRF vectors."""
+    x, y, z = vectors
+    return np.degrees(np.arctan2(z, np.hypot(x, y)))
+
+
+def distances_km(vectors: np.ndarray) -> np.ndarray:
+    return np.linalg.norm(vectors, axis=0)
+
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import math
 import os
 import threading
@@ -10,6 +11,8 @@ from typing import Dict, Iterable, List, Literal, Optional, Sequence, Tuple
 
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 try:
     import swisseph as swe
 except ImportError as exc:  # pragma: no cover - hard failure surfaced in API layer
@@ -18,6 +21,11 @@ except ImportError as exc:  # pragma: no cover - hard failure surfaced in API la
     ) from exc
 
 
+# Version of the event computation. Bump it whenever a change alters computed
+# events: cached months and catalogue chunks of other versions are then ignored
+# and recomputed on demand.
+ENGINE_VERSION = 3
+
 # Thread-local storage for ayanamsa setting
 _thread_local = threading.local()
 
@@ -162,8 +170,36 @@ VELOCITY_STEP_MINUTES: Dict[str, int] = {
     "Pluto": 240,
 }
 
+# Spacing of the exact ephemeris nodes behind PlanetSampler. Cubic Hermite
+# interpolation on these keeps longitude errors well below an arcsecond.
+SAMPLER_NODE_DAYS: Dict[str, float] = {
+    "Moon": 0.5,
+    "Mercury": 1.0,
+    "Venus": 1.0,
+    "Sun": 1.0,
+    "Rahu": 1.0,
+    "Ketu": 1.0,
+    "Mars": 2.0,
+    "Jupiter": 4.0,
+    "Saturn": 4.0,
+    "Uranus": 8.0,
+    "Neptune": 8.0,
+    "Pluto": 8.0,
+}
+
+# Event refinement stops once the root is pinned to within a second.
+ROOT_TOL_DAYS = 1.0 / 86400.0
+# Bound on a root after a Newton step below half a second has converged.
+NEWTON_ERROR_DAYS = 0.001 / 86400.0
+UNIX_EPOCH_JD = 2440587.5
+
+# Rotation of the local sidereal time per UT day, which drives the ascendant.
+SIDEREAL_DEG_PER_DAY = 360.98564736629
+
 VELOCITY_REFINE_HALF_WINDOW = timedelta(hours=6)
-VELOCITY_CURV_DELTA = timedelta(minutes=2)
+# Max/min is read from the second difference of speed over this spacing. Exact
+# speeds jitter by ~1e-7 deg/day, which swamps a difference over minutes.
+VELOCITY_CURV_DELTA = timedelta(hours=6)
 VELOCITY_TIME_TOL = timedelta(minutes=6)
 VELOCITY_VALUE_EPS = 1e-4
 
@@ -238,18 +274,96 @@ def _set_ayanamsa(ayanamsa: str):
 
 
 def _get_calc_flags() -> int:
-    """Get calculation flags for the current thread's ayanamsa system."""
+    """Get ephemeris calculation flags.
+
+    Positions are always computed tropically; sidereal longitudes are derived by
+    subtracting ``_ayanamsa_offset`` so no process-global sid mode is involved.
+    """
     _initialise_once()
-    ayanamsa = _get_current_ayanamsa()
+    return swe.FLG_MOSEPH
+
+
+# Ayanamsa values (with nutation, as FLG_SIDEREAL applies them) are tabulated
+# every AYANAMSA_NODE_DAYS in blocks of AYANAMSA_BLOCK_DAYS and interpolated by
+# cubic Hermite, which stays well within a milliarcsecond of the exact value
+# and keeps the rate continuous for the speed-curvature checks.
+AYANAMSA_NODE_DAYS = 0.25
+AYANAMSA_BLOCK_DAYS = 512
+_AYANAMSA_LOCK = threading.Lock()
+_AYANAMSA_TABLES: Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _ayanamsa_table(ayanamsa: str, block: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(values, rates per node) for one block, built on first use."""
+    table = _AYANAMSA_TABLES.get((ayanamsa, block))
+    if table is not None:
+        return table
+    # set_sid_mode is process-global, so tables are only ever built under the lock
+    with _AYANAMSA_LOCK:
+        table = _AYANAMSA_TABLES.get((ayanamsa, block))
+        if table is None:
+            swe.set_sid_mode(AYANAMSA_SYSTEMS.get(ayanamsa) or swe.SIDM_LAHIRI, 0, 0)
+            count = int(AYANAMSA_BLOCK_DAYS / AYANAMSA_NODE_DAYS) + 1
+            first = block * AYANAMSA_BLOCK_DAYS
+            values = np.array(
+                [
+                    swe.get_ayanamsa_ex_ut(first + i * AYANAMSA_NODE_DAYS, swe.FLG_MOSEPH)[1]
+                    for i in range(count)
+                ]
+            )
+            table = (values, np.gradient(values, AYANAMSA_NODE_DAYS))
+            _AYANAMSA_TABLES[(ayanamsa, block)] = table
+    return table
+
+
+def _ayanamsa_offset(jd: float, ayanamsa: Optional[str] = None) -> Tuple[float, float]:
+    """(ayanamsa in degrees, its rate in deg/day) at ``jd``; zero for tropical.
 
+    Defaults to the current thread's ayanamsa system.
+    """
+    if ayanamsa is None:
+        ayanamsa = _get_current_ayanamsa()
     if ayanamsa == "tropical":
-        # Tropical system - no sidereal correction
-        return swe.FLG_MOSEPH
-    else:
-        # Sidereal system - set the ayanamsa
-        sid_mode = AYANAMSA_SYSTEMS.get(ayanamsa, swe.SIDM_LAHIRI)
-        swe.set_sid_mode(sid_mode, 0, 0)
-        return swe.FLG_MOSEPH | swe.FLG_SIDEREAL
+        return 0.0, 0.0
+    block = int(math.floor(jd / AYANAMSA_BLOCK_DAYS))
+    values, rates = _ayanamsa_table(ayanamsa, block)
+    x = (jd - block * AYANAMSA_BLOCK_DAYS) / AYANAMSA_NODE_DAYS
+    i = min(int(x), len(values) - 2)
+    value, rate = _hermite(x - i, values[i], values[i + 1], rates[i], rates[i + 1], AYANAMSA_NODE_DAYS)
+    return float(value), float(rate)
+
+
+def _ayanamsa_offsets(jds: np.ndarray, ayanamsa: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised :func:`_ayanamsa_offset` for an array of Julian days."""
+    jds = np.asarray(jds, dtype=float)
+    if ayanamsa == "tropical":
+        return np.zeros_like(jds), np.zeros_like(jds)
+    out_values = np.empty_like(jds)
+    out_rates = np.empty_like(jds)
+    blocks = np.floor(jds / AYANAMSA_BLOCK_DAYS).astype(int)
+    for block in np.unique(blocks):
+        mask = blocks == block
+        values, rates = _ayanamsa_table(ayanamsa, int(block))
+        x = (jds[mask] - block * AYANAMSA_BLOCK_DAYS) / AYANAMSA_NODE_DAYS
+        i = np.minimum(x.astype(int), len(values) - 2)
+        out_values[mask], out_rates[mask] = _hermite(
+            x - i, values[i], values[i + 1], rates[i], rates[i + 1], AYANAMSA_NODE_DAYS
+        )
+    return out_values, out_rates
+
+
+def _hermite(u, p0, p1, v0, v1, h: float):
+    """Cubic Hermite value and derivative at fraction ``u`` of a step ``h``.
+
+    ``p`` are the end values and ``v`` their derivatives; works on floats and arrays.
+    """
+    m0 = v0 * h
+    m1 = v1 * h
+    u2 = u * u
+    u3 = u2 * u
+    value = (2 * u3 - 3 * u2 + 1) * p0 + (u3 - 2 * u2 + u) * m0 + (-2 * u3 + 3 * u2) * p1 + (u3 - u2) * m1
+    slope = ((6 * u2 - 6 * u) * (p0 - p1) + (3 * u2 - 4 * u + 1) * m0 + (3 * u2 - 2 * u) * m1) / h
+    return value, slope
 
 
 def _mod360(value: float) -> float:
@@ -310,22 +424,77 @@ def _julday(dt: datetime) -> float:
 
 def _ascendant_sidereal_deg(dt: datetime, lat: float, lon: float) -> float:
     """Calculate ascendant using the current thread's ayanamsa system."""
-    ayanamsa = _get_current_ayanamsa()
     jd = _julday(dt)
     try:
         _, ascmc = swe.houses(jd, lat, lon, b"P")
     except swe.Error:
         return float("nan")
-    asc_tropical = ascmc[0]
+    ay, _ = _ayanamsa_offset(jd)
+    return _mod360(ascmc[0] - ay)
 
-    if ayanamsa == "tropical":
-        # Tropical system - return tropical ascendant
-        return _mod360(asc_tropical)
-    else:
-        # Sidereal system - subtract ayanamsa
-        _ = _get_calc_flags()  # Ensure ayanamsa is set
-        ay = swe.get_ayanamsa_ut(jd)
-        return _mod360(asc_tropical - ay)
+
+def _ascendant_speed_bounds(lat: float) -> Optional[Tuple[float, float]]:
+    """Slowest and fastest ascendant motion (deg/day) at ``lat``, or None inside the polar circles.
+
+    Derived from the ascendant formula over a full turn of the sidereal time,
+    with a small margin for the drift in obliquity and the ayanamsa.
+    """
+    if abs(lat) >= 66.0:
+        return None
+    theta = np.radians(np.arange(0.0, 360.0, 0.05))
+    eps = math.radians(23.44)
+    phi = math.radians(lat)
+    asc = np.arctan2(np.cos(theta), -(np.sin(theta) * math.cos(eps) + math.tan(phi) * math.sin(eps)))
+    rate = np.diff(np.unwrap(asc)) / np.radians(0.05)
+    return float(rate.min()) * SIDEREAL_DEG_PER_DAY * 0.95, float(rate.max()) * SIDEREAL_DEG_PER_DAY * 1.05
+
+
+def _safe_steps(
+    ahead_deg: float,
+    behind_deg: float,
+    speed_bounds: Optional[Tuple[float, float]],
+    step_days: float,
+) -> int:
+    """Whole coarse steps a body can take before it could reach a boundary.
+
+    ``ahead_deg``/``behind_deg`` are the distances to the nearest boundary in
+    each direction and ``speed_bounds`` the (most negative, most positive)
+    speed in deg/day. Without bounds this is a single step.
+    """
+    if speed_bounds is None or not (math.isfinite(ahead_deg) and math.isfinite(behind_deg)):
+        return 1
+    slowest, fastest = speed_bounds
+    days = math.inf
+    if fastest > 0.0:
+        days = ahead_deg / fastest
+    if slowest < 0.0:
+        days = min(days, behind_deg / -slowest)
+    if not math.isfinite(days):
+        return 1
+    return max(1, int(days / step_days))
+
+
+def _segment_steps(
+    deg: float, segment_size: float, speed_bounds: Optional[Tuple[float, float]], step_days: float
+) -> int:
+    offset = _mod360(deg) % segment_size if math.isfinite(deg) else math.nan
+    return _safe_steps(segment_size - offset, offset, speed_bounds, step_days)
+
+
+def _jd_to_datetime(jd: float) -> datetime:
+    # A float JD only resolves ~40us, so round to the millisecond to keep grid instants exact
+    return datetime.fromtimestamp(round((jd - UNIX_EPOCH_JD) * 86400.0, 3), tz=timezone.utc)
+
+
+def _planet_lon_speed_jd(
+    jd: float, planet: int, flags: int, ayanamsa: Optional[str] = None
+) -> Tuple[float, float]:
+    try:
+        xx, _ = swe.calc_ut(jd, planet, flags | swe.FLG_SPEED)
+    except swe.Error:
+        return float("nan"), float("nan")
+    ay, ay_rate = _ayanamsa_offset(jd, ayanamsa)
+    return _mod360(xx[0] - ay), xx[3] - ay_rate
 
 
 def _planet_lon_speed(
@@ -340,8 +509,9 @@ def _planet_lon_speed(
         xx, _ = swe.calc_ut(jd, planet, flags)
     except swe.Error:
         return float("nan"), None
-    lon = _mod360(xx[0])
-    speed = xx[3] if with_speed else None
+    ay, ay_rate = _ayanamsa_offset(jd)
+    lon = _mod360(xx[0] - ay)
+    speed = xx[3] - ay_rate if with_speed else None
     return lon, speed
 
 
@@ -357,6 +527,232 @@ def _planet_speed_deg_per_day(dt: datetime, planet: int) -> float:
     return float(speed)
 
 
+class PlanetSampler:
+    """Longitude and speed of one body over a fixed window, evaluated for arrays of Julian days.
+
+    Exact ``swe.calc_ut`` positions and speeds are computed once per node (see
+    ``SAMPLER_NODE_DAYS``) and any number of instants in the window are then
+    evaluated in one NumPy call by cubic Hermite interpolation. Coarse scans use
+    this to find brackets; events are still refined with exact ephemeris calls.
+
+    Nodes are computed tropically; :meth:`with_ayanamsa` shifts them onto another
+    zodiac without new ephemeris calls. ``ayanamsa`` defaults to the current
+    thread's system.
+    """
+
+    def __init__(self, name: str, start_jd: float, end_jd: float, ayanamsa: Optional[str] = None) -> None:
+        self.name = name
+        self.step = SAMPLER_NODE_DAYS.get(name, 1.0)
+        # Nodes sit on absolute multiples of the step so overlapping scans interpolate identically
+        self.start_jd = (math.floor(start_jd / self.step) - 1) * self.step
+        count = int(math.ceil((end_jd - self.start_jd) / self.step)) + 2
+        planet_id = PLANET_IDS[name]
+        self._planet_id = planet_id
+        flags = _get_calc_flags()
+        count = max(count, 3)
+        lons = np.empty(count)
+        speeds = np.empty(count)
+        for i in range(count):
+            lons[i], speeds[i] = _planet_lon_speed_jd(
+                self.start_jd + i * self.step, planet_id, flags, "tropical"
+            )
+        if name == "Ketu":
+            lons = np.mod(lons + 180.0, 360.0)
+        self._tropical = (lons, speeds)
+        self._apply_ayanamsa(ayanamsa or _get_current_ayanamsa())
+
+    def _apply_ayanamsa(self, ayanamsa: str) -> None:
+        self.ayanamsa = ayanamsa
+        lons, speeds = self._tropical
+        if ayanamsa != "tropical":
+            ay, ay_rate = _ayanamsa_offsets(self.start_jd + np.arange(len(lons)) * self.step, ayanamsa)
+            lons = np.mod(lons - ay, 360.0)
+            speeds = speeds - ay_rate
+        # Unwrapped so neighbouring nodes never straddle the 0/360 seam
+        self._lon = np.unwrap(lons, period=360.0)
+        self._speed = speeds
+        # Speed gets its own C1 Hermite curve so flat extrema don't sprout kinks
+        self._accel = np.gradient(speeds, self.step)
+
+    def with_ayanamsa(self, ayanamsa: str) -> "PlanetSampler":
+        """A sampler over the same nodes in another ayanamsa system."""
+        shifted = copy.copy(self)
+        shifted._apply_ayanamsa(ayanamsa)
+        return shifted
+
+    def sample(self, jd: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (longitude 0-360, speed deg/day) at each Julian day in ``jd``."""
+        x = (np.asarray(jd, dtype=float) - self.start_jd) / self.step
+        i = np.clip(np.floor(x).astype(int), 0, len(self._lon) - 2)
+        u = x - i
+        p0 = self._lon[i]
+        p1 = self._lon[i + 1]
+        m0 = self._speed[i] * self.step
+        m1 = self._speed[i + 1] * self.step
+        u2 = u * u
+        u3 = u2 * u
+        h00 = 2 * u3 - 3 * u2 + 1
+        h10 = u3 - 2 * u2 + u
+        h01 = -2 * u3 + 3 * u2
+        h11 = u3 - u2
+        lon = h00 * p0 + h10 * m0 + h01 * p1 + h11 * m1
+        speed = (
+            h00 * self._speed[i]
+            + h10 * self._accel[i] * self.step
+            + h01 * self._speed[i + 1]
+            + h11 * self._accel[i + 1] * self.step
+        )
+        return np.mod(lon, 360.0), speed
+
+    def acceleration(self, jd: float) -> float:
+        """Interpolated rate of change of speed (deg/day^2) at ``jd``."""
+        x = (jd - self.start_jd) / self.step
+        i = min(max(int(math.floor(x)), 0), len(self._lon) - 2)
+        u = x - i
+        u2 = u * u
+        d00 = 6 * u2 - 6 * u
+        d10 = 3 * u2 - 4 * u + 1
+        d01 = -6 * u2 + 6 * u
+        d11 = 3 * u2 - 2 * u
+        return (
+            d00 * self._speed[i]
+            + d10 * self._accel[i] * self.step
+            + d01 * self._speed[i + 1]
+            + d11 * self._accel[i + 1] * self.step
+        ) / self.step
+
+    def exact(self, jd: float) -> Tuple[float, float]:
+        """Exact (longitude 0-360, speed deg/day) from the ephemeris, bypassing the nodes."""
+        lon, speed = _planet_lon_speed_jd(jd, self._planet_id, _get_calc_flags(), self.ayanamsa)
+        if self.name == "Ketu":
+            lon = _mod360(lon + 180.0)
+        return lon, speed
+
+
+def _refine_root(
+    fn,
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    tol_days: float = ROOT_TOL_DAYS,
+    max_evals: int = 40,
+) -> float:
+    """Julian day of the sign change of ``fn`` inside [a, b], to within ``tol_days``.
+
+    ``fn(jd)`` returns ``(value, slope)``. A finite slope gives a Newton step and a
+    missing one a secant step through the bracket; steps that leave the bracket
+    or stop halving fall back to bisection, so this never does worse than
+    bisecting. Smooth ephemeris crossings settle in two or three evaluations.
+
+    The result is the first whole UTC second past the crossing (as the exact
+    scans reported it), so event times do not depend on how the root was found.
+    """
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    lo, f_lo, hi, f_hi = a, fa, b, fb
+    x = b - fb * (b - a) / (fb - fa)
+    dx_old = dx = abs(b - a)
+    newton = False
+    for _ in range(max_evals):
+        fx, slope = fn(x)
+        cand = math.nan
+        newton = False
+        if math.isfinite(fx):
+            if fx == 0.0:
+                return x
+            if (fx < 0.0) == (f_lo < 0.0):
+                lo, f_lo = x, fx
+            else:
+                hi, f_hi = x, fx
+            if slope is not None and math.isfinite(slope) and slope != 0.0:
+                cand = x - fx / slope
+                newton = True
+            else:
+                cand = lo - f_lo * (hi - lo) / (f_hi - f_lo)
+        if not (min(lo, hi) < cand < max(lo, hi)) or abs(cand - x) > 0.5 * dx_old:
+            cand = 0.5 * (lo + hi)
+            newton = False
+        dx_old = dx
+        dx = abs(cand - x)
+        x = cand
+        if dx <= 0.5 * tol_days or abs(hi - lo) <= tol_days:
+            break
+    # A converged Newton step leaves an error far below a millisecond
+    return _first_second_past(fn, x, f_lo, hi, NEWTON_ERROR_DAYS if newton else tol_days)
+
+
+def _first_second_past(fn, x: float, f_before: float, past: float, error_days: float) -> float:
+    """First whole UTC second at which ``fn`` has left the sign of ``f_before``.
+
+    ``x`` is the root to within ``error_days`` and ``past`` a time known to be
+    beyond it; ``fn`` is only evaluated when the error leaves the second in doubt.
+    """
+    offset = (x - UNIX_EPOCH_JD) * 86400.0
+    error = error_days * 86400.0
+    second = math.ceil(offset - error)
+    if second == math.ceil(offset + error):
+        return UNIX_EPOCH_JD + second / 86400.0
+    last = math.ceil(round((past - UNIX_EPOCH_JD) * 86400.0, 3))
+    for _ in range(3):
+        if second >= last:
+            break
+        t = UNIX_EPOCH_JD + second / 86400.0
+        ft, _ = fn(t)
+        if math.isfinite(ft) and (ft == 0.0 or (ft < 0.0) != (f_before < 0.0)):
+            return t
+        second += 1
+    return UNIX_EPOCH_JD + last / 86400.0
+
+
+def _boundary_deg(from_index: int, to_index: int, segment_size: float) -> Optional[float]:
+    """Longitude of the boundary between two adjacent segments (None if not adjacent)."""
+    count = int(round(360.0 / segment_size))
+    if (to_index - from_index) % count == 1:
+        return to_index * segment_size
+    if (from_index - to_index) % count == 1:
+        return from_index * segment_size
+    return None
+
+
+def _refine_crossing(
+    fn,
+    left: datetime,
+    right: datetime,
+    target_deg: float,
+    deg_left: Optional[float] = None,
+    deg_right: Optional[float] = None,
+    tol_days: float = ROOT_TOL_DAYS,
+) -> datetime:
+    """Secant/bisection time at which ``fn`` crosses ``target_deg`` inside [left, right]."""
+
+    def g(jd: float) -> Tuple[float, Optional[float]]:
+        deg = fn(_jd_to_datetime(jd))
+        return (_angdiff(deg, target_deg) if math.isfinite(deg) else math.nan), None
+
+    a = _julday(left)
+    b = _julday(right)
+    fa = g(a)[0] if deg_left is None else _angdiff(deg_left, target_deg)
+    fb = g(b)[0] if deg_right is None else _angdiff(deg_right, target_deg)
+    if not (math.isfinite(fa) and math.isfinite(fb)) or fa * fb > 0.0:
+        return _to_utc(right)
+    return _jd_to_datetime(_refine_root(g, a, b, fa, fb, tol_days))
+
+
+def _coarse_jds(start: datetime, end: datetime, coarse_minutes: int, include_end: bool = True) -> np.ndarray:
+    """Julian days start, start+step, ... up to end (appended when ``include_end``)."""
+    start_jd = _julday(start)
+    end_jd = _julday(end)
+    step = coarse_minutes / 1440.0
+    count = int(math.floor((end_jd - start_jd) / step + 1e-9)) + 1
+    jds = start_jd + np.arange(count) * step
+    if include_end and jds[-1] < end_jd:
+        jds = np.append(jds, end_jd)
+    return jds
+
+
 def _parabolic_vertex_time(
     t1: datetime,
     v1: float,
@@ -426,12 +822,57 @@ def _refine_velocity_extremum(
     return refined, speed, kind, curvature
 
 
+def _exact_speed_extremum(
+    sampler: PlanetSampler,
+    hint_jd: float,
+    is_max: bool,
+    start_jd: float,
+    end_jd: float,
+    step_minutes: int,
+) -> Optional[datetime]:
+    """Exact-speed extremum on the scan grid within one node step of an interpolated one.
+
+    Interpolation finds every extremum but can misplace it by most of a node step
+    where speed changes sharply (e.g. Venus near superior conjunction), so the
+    hint only picks the stretch to scan. None when the extremum is at the window edge.
+    """
+    pick = np.argmax if is_max else np.argmin
+    centre, half_width = hint_jd, sampler.step
+    # Eighth-node spacing first, then the scan step around the best of those
+    for spacing in (max(step_minutes, sampler.step * 1440.0 / 8.0), step_minutes):
+        lo = max(start_jd, centre - half_width)
+        hi = min(end_jd, centre + half_width)
+        jds = _coarse_jds(_jd_to_datetime(lo), _jd_to_datetime(hi), spacing)
+        speeds = np.array([sampler.exact(jd)[1] for jd in jds])
+        if not np.isfinite(speeds).all():
+            return _jd_to_datetime(hint_jd)
+        k = int(pick(speeds))
+        if (k == 0 and lo == start_jd) or (k == len(jds) - 1 and hi == end_jd):
+            return None
+        centre, half_width = jds[k], spacing / 1440.0
+    return _jd_to_datetime(centre)
+
+
 def _velocity_brackets_for_planet(
     planet_name: str,
     start: datetime,
     end: datetime,
     step_minutes: int,
+    sampler: Optional[PlanetSampler] = None,
 ) -> List[datetime]:
+    if sampler is not None:
+        jds = _coarse_jds(start, end, step_minutes)
+        _, v = sampler.sample(jds)
+        inner = v[1:-1]
+        maxima = (inner > v[:-2]) & (inner > v[2:])
+        minima = (inner < v[:-2]) & (inner < v[2:])
+        brackets = []
+        for k in np.flatnonzero(maxima | minima):
+            exact = _exact_speed_extremum(sampler, jds[k + 1], bool(maxima[k]), jds[0], jds[-1], step_minutes)
+            if exact is not None:
+                brackets.append(exact)
+        return brackets
+
     planet_id = PLANET_IDS[planet_name]
     step = timedelta(minutes=step_minutes)
     brackets: List[datetime] = []
@@ -458,9 +899,10 @@ def _velocity_extrema_for_planet(
     planet_name: str,
     start: datetime,
     end: datetime,
+    sampler: Optional[PlanetSampler] = None,
 ) -> List[Dict[str, object]]:
     step = VELOCITY_STEP_MINUTES.get(planet_name, 60)
-    hints = _velocity_brackets_for_planet(planet_name, start, end, step)
+    hints = _velocity_brackets_for_planet(planet_name, start, end, step, sampler)
     raw: List[Dict[str, object]] = []
     for hint in hints:
         refined, speed, kind, curvature = _refine_velocity_extremum(
@@ -507,22 +949,150 @@ def _refine_boundary(
 ) -> datetime:
     a = _to_utc(left)
     b = _to_utc(right)
-    s_left = _sign_index(fn(a))
-    s_right = _sign_index(fn(b))
+    deg_left = fn(a)
+    deg_right = fn(b)
+    s_left = _sign_index(deg_left)
+    s_right = _sign_index(deg_right)
     if s_left == s_right:
         return b
-    while _datetime_range_seconds(a, b) > desired_seconds:
-        mid = datetime.fromtimestamp(
-            (_to_utc(a).timestamp() + _to_utc(b).timestamp()) / 2, tz=timezone.utc
-        )
-        s_mid = _sign_index(fn(mid))
-        if s_mid == s_left:
+    boundary = _boundary_deg(s_left, s_right, 30.0)
+    if boundary is None:
+        exact, _ = _bisect_index_change(fn, a, b, s_left, s_right, 30.0)
+        return exact
+    return _refine_crossing(fn, a, b, boundary, deg_left, deg_right, desired_seconds / 86400.0)
+
+
+def _bisect_index_change(
+    fn,
+    left: datetime,
+    right: datetime,
+    left_index: int,
+    right_index: int,
+    segment_size: float,
+) -> Tuple[datetime, int]:
+    a = left
+    b = right
+    while _datetime_range_seconds(a, b) > 1.0:
+        mid = _mid_datetime(a, b)
+        deg_mid = fn(mid)
+        if not math.isfinite(deg_mid):
+            a = mid
+            continue
+        mid_idx = _segment_index(deg_mid, segment_size)
+        if mid_idx == left_index:
             a = mid
-            s_left = s_mid
         else:
             b = mid
-            s_right = s_mid
-    return b
+            right_index = mid_idx
+    return b, right_index
+
+
+def _boundary_offset_fn(sampler: PlanetSampler, boundary: float):
+    """Exact signed distance past ``boundary`` (deg) and its rate, for root finding."""
+
+    def offset(jd: float) -> Tuple[float, float]:
+        deg, speed = sampler.exact(jd)
+        return (_angdiff(deg, boundary) if math.isfinite(deg) else math.nan), speed
+
+    return offset
+
+
+def _polish_sampled_crossing(
+    sampler: PlanetSampler,
+    jds: np.ndarray,
+    lon: np.ndarray,
+    k: int,
+    idx: np.ndarray,
+    segment_size: float,
+    max_evals: int = 3,
+) -> Optional[datetime]:
+    """Exact time of the crossing the sampled grid shows between ``jds[k]`` and ``jds[k + 1]``.
+
+    Sampled longitudes are sub-arcsecond, so a secant guess between the grid
+    points plus a Newton step or two on the exact ephemeris settles without
+    bracketing. Returns None (caller falls back to exact brackets) when the
+    steps wander off or the exact motion disagrees with the sampled direction,
+    e.g. when a body grazes a boundary near a station.
+    """
+    from_index = int(idx[k])
+    to_index = int(idx[k + 1])
+    boundary = _boundary_deg(from_index, to_index, segment_size)
+    if boundary is None:
+        return None
+    direction = 1.0 if boundary == to_index * segment_size else -1.0
+    f0 = _angdiff(float(lon[k]), boundary)
+    f1 = _angdiff(float(lon[k + 1]), boundary)
+    if f1 == f0:
+        return None
+    x = jds[k] - f0 * (jds[k + 1] - jds[k]) / (f1 - f0)
+    lo = jds[max(k - 1, 0)]
+    hi = jds[min(k + 2, len(jds) - 1)]
+    offset = _boundary_offset_fn(sampler, boundary)
+    for _ in range(max_evals):
+        fx, slope = offset(x)
+        if not (math.isfinite(fx) and math.isfinite(slope)) or slope * direction <= 0.0:
+            return None
+        step = fx / slope
+        x -= step
+        if not lo <= x <= hi:
+            return None
+        if abs(step) <= 0.5 * ROOT_TOL_DAYS:
+            return _jd_to_datetime(_first_second_past(offset, x, f0, hi, NEWTON_ERROR_DAYS))
+    return None
+
+
+def _find_index_changes_sampled(
+    fn,
+    sampler: PlanetSampler,
+    start: datetime,
+    end: datetime,
+    segment_size: float,
+    coarse_minutes: int,
+) -> List[SignChange]:
+    """Segment changes with brackets from ``sampler`` and exact Newton refinement."""
+    jds = _coarse_jds(_to_utc(start), _to_utc(end), coarse_minutes)
+    lon, _ = sampler.sample(jds)
+    idx = np.floor(lon / segment_size).astype(int)
+    out: List[SignChange] = []
+    last = len(jds) - 1
+    for k in np.flatnonzero(idx[1:] != idx[:-1]):
+        exact = _polish_sampled_crossing(sampler, jds, lon, int(k), idx, segment_size)
+        if exact is not None:
+            if not (out and _datetime_range_seconds(out[-1].time_utc, exact) <= 5.0):
+                out.append(SignChange(time_utc=exact, from_index=int(idx[k]), to_index=int(idx[k + 1])))
+            continue
+        # Interpolation error can move a crossing past a grid point, so the exact
+        # bracket is widened by one coarse step when its ends disagree with it.
+        for lo, hi in ((k, k + 1), (max(k - 1, 0), min(k + 2, last))):
+            deg_left, _ = sampler.exact(jds[lo])
+            deg_right, _ = sampler.exact(jds[hi])
+            if not (math.isfinite(deg_left) and math.isfinite(deg_right)):
+                continue
+            left_idx = _segment_index(deg_left, segment_size)
+            right_idx = _segment_index(deg_right, segment_size)
+            if left_idx != right_idx:
+                break
+        else:
+            continue
+        to_idx = right_idx
+        boundary = _boundary_deg(left_idx, right_idx, segment_size)
+        if boundary is None:
+            exact, to_idx = _bisect_index_change(
+                fn, _jd_to_datetime(jds[lo]), _jd_to_datetime(jds[hi]), left_idx, right_idx, segment_size
+            )
+        else:
+            root = _refine_root(
+                _boundary_offset_fn(sampler, boundary),
+                jds[lo],
+                jds[hi],
+                _angdiff(deg_left, boundary),
+                _angdiff(deg_right, boundary),
+            )
+            exact = _jd_to_datetime(root)
+        if out and _datetime_range_seconds(out[-1].time_utc, exact) <= 5.0:
+            continue
+        out.append(SignChange(time_utc=exact, from_index=left_idx, to_index=to_idx))
+    return out
 
 
 def _find_sign_changes(
@@ -530,14 +1100,20 @@ def _find_sign_changes(
     start: datetime,
     end: datetime,
     coarse_minutes: int,
+    sampler: Optional[PlanetSampler] = None,
+    speed_bounds: Optional[Tuple[float, float]] = None,
 ) -> List[SignChange]:
+    if sampler is not None:
+        return _find_index_changes_sampled(fn, sampler, start, end, 30.0, coarse_minutes)
     start = _to_utc(start)
     end = _to_utc(end)
     out: List[SignChange] = []
     coarse_delta = timedelta(minutes=coarse_minutes)
+    step_days = coarse_minutes / 1440.0
 
     t = start
     prev_index: Optional[int] = None
+    deg = math.nan
     guard = 0
     while guard < 10 and t <= end:
         deg = fn(t)
@@ -552,8 +1128,11 @@ def _find_sign_changes(
 
     last_pushed: Optional[datetime] = None
     while t < end:
-        t_next = min(t + coarse_delta, end)
+        # Whole grid steps are skipped while no sign boundary is within reach
+        steps = _segment_steps(deg, 30.0, speed_bounds, step_days)
+        t_next = min(t + coarse_delta * steps, end)
         deg_next = fn(t_next)
+        deg = deg_next
         if not math.isfinite(deg_next):
             t = t_next
             continue
@@ -608,14 +1187,20 @@ def _find_segment_changes(
     end: datetime,
     segment_size: float,
     coarse_minutes: int,
+    sampler: Optional[PlanetSampler] = None,
+    speed_bounds: Optional[Tuple[float, float]] = None,
 ) -> List[SignChange]:
+    if sampler is not None:
+        return _find_index_changes_sampled(fn, sampler, start, end, segment_size, coarse_minutes)
     start = _to_utc(start)
     end = _to_utc(end)
     out: List[SignChange] = []
     coarse_delta = timedelta(minutes=coarse_minutes)
+    step_days = coarse_minutes / 1440.0
 
     t = start
     prev_index: Optional[int] = None
+    deg = math.nan
     guard = 0
     while guard < 10 and t <= end:
         deg = fn(t)
@@ -630,37 +1215,31 @@ def _find_segment_changes(
 
     last_pushed: Optional[datetime] = None
     while t < end:
-        t_next = min(t + coarse_delta, end)
+        steps = _segment_steps(deg, segment_size, speed_bounds, step_days)
+        t_next = min(t + coarse_delta * steps, end)
         deg_next = fn(t_next)
         if not math.isfinite(deg_next):
+            deg = deg_next
             t = t_next
             continue
         next_index = _segment_index(deg_next, segment_size)
         if next_index != prev_index:
-            left = t
-            right = t_next
-            left_idx = prev_index
-            for _ in range(60):
-                if _datetime_range_seconds(left, right) <= 1:
-                    break
-                mid = _mid_datetime(left, right)
-                deg_mid = fn(mid)
-                if not math.isfinite(deg_mid):
-                    left = mid
-                    continue
-                mid_idx = _segment_index(deg_mid, segment_size)
-                if mid_idx == left_idx:
-                    left = mid
-                else:
-                    right = mid
-                    next_index = mid_idx
-            exact = right
+            boundary = _boundary_deg(prev_index, next_index, segment_size)
+            if boundary is None:
+                exact, next_index = _bisect_index_change(
+                    fn, t, t_next, prev_index, next_index, segment_size
+                )
+            else:
+                exact = _refine_crossing(fn, t, t_next, boundary, deg_right=deg_next)
             if last_pushed is None or _datetime_range_seconds(last_pushed, exact) > 5.0:
                 out.append(SignChange(time_utc=exact, from_index=prev_index, to_index=next_index))
                 last_pushed = exact
                 prev_index = next_index
+                # The scan resumes from the crossing, which sits on the boundary
+                deg = boundary if boundary is not None else fn(exact)
                 t = exact
                 continue
+        deg = deg_next
         t = t_next
     return out
 
@@ -679,6 +1258,7 @@ def _find_stations(
     coarse_minutes: int = 60,
     speed_fn=None,
     planet_name: str = "",
+    sampler: Optional[PlanetSampler] = None,
 ) -> List[StationEvent]:
     start = _to_utc(start)
     end = _to_utc(end)
@@ -700,11 +1280,21 @@ def _find_stations(
             return 0
         return 1 if value > 0 else -1
 
+    if sampler is not None:
+        return _find_stations_sampled(
+            velocity_at, safe_sign, sampler, start, end, coarse_minutes, planet_name
+        )
+
+    def velocity_root(jd: float) -> Tuple[float, Optional[float]]:
+        return velocity_at(_jd_to_datetime(jd)), None
+
     prev_time = start
     prev_sign = 0
+    prev_vel = math.nan
     guard = 0
     while guard < 48 and prev_time < end and prev_sign == 0:
-        prev_sign = safe_sign(velocity_at(prev_time))
+        prev_vel = velocity_at(prev_time)
+        prev_sign = safe_sign(prev_vel)
         if prev_sign == 0:
             prev_time = min(prev_time + step, end)
         guard += 1
@@ -718,26 +1308,9 @@ def _find_stations(
         curr_vel = velocity_at(t_next)
         curr_sign = safe_sign(curr_vel)
         if curr_sign != 0 and prev_sign != 0 and curr_sign != prev_sign:
-            a = prev_time
-            b = t_next
-            sign_a = prev_sign
-            for _ in range(40):
-                if _datetime_range_seconds(a, b) <= 1.0:
-                    break
-                mid = datetime.fromtimestamp(
-                    (_to_utc(a).timestamp() + _to_utc(b).timestamp()) / 2,
-                    tz=timezone.utc,
-                )
-                mid_sign = safe_sign(velocity_at(mid))
-                if mid_sign == 0:
-                    a = mid
-                    sign_a = 0
-                    continue
-                if mid_sign == sign_a or sign_a == 0:
-                    a = mid
-                    sign_a = mid_sign
-                else:
-                    b = mid
+            b = _jd_to_datetime(
+                _refine_root(velocity_root, _julday(prev_time), _julday(t_next), prev_vel, curr_vel)
+            )
 
             kind: Literal["retrograde", "direct"] = (
                 "retrograde" if curr_sign < 0 else "direct"
@@ -747,20 +1320,95 @@ def _find_stations(
                 if gap < 6 * 3600:
                     if out[-1].kind == kind:
                         prev_sign = curr_sign
+                        prev_vel = curr_vel
                         prev_time = t_next
                         t = t_next
                         continue
                     out.pop()
             out.append(StationEvent(planet=planet_name, time_utc=b, kind=kind))
             prev_sign = curr_sign
+            prev_vel = curr_vel
             prev_time = t_next
         elif curr_sign != 0:
             prev_sign = curr_sign
+            prev_vel = curr_vel
             prev_time = t_next
         t = t_next
     return out
 
 
+def _find_stations_sampled(
+    velocity_at,
+    safe_sign,
+    sampler: PlanetSampler,
+    start: datetime,
+    end: datetime,
+    coarse_minutes: int,
+    planet_name: str,
+) -> List[StationEvent]:
+    """Stations with sign-flip brackets from ``sampler``, refined by Newton steps on speed."""
+    out: List[StationEvent] = []
+    jds = _coarse_jds(start, end, coarse_minutes)
+    _, speed = sampler.sample(jds)
+    per_hour = speed / 24.0
+    signs = np.where(np.abs(per_hour) < 1e-6, 0, np.sign(per_hour)).astype(int)
+    nonzero = np.flatnonzero(signs)
+    flips = np.flatnonzero(signs[nonzero[1:]] != signs[nonzero[:-1]])
+    last = len(jds) - 1
+    for f in flips:
+        i0 = int(nonzero[f])
+        i1 = int(nonzero[f + 1])
+        curr_sign = int(signs[i1])
+        for lo, hi in ((i0, i1), (max(i0 - 1, 0), min(i1 + 1, last))):
+            vel_a = velocity_at(_jd_to_datetime(jds[lo]))
+            vel_b = velocity_at(_jd_to_datetime(jds[hi]))
+            if safe_sign(vel_a) == -curr_sign and safe_sign(vel_b) == curr_sign:
+                break
+        else:
+            continue
+        # Speed and the interpolated acceleration give Newton steps in deg/hour
+        root = _refine_root(
+            lambda jd: (sampler.exact(jd)[1] / 24.0, sampler.acceleration(jd) / 24.0),
+            jds[lo],
+            jds[hi],
+            vel_a,
+            vel_b,
+        )
+        b = _jd_to_datetime(root)
+
+        kind: Literal["retrograde", "direct"] = "retrograde" if curr_sign < 0 else "direct"
+        if out and _datetime_range_seconds(out[-1].time_utc, b) < 6 * 3600:
+            if out[-1].kind == kind:
+                continue
+            out.pop()
+        out.append(StationEvent(planet=planet_name, time_utc=b, kind=kind))
+    return out
+
+
+def _combustion_offset_fn(sun_sampler: PlanetSampler, planet_sampler: PlanetSampler, orb_deg: float):
+    """Exact Sun-planet separation beyond ``orb_deg`` (deg) and its rate, for root finding."""
+
+    def offset(jd: float) -> Tuple[float, float]:
+        sun_lon, sun_speed = sun_sampler.exact(jd)
+        planet_lon, planet_speed = planet_sampler.exact(jd)
+        diff = _angdiff(planet_lon, sun_lon)
+        return abs(diff) - orb_deg, math.copysign(1.0, diff) * (planet_speed - sun_speed)
+
+    return offset
+
+
+def _refine_combustion_edge(offset, jds: np.ndarray, k: int) -> datetime:
+    """Exact time the sampled combustion state flips between ``jds[k - 1]`` and ``jds[k]``."""
+    last = len(jds) - 1
+    # Interpolation error can move the edge past a grid point, as with sign changes
+    for lo, hi in ((k - 1, k), (max(k - 2, 0), min(k + 1, last))):
+        f_lo, _ = offset(jds[lo])
+        f_hi, _ = offset(jds[hi])
+        if math.isfinite(f_lo) and math.isfinite(f_hi) and (f_lo <= 0.0) != (f_hi <= 0.0):
+            return _jd_to_datetime(_refine_root(offset, jds[lo], jds[hi], f_lo, f_hi))
+    return _jd_to_datetime(jds[k])
+
+
 def _find_combustion(
     sun_fn,
     planet_fn,
@@ -768,7 +1416,26 @@ def _find_combustion(
     end: datetime,
     orb_deg: float,
     coarse_minutes: int = 60,
+    sun_sampler: Optional[PlanetSampler] = None,
+    planet_sampler: Optional[PlanetSampler] = None,
 ) -> List[Tuple[datetime, datetime]]:
+    if sun_sampler is not None and planet_sampler is not None:
+        # Edges are refined on the exact ephemeris, so they do not depend on
+        # where the grid starts (the catalogue grid is UTC, not the local month)
+        jds = _coarse_jds(start, end, coarse_minutes, include_end=False)
+        sun_lon, _ = sun_sampler.sample(jds)
+        planet_lon, _ = planet_sampler.sample(jds)
+        sep = np.abs(np.mod(planet_lon - sun_lon + 180.0, 360.0) - 180.0)
+        comb = np.concatenate(([False], sep <= orb_deg, [False]))
+        edges = np.flatnonzero(comb[1:] != comb[:-1])
+        offset = _combustion_offset_fn(sun_sampler, planet_sampler, orb_deg)
+        windows: List[Tuple[datetime, datetime]] = []
+        for enter, leave in zip(edges[::2], edges[1::2]):
+            win_start = start if enter == 0 else _refine_combustion_edge(offset, jds, enter)
+            win_end = end if leave >= len(jds) else _refine_combustion_edge(offset, jds, leave)
+            windows.append((win_start, win_end))
+        return windows
+
     out: List[Tuple[datetime, datetime]] = []
     step = timedelta(minutes=coarse_minutes)
     t = start
@@ -801,42 +1468,37 @@ def _find_degree_hit(
     end: datetime,
     target_deg: float,
     coarse_minutes: int,
+    speed_bounds: Optional[Tuple[float, float]] = None,
 ) -> Optional[datetime]:
     if start >= end:
         return None
     coarse = timedelta(minutes=coarse_minutes)
+    step_days = coarse_minutes / 1440.0
+
+    def next_time(after: datetime, deg: float) -> datetime:
+        steps = _safe_steps(
+            _mod360(target_deg - deg), _mod360(deg - target_deg), speed_bounds, step_days
+        )
+        return min(after + coarse * steps, end)
+
     prev_time = start
-    prev_diff = _angdiff(fn(prev_time), target_deg)
-    t = min(prev_time + coarse, end)
+    prev_deg = fn(prev_time)
+    prev_diff = _angdiff(prev_deg, target_deg)
+    t = next_time(prev_time, prev_deg)
     epsilon = 1e-3
     while True:
-        diff = _angdiff(fn(t), target_deg)
+        deg = fn(t)
+        diff = _angdiff(deg, target_deg)
         if abs(diff) < epsilon:
             return t
         if (prev_diff <= 0 <= diff) or (prev_diff >= 0 >= diff):
-            left = prev_time
-            right = t
-            left_diff = prev_diff
-            right_diff = diff
-            for _ in range(60):
-                if _datetime_range_seconds(left, right) <= 1:
-                    break
-                mid = _mid_datetime(left, right)
-                mid_diff = _angdiff(fn(mid), target_deg)
-                if abs(mid_diff) < epsilon:
-                    return mid
-                if (left_diff <= 0 <= mid_diff) or (left_diff >= 0 >= mid_diff):
-                    right = mid
-                    right_diff = mid_diff
-                else:
-                    left = mid
-                    left_diff = mid_diff
-            return _mid_datetime(left, right)
+            return _refine_crossing(fn, prev_time, t, target_deg, prev_deg, deg)
         if t >= end:
             break
         prev_time = t
+        prev_deg = deg
         prev_diff = diff
-        t = min(t + coarse, end)
+        t = next_time(t, deg)
     return None
 
 
@@ -908,7 +1570,10 @@ def compute_horizon(
     moon_fn = _planet_lon_fn("Moon")
 
     asc_coarse = 10 if asc_hours > 24 else 5
-    lagna_changes = _find_sign_changes(asc_fn, start_utc, asc_end, asc_coarse)
+    asc_bounds = _ascendant_speed_bounds(lat)
+    lagna_changes = _find_sign_changes(
+        asc_fn, start_utc, asc_end, asc_coarse, speed_bounds=asc_bounds
+    )
     lagna_rows: List[Dict[str, object]] = []
     for idx, change in enumerate(lagna_changes):
         local = _format_local(change.time_utc, tz_name)
@@ -930,6 +1595,7 @@ def compute_horizon(
                 next_boundary,
                 change.to_index * 30 + 15,
                 max(1, asc_coarse // 2),
+                speed_bounds=asc_bounds,
             )
         except RecursionError:
             midpoint = None
@@ -951,6 +1617,7 @@ def compute_horizon(
         moon_end,
         PADA_SEGMENT_DEG,
         pada_coarse,
+        sampler=PlanetSampler("Moon", _julday(start_utc), _julday(moon_end)),
     )
     moon_rows: List[Dict[str, object]] = []
     initial_nak_idx, initial_pada = _pada_index_from_lon(moon_fn(start_utc))
@@ -985,58 +1652,423 @@ def compute_horizon(
     }
 
 
-def compute_monthly(
-    lat: float,
-    lon: float,
-    tz_name: str,
-    month_start_iso: str,
-    ayanamsa: str = "lahiri",
-) -> Dict[str, object]:
-    """Compute monthly planetary events using the specified ayanamsa system.
+MONTH_WINDOW_PAD = timedelta(days=45)
+# Catalogue chunks are scanned with a little padding so extrema and stations near
+# a chunk edge still see neighbouring samples.
+CATALOGUE_SCAN_PAD = timedelta(days=2)
+# Events found within this distance of a chunk edge are stored in both chunks and
+# de-duplicated on merge, so scans of different runs never drop a seam event.
+CATALOGUE_SEAM_TOL = timedelta(seconds=5)
 
-    Args:
-        lat: Latitude
-        lon: Longitude
-        tz_name: Timezone name (e.g., 'Asia/Kolkata')
-        month_start_iso: Month start in ISO format (e.g., '2025-01-01')
-        ayanamsa: Ayanamsa system ('lahiri', 'raman', or 'tropical')
+
+@dataclass
+class EventCatalogue:
+    """Geocentric events over [start_utc, end_utc), independent of observer location.
+
+    ``moon_pada_at_start``, ``signs_at_start`` and ``retrograde_at_start`` hold the
+    state at ``start_utc`` so any instant inside the catalogue can be resolved
+    without another ephemeris call.
     """
-    _initialise_once()
-    _set_ayanamsa(ayanamsa)  # Set for this thread
-    month_start_local = _from_iso_local(month_start_iso, tz_name).replace(hour=0, minute=0, second=0, microsecond=0)
-    month_end_local = _add_month(month_start_local, 1)
-    window_start = month_start_local - timedelta(days=45)
-    window_end = month_end_local + timedelta(days=45)
 
-    start_utc = _to_utc(window_start)
-    end_utc = _to_utc(window_end)
-    month_end_utc = _to_utc(month_end_local)
-    month_start_ms = month_start_local.timestamp()
-    month_end_ms = month_end_local.timestamp()
+    start_utc: datetime
+    end_utc: datetime
+    moon_pada_at_start: int
+    signs_at_start: Dict[str, int]
+    retrograde_at_start: Dict[str, bool]
+    moon_padas: List[SignChange]
+    sun_ingresses: List[SignChange]
+    ingresses: Dict[str, List[SignChange]]
+    stations: Dict[str, List[StationEvent]]
+    velocity: Dict[str, List[Dict[str, object]]]
+    combustion: Dict[str, List[Tuple[datetime, datetime]]]
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialise to JSON-friendly primitives (times as UTC epoch seconds)."""
+
+        def changes(rows: List[SignChange]) -> List[List[float]]:
+            return [[c.time_utc.timestamp(), c.from_index, c.to_index] for c in rows]
+
+        return {
+            "start": self.start_utc.timestamp(),
+            "end": self.end_utc.timestamp(),
+            "moonPada": self.moon_pada_at_start,
+            "signs": dict(self.signs_at_start),
+            "retro": dict(self.retrograde_at_start),
+            "moon": changes(self.moon_padas),
+            "sun": changes(self.sun_ingresses),
+            "ingress": {name: changes(rows) for name, rows in self.ingresses.items()},
+            "stations": {
+                name: [[ev.time_utc.timestamp(), ev.kind] for ev in rows]
+                for name, rows in self.stations.items()
+            },
+            "velocity": {
+                name: [
+                    [row["time_utc"].timestamp(), row["speed"], row["kind"], row["curvature"]]  # type: ignore[union-attr]
+                    for row in rows
+                ]
+                for name, rows in self.velocity.items()
+            },
+            "combustion": {
+                name: [[a.timestamp(), b.timestamp()] for a, b in rows]
+                for name, rows in self.combustion.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "EventCatalogue":
+        def ts(value: float) -> datetime:
+            return datetime.fromtimestamp(value, tz=timezone.utc)
+
+        def changes(rows) -> List[SignChange]:
+            return [SignChange(time_utc=ts(t), from_index=int(a), to_index=int(b)) for t, a, b in rows]
+
+        return cls(
+            start_utc=ts(data["start"]),  # type: ignore[arg-type]
+            end_utc=ts(data["end"]),  # type: ignore[arg-type]
+            moon_pada_at_start=int(data["moonPada"]),  # type: ignore[arg-type]
+            signs_at_start={k: int(v) for k, v in data["signs"].items()},  # type: ignore[union-attr]
+            retrograde_at_start={k: bool(v) for k, v in data["retro"].items()},  # type: ignore[union-attr]
+            moon_padas=changes(data["moon"]),
+            sun_ingresses=changes(data["sun"]),
+            ingresses={name: changes(rows) for name, rows in data["ingress"].items()},  # type: ignore[union-attr]
+            stations={
+                name: [StationEvent(planet=name, time_utc=ts(t), kind=kind) for t, kind in rows]
+                for name, rows in data["stations"].items()  # type: ignore[union-attr]
+            },
+            velocity={
+                name: [
+                    {"planet": name, "time_utc": ts(t), "speed": speed, "kind": kind, "curvature": curv}
+                    for t, speed, kind, curv in rows
+                ]
+                for name, rows in data["velocity"].items()  # type: ignore[union-attr]
+            },
+            combustion={
+                name: [(ts(a), ts(b)) for a, b in rows]
+                for name, rows in data["combustion"].items()  # type: ignore[union-attr]
+            },
+        )
+
+
+def _scan_events(
+    start_utc: datetime,
+    end_utc: datetime,
+    samplers: Optional[Dict[str, PlanetSampler]] = None,
+) -> EventCatalogue:
+    """Scan the ephemeris once over a UTC window using the current thread's ayanamsa.
 
+    ``samplers`` (one per body, covering the window in that ayanamsa) are built
+    here unless supplied.
+    """
+    if samplers is None:
+        start_jd = _julday(start_utc)
+        end_jd = _julday(end_utc)
+        samplers = {name: PlanetSampler(name, start_jd, end_jd) for name in PLANET_IDS}
     sun_fn = _planet_lon_fn("Sun")
     moon_fn = _planet_lon_fn("Moon")
 
-    moon_changes = _find_segment_changes(
+    moon_padas = _find_segment_changes(
         moon_fn,
         start_utc,
         end_utc,
         PADA_SEGMENT_DEG,
         30,
+        sampler=samplers["Moon"],
+    )
+    sun_ingresses = _find_sign_changes(sun_fn, start_utc, end_utc, 120, sampler=samplers["Sun"])
+
+    signs_at_start: Dict[str, int] = {}
+    ingresses: Dict[str, List[SignChange]] = {}
+    for planet_name in PLANET_INGRESS_NAMES:
+        coarse = 30 if planet_name == "Mercury" else 60 if planet_name == "Venus" else 240
+        planet_fn = _planet_lon_fn(planet_name)  # type: ignore[arg-type]
+        signs_at_start[planet_name] = _sign_index(planet_fn(start_utc))
+        ingresses[planet_name] = _find_sign_changes(
+            planet_fn, start_utc, end_utc, coarse, sampler=samplers[planet_name]
+        )
+
+    velocity: Dict[str, List[Dict[str, object]]] = {}
+    for planet_name in VELOCITY_PLANETS:
+        velocity[planet_name] = _velocity_extrema_for_planet(
+            planet_name, start_utc, end_utc, sampler=samplers[planet_name]
+        )
+
+    retrograde_at_start: Dict[str, bool] = {}
+    stations: Dict[str, List[StationEvent]] = {}
+    for planet_name in STATION_PLANET_NAMES:
+        planet_fn = _planet_lon_fn(planet_name)  # type: ignore[arg-type]
+        speed_fn = _planet_speed_fn(planet_name)  # type: ignore[arg-type]
+        initial_speed = speed_fn(start_utc)
+        retrograde_at_start[planet_name] = (
+            initial_speed < 0
+            if isinstance(initial_speed, (int, float)) and math.isfinite(initial_speed)
+            else _velocity_deg_per_hr(planet_fn, start_utc) < 0
+        )
+        stations[planet_name] = _find_stations(
+            planet_fn,
+            start_utc,
+            end_utc,
+            60,
+            speed_fn,
+            planet_name=planet_name,
+            sampler=samplers[planet_name],
+        )
+
+    combustion: Dict[str, List[Tuple[datetime, datetime]]] = {}
+    for planet_name, orb in COMBUSTION_ORBS.items():
+        if orb <= 0:
+            continue
+        combustion[planet_name] = _find_combustion(
+            sun_fn,
+            _planet_lon_fn(planet_name),  # type: ignore[arg-type]
+            start_utc,
+            end_utc,
+            orb,
+            60,
+            sun_sampler=samplers["Sun"],
+            planet_sampler=samplers[planet_name],
+        )
+
+    return EventCatalogue(
+        start_utc=start_utc,
+        end_utc=end_utc,
+        moon_pada_at_start=_segment_index(moon_fn(start_utc), PADA_SEGMENT_DEG),
+        signs_at_start=signs_at_start,
+        retrograde_at_start=retrograde_at_start,
+        moon_padas=moon_padas,
+        sun_ingresses=sun_ingresses,
+        ingresses=ingresses,
+        stations=stations,
+        velocity=velocity,
+        combustion=combustion,
     )
+
+
+def _index_at(changes: List[SignChange], initial: int, dt: datetime) -> int:
+    index = initial
+    for change in changes:
+        if change.time_utc > dt:
+            break
+        index = change.to_index
+    return index
+
+
+def _retrograde_at(events: List[StationEvent], initial: bool, dt: datetime) -> bool:
+    retro = initial
+    for ev in events:
+        if ev.time_utc > dt:
+            break
+        retro = ev.kind == "retrograde"
+    return retro
+
+
+def _slice_catalogue(catalogue: EventCatalogue, start_utc: datetime, end_utc: datetime) -> EventCatalogue:
+    """Restrict a catalogue to [start_utc, end_utc), keeping seam events on both sides."""
+    lo = start_utc - CATALOGUE_SEAM_TOL
+    hi = end_utc + CATALOGUE_SEAM_TOL
+
+    def keep(rows, time_of):
+        return [row for row in rows if lo <= time_of(row) < hi]
+
+    change_time = lambda c: c.time_utc  # noqa: E731
+    return EventCatalogue(
+        start_utc=start_utc,
+        end_utc=end_utc,
+        moon_pada_at_start=_index_at(
+            catalogue.moon_padas, catalogue.moon_pada_at_start, start_utc
+        ),
+        signs_at_start={
+            name: _index_at(catalogue.ingresses[name], initial, start_utc)
+            for name, initial in catalogue.signs_at_start.items()
+        },
+        retrograde_at_start={
+            name: _retrograde_at(catalogue.stations[name], initial, start_utc)
+            for name, initial in catalogue.retrograde_at_start.items()
+        },
+        moon_padas=keep(catalogue.moon_padas, change_time),
+        sun_ingresses=keep(catalogue.sun_ingresses, change_time),
+        ingresses={name: keep(rows, change_time) for name, rows in catalogue.ingresses.items()},
+        stations={name: keep(rows, change_time) for name, rows in catalogue.stations.items()},
+        velocity={
+            name: keep(rows, lambda row: row["time_utc"]) for name, rows in catalogue.velocity.items()
+        },
+        combustion={
+            name: [
+                (max(a, start_utc), min(b, end_utc))
+                for a, b in rows
+                if b >= start_utc and a < end_utc
+            ]
+            for name, rows in catalogue.combustion.items()
+        },
+    )
+
+
+def _merge_catalogues(parts: Sequence[EventCatalogue]) -> EventCatalogue:
+    """Concatenate contiguous catalogue chunks, dropping duplicated seam events."""
+    ordered = sorted(parts, key=lambda part: part.start_utc)
+    first = ordered[0]
+    tol = CATALOGUE_SEAM_TOL
+
+    def extend(target: list, rows: list, time_of) -> None:
+        for row in rows:
+            if target and time_of(row) - time_of(target[-1]) <= tol:
+                continue
+            target.append(row)
+
+    change_time = lambda c: c.time_utc  # noqa: E731
+    merged = EventCatalogue(
+        start_utc=first.start_utc,
+        end_utc=ordered[-1].end_utc,
+        moon_pada_at_start=first.moon_pada_at_start,
+        signs_at_start=dict(first.signs_at_start),
+        retrograde_at_start=dict(first.retrograde_at_start),
+        moon_padas=[],
+        sun_ingresses=[],
+        ingresses={name: [] for name in first.ingresses},
+        stations={name: [] for name in first.stations},
+        velocity={name: [] for name in first.velocity},
+        combustion={name: [] for name in first.combustion},
+    )
+    for part in ordered:
+        extend(merged.moon_padas, part.moon_padas, change_time)
+        extend(merged.sun_ingresses, part.sun_ingresses, change_time)
+        for name, rows in part.ingresses.items():
+            extend(merged.ingresses[name], rows, change_time)
+        for name, rows in part.stations.items():
+            extend(merged.stations[name], rows, change_time)
+        for name, rows in part.velocity.items():
+            extend(merged.velocity[name], rows, lambda row: row["time_utc"])
+        for name, rows in part.combustion.items():
+            target = merged.combustion[name]
+            for a, b in rows:
+                if target and target[-1][1] == a:
+                    # Window continues across the chunk seam
+                    target[-1] = (target[-1][0], b)
+                else:
+                    target.append((a, b))
+    return merged
+
+
+def _chunk_key(dt: datetime) -> str:
+    utc = _to_utc(dt)
+    return f"{utc.year:04d}-{utc.month:02d}"
+
+
+def _chunk_bounds(chunk_key: str) -> Tuple[datetime, datetime]:
+    start = datetime.strptime(chunk_key, "%Y-%m").replace(tzinfo=timezone.utc)
+    return start, _add_month(start, 1)
+
+
+def _month_bounds(month_start_iso: str, tz_name: str) -> Tuple[datetime, datetime]:
+    month_start_local = _from_iso_local(month_start_iso, tz_name).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return month_start_local, _add_month(month_start_local, 1)
+
+
+def _month_window_chunk_keys(month_start_local: datetime, month_end_local: datetime) -> List[str]:
+    cursor = _chunk_bounds(_chunk_key(month_start_local - MONTH_WINDOW_PAD))[0]
+    end_utc = _to_utc(month_end_local + MONTH_WINDOW_PAD)
+    keys: List[str] = []
+    while cursor <= end_utc:
+        keys.append(_chunk_key(cursor))
+        cursor = _add_month(cursor, 1)
+    return keys
+
+
+def catalogue_chunk_keys(month_start_isos: Sequence[str], tz_name: str) -> List[str]:
+    """UTC month keys ('YYYY-MM') of the catalogue chunks needed to localise the months."""
+    keys = set()
+    for month_iso in month_start_isos:
+        keys.update(_month_window_chunk_keys(*_month_bounds(month_iso, tz_name)))
+    return sorted(keys)
+
+
+def compute_catalogue_chunk_sets(
+    chunk_keys: Sequence[str],
+    ayanamsas: Sequence[str],
+) -> Dict[str, Dict[str, EventCatalogue]]:
+    """Scan the ephemeris for the given UTC month chunks in several ayanamsa systems.
+
+    Consecutive chunks are scanned as one contiguous window, so a 5-year batch
+    costs one pass over ~5 years of ephemeris regardless of how many months or
+    locations are later localised from it. The tropical sampler nodes of each
+    window are shared by every system, which only adds its own refinements.
+
+    Returns:
+        Mapping of ayanamsa to ``{chunk key: EventCatalogue}``.
+    """
+    _initialise_once()
+
+    runs: List[List[Tuple[datetime, datetime]]] = []
+    for key in sorted(set(chunk_keys)):
+        bounds = _chunk_bounds(key)
+        if runs and runs[-1][-1][1] == bounds[0]:
+            runs[-1].append(bounds)
+        else:
+            runs.append([bounds])
+
+    systems = list(dict.fromkeys(ayanamsas))
+    sets: Dict[str, Dict[str, EventCatalogue]] = {ayanamsa: {} for ayanamsa in systems}
+    for run in runs:
+        scan_start = run[0][0] - CATALOGUE_SCAN_PAD
+        scan_end = run[-1][1] + CATALOGUE_SCAN_PAD
+        tropical = {
+            name: PlanetSampler(name, _julday(scan_start), _julday(scan_end), "tropical")
+            for name in PLANET_IDS
+        }
+        for ayanamsa in systems:
+            _set_ayanamsa(ayanamsa)  # Set for this thread
+            samplers = {name: sampler.with_ayanamsa(ayanamsa) for name, sampler in tropical.items()}
+            scanned = _scan_events(scan_start, scan_end, samplers)
+            for chunk_start, chunk_end in run:
+                sets[ayanamsa][_chunk_key(chunk_start)] = _slice_catalogue(
+                    scanned, chunk_start, chunk_end
+                )
+    return sets
+
+
+def compute_catalogue_chunks(
+    chunk_keys: Sequence[str],
+    ayanamsa: str = "lahiri",
+) -> Dict[str, EventCatalogue]:
+    """Scan the ephemeris for the given UTC month chunks in one ayanamsa system."""
+    return compute_catalogue_chunk_sets(chunk_keys, [ayanamsa])[ayanamsa]
+
+
+def _localise_month(
+    catalogue: EventCatalogue,
+    month_start_local: datetime,
+    month_end_local: datetime,
+    tz_name: str,
+) -> Dict[str, object]:
+    """Clip catalogue events to one local month and format them for the API.
+
+    Only events inside the month's own +-45 day window are considered, so the
+    payload does not depend on which other months were scanned alongside it.
+    """
+    start_utc = _to_utc(month_start_local - MONTH_WINDOW_PAD)
+    end_utc = _to_utc(month_end_local + MONTH_WINDOW_PAD)
+    month_start_utc = _to_utc(month_start_local)
+    month_end_utc = _to_utc(month_end_local)
+    month_start_ms = month_start_local.timestamp()
+    month_end_ms = month_end_local.timestamp()
+
+    def in_window(dt: datetime) -> bool:
+        return start_utc <= dt <= end_utc
+
+    moon_changes = [c for c in catalogue.moon_padas if in_window(c.time_utc)]
     moon_monthly: List[Dict[str, object]] = []
     if not moon_changes:
-        lon_val = moon_fn(month_start_local)
-        if math.isfinite(lon_val):
-            idx, pada = _pada_index_from_lon(lon_val)
-            name = NAKSHATRA_NAMES[idx % len(NAKSHATRA_NAMES)]
-            moon_monthly.append(
-                {
-                    "timeISO": month_start_local.strftime("%Y-%m-%d %H:%M:%S"),
-                    "nakshatra": name,
-                    "pada": pada,
-                }
-            )
+        segment = _index_at(catalogue.moon_padas, catalogue.moon_pada_at_start, month_start_utc)
+        idx, pada = _pada_from_segment_index(segment)
+        name = NAKSHATRA_NAMES[idx % len(NAKSHATRA_NAMES)]
+        moon_monthly.append(
+            {
+                "timeISO": month_start_local.strftime("%Y-%m-%d %H:%M:%S"),
+                "nakshatra": name,
+                "pada": pada,
+            }
+        )
     for change in moon_changes:
         local_str = _format_local(change.time_utc, tz_name)
         local_dt = _from_iso_local(local_str, tz_name)
@@ -1052,9 +2084,10 @@ def compute_monthly(
                 }
             )
 
-    sun_changes = _find_sign_changes(sun_fn, start_utc, end_utc, 120)
     sun_rows = []
-    for change in sun_changes:
+    for change in catalogue.sun_ingresses:
+        if not in_window(change.time_utc):
+            continue
         local_str = _format_local(change.time_utc, tz_name)
         local_dt = _from_iso_local(local_str, tz_name)
         ms = local_dt.timestamp()
@@ -1069,13 +2102,14 @@ def compute_monthly(
 
     planet_rows: List[Dict[str, object]] = []
     for planet_name in PLANET_INGRESS_NAMES:
-        coarse = 30 if planet_name == "Mercury" else 60 if planet_name == "Venus" else 240
-        planet_fn = _planet_lon_fn(planet_name)  # type: ignore[arg-type]
-        changes = _find_sign_changes(planet_fn, start_utc, end_utc, coarse)
+        all_changes = catalogue.ingresses[planet_name]
+        changes = [c for c in all_changes if in_window(c.time_utc)]
         if not changes:
             anchor_local = month_start_local
-            lon_val = planet_fn(anchor_local)
-            sign_name = RASHI[_sign_index(lon_val)]
+            sign_index = _index_at(
+                all_changes, catalogue.signs_at_start[planet_name], month_start_utc
+            )
+            sign_name = RASHI[sign_index]
             planet_rows.append(
                 {
                     "body": planet_name,
@@ -1101,8 +2135,7 @@ def compute_monthly(
 
     velocity_rows: List[Dict[str, object]] = []
     for planet_name in VELOCITY_PLANETS:
-        events = _velocity_extrema_for_planet(planet_name, start_utc, end_utc)
-        for entry in events:
+        for entry in catalogue.velocity[planet_name]:
             local_str = _format_local(entry["time_utc"], tz_name)  # type: ignore[index]
             local_dt = _from_iso_local(local_str, tz_name)
             ms = local_dt.timestamp()
@@ -1120,23 +2153,12 @@ def compute_monthly(
     comb_rows: List[Dict[str, object]] = []
 
     for planet_name in STATION_PLANET_NAMES:
-        planet_fn = _planet_lon_fn(planet_name)  # type: ignore[arg-type]
-        speed_fn = _planet_speed_fn(planet_name)  # type: ignore[arg-type]
-        events = _find_stations(
-            planet_fn,
-            start_utc,
-            end_utc,
-            60,
-            speed_fn,
-            planet_name=planet_name,
-        )
+        all_events = catalogue.stations[planet_name]
+        events = [ev for ev in all_events if in_window(ev.time_utc)]
         if not events:
             continue
-        initial_speed = speed_fn(start_utc)
-        initial_retro = (
-            initial_speed < 0
-            if isinstance(initial_speed, (int, float)) and math.isfinite(initial_speed)
-            else _velocity_deg_per_hr(planet_fn, start_utc) < 0
+        initial_retro = _retrograde_at(
+            all_events, catalogue.retrograde_at_start[planet_name], start_utc
         )
         sorted_events = sorted(events, key=lambda ev: ev.time_utc)
         retro_start: Optional[datetime] = start_utc if initial_retro else None
@@ -1167,21 +2189,13 @@ def compute_monthly(
                 }
             )
 
-    for planet_name, orb in COMBUSTION_ORBS.items():
-        if orb <= 0:
-            continue
-        planet_fn = _planet_lon_fn(planet_name)  # type: ignore[arg-type]
-        comb_windows = _find_combustion(
-            sun_fn,
-            planet_fn,
-            start_utc,
-            end_utc,
-            orb,
-            60,
-        )
+    for planet_name, comb_windows in catalogue.combustion.items():
+        orb = COMBUSTION_ORBS[planet_name]
         for start_win, end_win in comb_windows:
-            start_iso = _format_local(start_win, tz_name)
-            end_iso = _format_local(end_win, tz_name)
+            if end_win < start_utc or start_win > end_utc:
+                continue
+            start_iso = _format_local(max(start_win, start_utc), tz_name)
+            end_iso = _format_local(min(end_win, end_utc), tz_name)
             start_ms = _from_iso_local(start_iso, tz_name).timestamp()
             end_ms = _from_iso_local(end_iso, tz_name).timestamp()
             if end_ms < month_start_ms or start_ms >= month_end_ms:
@@ -1227,6 +2241,83 @@ def compute_monthly(
     }
 
 
+def localise_months(
+    chunks: Dict[str, EventCatalogue],
+    tz_name: str,
+    month_start_isos: Sequence[str],
+) -> Dict[str, Dict[str, object]]:
+    """Build per-month payloads for one timezone from UTC catalogue chunks.
+
+    ``chunks`` must contain every key from :func:`catalogue_chunk_keys` for the
+    same months and timezone. No ephemeris calls are made here.
+    """
+    payloads: Dict[str, Dict[str, object]] = {}
+    for month_iso in month_start_isos:
+        month_start_local, month_end_local = _month_bounds(month_iso, tz_name)
+        keys = _month_window_chunk_keys(month_start_local, month_end_local)
+        catalogue = _merge_catalogues([chunks[key] for key in keys])
+        payloads[month_iso] = _localise_month(catalogue, month_start_local, month_end_local, tz_name)
+    return payloads
+
+
+def compute_monthly_range(
+    tz_name: str,
+    month_start_isos: Sequence[str],
+    ayanamsa: str = "lahiri",
+) -> Dict[str, Dict[str, object]]:
+    """Compute monthly payloads for several months from shared ephemeris scans.
+
+    The UTC catalogue chunks covering every month's +-45 day window are scanned
+    contiguously and then sliced into the same per-month payloads that
+    :func:`compute_monthly` returns. A 12-month batch therefore scans ~15 months
+    of ephemeris instead of ~48.
+
+    Returns:
+        Mapping of each requested ``month_start_iso`` to its payload.
+    """
+    chunks = compute_catalogue_chunks(catalogue_chunk_keys(month_start_isos, tz_name), ayanamsa)
+    return localise_months(chunks, tz_name, month_start_isos)
+
+
+def compute_monthly_systems(
+    tz_name: str,
+    month_start_isos: Sequence[str],
+    ayanamsas: Sequence[str],
+) -> Dict[str, Dict[str, Dict[str, object]]]:
+    """Compute monthly payloads for several ayanamsa systems from one ephemeris scan.
+
+    Returns:
+        Mapping of ayanamsa to ``{month_start_iso: payload}``.
+    """
+    keys = catalogue_chunk_keys(month_start_isos, tz_name)
+    return {
+        ayanamsa: localise_months(chunks, tz_name, month_start_isos)
+        for ayanamsa, chunks in compute_catalogue_chunk_sets(keys, ayanamsas).items()
+    }
+
+
+def compute_monthly(
+    lat: float,
+    lon: float,
+    tz_name: str,
+    month_start_iso: str,
+    ayanamsa: str = "lahiri",
+) -> Dict[str, object]:
+    """Compute monthly planetary events using the specified ayanamsa system.
+
+    The events are geocentric, so only the timezone (which sets the local month
+    and the reported times) affects the result.
+
+    Args:
+        lat: Latitude (unused; kept for existing callers)
+        lon: Longitude (unused; kept for existing callers)
+        tz_name: Timezone name (e.g., 'Asia/Kolkata')
+        month_start_iso: Month start in ISO format (e.g., '2025-01-01')
+        ayanamsa: Ayanamsa system ('lahiri', 'raman', or 'tropical')
+    """
+    return compute_monthly_range(tz_name, [month_start_iso], ayanamsa)[month_start_iso]
+
+
 def compute_planetary_timeseries(
     planet: str,
     timestamps: List[int],  # Unix timestamps in seconds
@@ -1242,6 +2333,8 @@ def compute_planetary_timeseries(
         List of dicts with 'time' (timestamp) and 'longitude' (degrees 0-360)
     """
     _initialise_once()
+    # Pinned so a reused worker never inherits the previous request's ayanamsa
+    _set_ayanamsa("lahiri")
 
     if planet not in PLANET_IDS and planet != "Ketu":
         raise ValueError(f"Unknown planet: {planet}")
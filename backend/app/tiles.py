@@ -0,0 +1,155 @@
+"""Tiles for overlay time series.
+
+Overlay points lie on a grid ``start + k * step``. Two windows whose starts
+differ by whole steps share that grid, which :func:`grid_key` names by step and
+phase. Series are cached a tile of grid points at a time, numbered from the
+Unix epoch, so a window that is panned, widened or zoomed is assembled from
+tiles already computed plus only the ones still missing.
+
+Tiles come in the sizes of ``TILE_SIZES``, each dividing the next, so tiles of
+one grid nest. A window computes missing tiles of the largest size that fits in
+it (short windows stay cheap, long ones need few tiles), but first uses any
+cached tile of another size: a larger one containing a tile, or smaller ones
+filling part of it, with only the rest computed at the smaller size.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+from .utils import ResponseCache
+
+T = TypeVar("T")
+
+TILE_SIZES = (32, 256, 2048)  # grid points per tile
+
+
+class TileSpan(NamedTuple):
+    index: int  # tile number counted from the epoch
+    first: datetime  # first grid point of the tile
+    count: int  # grid points in the tile
+
+    @property
+    def key(self) -> str:
+        """Cache key suffix; tiles of each size are numbered independently."""
+        return f"{self.count}:{self.index}"
+
+
+def _origin(start: datetime, step: timedelta) -> datetime:
+    """First grid point at or after the Unix epoch (naive or aware, like ``start``)."""
+    epoch = datetime(1970, 1, 1, tzinfo=start.tzinfo)
+    return epoch + (start - epoch) % step
+
+
+def grid_key(start: datetime, step: timedelta) -> str:
+    """Identifies the grid through ``start``: windows with the same key can share tiles."""
+    phase = _origin(start, step) - datetime(1970, 1, 1, tzinfo=start.tzinfo)
+    return f"{step // timedelta(microseconds=1)}us+{phase // timedelta(microseconds=1)}us"
+
+
+def tile_points(count: int) -> int:
+    """Size of the tiles computed for a window of ``count`` grid points."""
+    return max([size for size in TILE_SIZES if size <= count], default=TILE_SIZES[0])
+
+
+def tile_spans(start: datetime, end: datetime, step: timedelta, points: Optional[int] = None) -> List[TileSpan]:
+    """Tiles of the grid through ``start`` that overlap ``[start, end]``, sized for the window by default."""
+    if points is None:
+        points = tile_points((end - start) // step + 1)
+    origin = _origin(start, step)
+    first_index = (start - origin) // step // points
+    last_index = (end - origin) // step // points
+    return [
+        TileSpan(index, origin + index * points * step, points)
+        for index in range(first_index, max(first_index, last_index) + 1)
+    ]
+
+
+def window_slice(span: TileSpan, start: datetime, end: datetime, step: timedelta) -> slice:
+    """Positions of the points of ``span`` that fall inside ``[start, end]``."""
+    lo = max(0, -((span.first - start) // step))
+    hi = min(span.count, (end - span.first) // step + 1)
+    return slice(lo, max(lo, hi))
+
+
+def cover_spans(
+    start: datetime, end: datetime, step: timedelta, cached: Callable[[TileSpan], bool]
+) -> List[TileSpan]:
+    """Tiles of any size that together cover ``[start, end]`` in order, preferring ``cached`` ones.
+
+    Tiles of the window's size are replaced by a cached larger tile holding them,
+    or by smaller tiles when some of those are cached.
+    """
+    points = tile_points((end - start) // step + 1)
+    level = TILE_SIZES.index(points)
+    origin = _origin(start, step)
+    first, last = (start - origin) // step, (end - origin) // step
+    seen: Dict[TileSpan, bool] = {}
+
+    def hit(span: TileSpan) -> bool:
+        if span not in seen:
+            seen[span] = cached(span)
+        return seen[span]
+
+    def span_at(index: int, size: int) -> TileSpan:
+        return TileSpan(index, origin + index * size * step, size)
+
+    def split(span: TileSpan, level: int) -> Tuple[List[TileSpan], bool]:
+        if hit(span):
+            return [span], True
+        if level == 0:
+            return [span], False
+        size = TILE_SIZES[level - 1]
+        ratio = span.count // size
+        parts: List[TileSpan] = []
+        found = False
+        for index in range(max(span.index * ratio, first // size), min((span.index + 1) * ratio, last // size + 1)):
+            sub, sub_found = split(span_at(index, size), level - 1)
+            parts.extend(sub)
+            found = found or sub_found
+        return (parts, True) if found else ([span], False)
+
+    spans: List[TileSpan] = []
+    for span in tile_spans(start, end, step, points):
+        larger = None
+        if not hit(span):
+            larger = next(
+                (
+                    outer
+                    for outer in (span_at(span.index * points // size, size) for size in TILE_SIZES[level + 1 :])
+                    if hit(outer)
+                ),
+                None,
+            )
+        if larger is not None:
+            if not spans or spans[-1] != larger:
+                spans.append(larger)
+        else:
+            spans.extend(split(span, level)[0])
+    return spans
+
+
+async def load_tiles(
+    cache: ResponseCache,
+    prefix: str,
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    compute: Callable[[TileSpan], Awaitable[T]],
+) -> List[Tuple[TileSpan, T]]:
+    """Tiles covering ``[start, end]``, from ``cache`` under ``prefix|span.key`` or computed concurrently."""
+    tiles: Dict[TileSpan, T] = {}
+
+    def cached(span: TileSpan) -> bool:
+        tile = cache.get(f"{prefix}|{span.key}")
+        if tile is not None:
+            tiles[span] = tile
+        return tile is not None
+
+    spans = cover_spans(start, end, step, cached)
+    missing = [span for span in spans if span not in tiles]
+    for span, tile in zip(missing, await asyncio.gather(*(compute(span) for span in missing))):
+        cache.set(f"{prefix}|{span.key}", tile)
+        tiles[span] = tile
+    return [(span, tiles[span]) for span in spans]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _make_bars(start, end, periods: Optional[int], freq: str, offset: float) -> pd.DataFrame:
+    """OHLCV bars on a UTC date range, opening at ``100 + offset`` and rising by one per bar."""
+    index = pd.date_range(start, end, periods=periods, freq=freq, tz="UTC")
+    opens = 100.0 + offset + np.arange(len(index), dtype=float)
+    return pd.DataFrame(
+        {"Open": opens, "High": opens + 1.0, "Low": opens - 1.0, "Close": opens + 0.5, "Volume": 10.0},
+        index=index,
+    )
+
+
+@pytest.fixture
+def bar_csv(tmp_path) -> Callable[..., pd.DataFrame]:
+    """Writes bars as ``CsvProvider(tmp_path)`` reads them and returns them.
+
+    ``bar_csv(symbol, start, end, periods=, freq=, offset=, interval=)`` takes the
+    date range of ``pd.date_range`` (business days by default); ``until`` writes
+    only the bars up to that time, as if later ones were not published yet.
+    """
+
+    def write(
+        symbol: str,
+        start=None,
+        end=None,
+        *,
+        periods: Optional[int] = None,
+        freq: str = "B",
+        offset: float = 0.0,
+        interval: str = "1d",
+        until=None,
+    ) -> pd.DataFrame:
+        bars = _make_bars(start, end, periods, freq, offset)
+        (bars if until is None else bars[bars.index <= until]).to_csv(tmp_path / f"{symbol}_{interval}.csv")
+        return bars
+
+    return write
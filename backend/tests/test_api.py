@@ -35,3 +35,222 @@ def test_btc_usd_intraday() -> None:
     assert response.status_code == 200
     _assert_candles_payload(response.json())
 
+
+
+def test_ohlc_slices_cached_wider_period(monkeypatch) -> None:
+    import pandas as pd
+
+    from app import main
+
+    index = pd.date_range(end=pd.Timestamp.now(tz="UTC").normalize(), periods=730, freq="D")
+    bars = pd.DataFrame({"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 10.0}, index=index)
+    periods = []
+
+    async def fake_fetch(symbol, interval, period):
+        periods.append(period)
+        return bars
+
+    monkeypatch.setattr(main, "fetch_bars_async", fake_fetch)
+    params = {"symbol": "SLICE", "interval": "1d"}
+    wide = client.get("/api/ohlc", params={**params, "period": "2y"}).json()
+    narrow = client.get("/api/ohlc", params={**params, "period": "6mo"}).json()
+    start, end = wide[100]["time"], wide[200]["time"]
+    ranged = client.get("/api/ohlc", params={**params, "start": start, "end": end}).json()
+
+    assert periods == ["2y"]
+    assert narrow == [row for row in wide if row["time"] >= narrow[0]["time"]]
+    assert ranged == wide[100:200]
+
+
+def test_ohlc_batch_uses_one_multi_ticker_download(tmp_path, bar_csv, monkeypatch) -> None:
+    import json
+
+    import pandas as pd
+
+    from app import utils
+    from app.bar_store import BarStore, CsvProvider
+
+    for offset, symbol in enumerate(("AAA", "BBB", "CCC")):
+        bar_csv(symbol, end=pd.Timestamp.now(tz="UTC").normalize(), periods=300, offset=offset)
+
+    class CountingProvider(CsvProvider):
+        batches: list[list[str]] = []
+
+        def download_many(self, symbols, interval, *, period):
+            self.batches.append(list(symbols))
+            return super().download_many(symbols, interval, period=period)
+
+    provider = CountingProvider(tmp_path)
+    store = BarStore(tmp_path / "store", provider)
+    monkeypatch.setattr(utils, "get_bar_store", lambda: store)
+
+    response = client.post(
+        "/api/ohlc/batch", json={"symbols": ["aaa", "BBB", "CCC", "MISSING"], "interval": "1d", "period": "6mo"}
+    )
+    assert response.status_code == 200
+    lines = {row["symbol"]: row for row in map(json.loads, response.text.splitlines())}
+
+    assert provider.batches == [["AAA", "BBB", "CCC", "MISSING"]]
+    assert set(lines) == {"AAA", "BBB", "CCC", "MISSING"}
+    assert lines["MISSING"]["status"] == 502
+    single = client.get("/api/ohlc", params={"symbol": "BBB", "interval": "1d", "period": "6mo"}).json()
+    assert lines["BBB"]["candles"] == single
+    _assert_candles_payload(lines["AAA"]["candles"])
+
+    # A shorter period is sliced from the bars just fetched, without another download
+    response = client.post("/api/ohlc/batch", json={"symbols": ["AAA", "BBB"], "interval": "1d", "period": "3mo"})
+    narrower = {row["symbol"]: row for row in map(json.loads, response.text.splitlines())}
+    assert len(provider.batches) == 1
+    assert 0 < len(narrower["BBB"]["candles"]) < len(single)
+
+
+def test_ohlc_batch_falls_back_per_symbol_when_the_batch_fails(tmp_path, bar_csv, monkeypatch) -> None:
+    import json
+
+    import pandas as pd
+
+    from app import main, utils
+    from app.bar_store import BarStore, CsvProvider
+
+    for offset, symbol in enumerate(("FFA", "FFB")):
+        bar_csv(symbol, end=pd.Timestamp.now(tz="UTC").normalize(), periods=300, offset=offset)
+
+    class UnwritableStore(BarStore):
+        def add(self, symbol, *args, **kwargs):
+            if symbol == "FFA":
+                raise OSError("disk full")
+            return super().add(symbol, *args, **kwargs)
+
+    store = UnwritableStore(tmp_path / "store", CsvProvider(tmp_path))
+    monkeypatch.setattr(utils, "get_bar_store", lambda: store)
+    request = {"symbols": ["FFA", "FFB"], "interval": "1d", "period": "6mo"}
+
+    # A symbol the store cannot take is fetched on its own; the others keep the batch result
+    response = client.post("/api/ohlc/batch", json=request)
+    lines = {row["symbol"]: row for row in map(json.loads, response.text.splitlines())}
+    assert set(lines) == {"FFA", "FFB"} and all("candles" in row for row in lines.values())
+
+    # An unexpected error from the whole batch still leaves every symbol a line
+    async def failing(*args):
+        raise RuntimeError("provider returned a malformed frame")
+
+    monkeypatch.setattr(main, "fetch_bars_many_async", failing)
+    response = client.post("/api/ohlc/batch", json={**request, "period": "1y"})
+    lines = {row["symbol"]: row for row in map(json.loads, response.text.splitlines())}
+    assert set(lines) == {"FFA", "FFB"} and all("candles" in row for row in lines.values())
+
+
+def test_weight_changes_reuse_object_tiles(monkeypatch) -> None:
+    from app import main, orbital
+
+    monkeypatch.setenv("COMPUTE_WORKERS", "0")
+    monkeypatch.setattr(orbital, "EPHEMERIS_PATH", "missing.bsp")
+    calls = []
+    original = main.compute_object_tiles
+
+    def counting(**kwargs):
+        calls.append(kwargs)
+        return original(**kwargs)
+
+    monkeypatch.setattr(main, "compute_object_tiles", counting)
+    payload = {
+        "objects": ["mars", "venus"],
+        "startISO": "2024-03-01",
+        "durationUnit": "days",
+        "durationValue": 20,
+        "plotWeightedGeo": True,
+    }
+    responses = [
+        client.post("/api/orbit/overlay", json={**payload, "weights": {"mars": 1.0, "venus": weight}})
+        for weight in (0.0, 2.0)
+    ]
+    assert [response.status_code for response in responses] == [200, 200]
+    assert len(calls) == 1
+
+    series = [response.json()["series"][0] for response in responses]
+    assert series[0]["key"] == "weighted_geo_declination"
+    assert series[0]["values"] != series[1]["values"]
+    direct = orbital.compute_overlay_series(
+        objects=["mars", "venus"],
+        start_iso="2024-03-01",
+        duration_unit="days",
+        duration_value=20,
+        plot_speed=False,
+        plot_grav_force=False,
+        plot_geo_declination=False,
+        plot_helio_declination=False,
+        plot_weighted_geo=True,
+        plot_weighted_helio=False,
+        weights={"mars": 1.0, "venus": 2.0},
+    )
+    assert series[1]["values"] == direct[0].values
+
+
+def test_overlapping_overlay_windows_reuse_tiles(monkeypatch) -> None:
+    from datetime import datetime, timedelta
+
+    from app import main, overlays
+
+    monkeypatch.setenv("COMPUTE_WORKERS", "0")
+    calls = []
+
+    def counting(start_dt, end_dt, interval_hours):
+        calls.append((start_dt, end_dt))
+        return overlays.calculate_tidal_overlay(start_dt, end_dt, interval_hours)
+
+    monkeypatch.setattr(main, "calculate_tidal_overlay", counting)
+    start = datetime(2033, 2, 9, 5)
+    window = {"startISO": start.isoformat(), "durationUnit": "days", "durationValue": 45, "intervalHours": 6}
+    assert client.post("/api/overlay/tidal", json=window).status_code == 200
+    cold = [end - begin for begin, end in calls]
+    # 181 points are computed as 32-point tiles: at most seven of them
+    assert len(cold) <= 7 and all(span == timedelta(hours=6 * 31) for span in cold)
+
+    panned_start = start + timedelta(days=10)
+    panned = {**window, "startISO": panned_start.isoformat()}
+    response = client.post("/api/overlay/tidal", json=panned)
+    assert response.status_code == 200
+    # Only tiles past the end of the first window are computed
+    assert 0 < len(calls) - len(cold) <= 2
+    assert all(begin > start + timedelta(days=45) for begin, _ in calls[len(cold) :])
+
+    series = response.json()["series"][0]
+    direct = overlays.calculate_tidal_overlay(panned_start, panned_start + timedelta(days=45), 6)
+    assert series["timestamps"] == [row["timestamp"] for row in direct]
+    assert series["values"] == [row["total_tidal_force"] for row in direct]
+
+
+def test_widened_and_zoomed_overlay_windows_reuse_tiles(monkeypatch) -> None:
+    from datetime import datetime, timedelta
+
+    from app import main, overlays
+
+    monkeypatch.setenv("COMPUTE_WORKERS", "0")
+    calls = []
+
+    def counting(start_dt, end_dt, interval_hours):
+        calls.append((start_dt, end_dt))
+        return overlays.calculate_tidal_overlay(start_dt, end_dt, interval_hours)
+
+    monkeypatch.setattr(main, "calculate_tidal_overlay", counting)
+    start = datetime(2034, 7, 3, 11)
+    window = {"startISO": start.isoformat(), "durationUnit": "days", "durationValue": 30, "intervalHours": 6}
+    assert client.post("/api/overlay/tidal", json=window).status_code == 200
+    cold = len(calls)
+
+    widened_start = start - timedelta(days=120)
+    widened = {**window, "startISO": widened_start.isoformat(), "durationValue": 365}
+    response = client.post("/api/overlay/tidal", json=widened)
+    assert response.status_code == 200
+    # Widening to a year computes larger tiles but none of the points already computed
+    assert all(end < start or begin > start + timedelta(days=30) for begin, end in calls[cold:])
+    series = response.json()["series"][0]
+    direct = overlays.calculate_tidal_overlay(widened_start, widened_start + timedelta(days=365), 6)
+    assert series["timestamps"] == [row["timestamp"] for row in direct]
+
+    # Zooming into the year is served from its tiles alone
+    widened_calls = len(calls)
+    for days in (3, 40, 200):
+        zoomed = {**window, "startISO": (widened_start + timedelta(days=days)).isoformat(), "durationValue": 10}
+        assert client.post("/api/overlay/tidal", json=zoomed).status_code == 200
+    assert len(calls) == widened_calls
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.bar_store import BarStore, CsvProvider
+
+
+class RecordingProvider(CsvProvider):
+    def __init__(self, directory) -> None:
+        super().__init__(directory)
+        self.calls: list[tuple[str | None, pd.Timestamp | None]] = []
+
+    def download(self, symbol, interval, *, period=None, start=None):
+        self.calls.append((period, start))
+        return super().download(symbol, interval, period=period, start=start)
+
+
+def test_bar_store_downloads_only_new_bars(tmp_path, bar_csv) -> None:
+    bars = bar_csv("AAPL", "2018-01-01", "2024-06-28", until="2024-06-20")
+    provider = RecordingProvider(tmp_path)
+    store = BarStore(tmp_path / "store", provider)
+
+    first = store.load("AAPL", "1d", "2y", now=pd.Timestamp("2024-06-20 22:00", tz="UTC"))
+    assert provider.calls == [("2y", None)]
+
+    bar_csv("AAPL", "2018-01-01", "2024-06-28")
+    now = pd.Timestamp("2024-06-28 22:00", tz="UTC")
+    second = store.load("AAPL", "1d", "1y", now=now)
+    # Covered by the stored two years: only bars from the last complete stored one are fetched
+    assert provider.calls[1:] == [(None, first.index[-2])]
+    expected = bars[bars.index >= now - pd.DateOffset(years=1)]
+    assert second.index.equals(expected.index)
+    assert np.array_equal(second.to_numpy(), expected.to_numpy())
+
+    # A longer period than stored falls back to one full download
+    store.load("AAPL", "1d", "5y", now=now)
+    assert provider.calls[-1] == ("5y", None)
+
+
+def test_coarser_interval_is_derived_from_fresh_stored_bars(tmp_path, bar_csv, monkeypatch) -> None:
+    from app import utils
+
+    end = pd.Timestamp.now(tz="UTC").floor("60min")
+    bar_csv("AAPL", end=end, periods=24 * 200, freq="60min", interval="60m")
+    provider = RecordingProvider(tmp_path)
+    store = BarStore(tmp_path / "store", provider)
+    monkeypatch.setattr(utils, "get_bar_store", lambda: store)
+
+    store.load("AAPL", "60m", "6mo")
+    calls = len(provider.calls)
+    derived = utils.fetch_bars("AAPL", "1d", "6mo")
+    assert len(provider.calls) == calls
+    expected = utils.resample_bars(store.peek("AAPL", "60m", "6mo", max_age=60), "1d")
+    assert derived.equals(expected)
+
+    # Stale stored bars are not trusted
+    assert store.peek("AAPL", "60m", "6mo", max_age=-1) is None
+
+    # Nor are bars freshly written but ending long ago, e.g. after failed downloads
+    bar_csv("MSFT", end=end - pd.Timedelta(days=90), periods=24 * 200, freq="60min", interval="60m")
+    store.load("MSFT", "60m", "max")
+    assert store.peek("MSFT", "60m", "1y", max_age=60) is None
+
+
+class FailingDeltaProvider(RecordingProvider):
+    """Answers delta downloads with an empty frame, as yfinance does when a fetch fails."""
+
+    def download(self, symbol, interval, *, period=None, start=None):
+        bars = super().download(symbol, interval, period=period, start=start)
+        return bars.iloc[:0] if start is not None else bars
+
+
+def test_empty_delta_is_not_treated_as_up_to_date(tmp_path, bar_csv) -> None:
+    bar_csv("AAPL", "2024-01-01", "2024-06-28", until="2024-03-29")
+    provider = FailingDeltaProvider(tmp_path)
+    store = BarStore(tmp_path / "store", provider)
+    store.load("AAPL", "1d", "6mo", now=pd.Timestamp("2024-03-29 22:00", tz="UTC"))
+
+    bars = bar_csv("AAPL", "2024-01-01", "2024-06-28")
+    now = pd.Timestamp("2024-06-28 22:00", tz="UTC")
+    recent = store.load("AAPL", "1d", "5d", now=now)
+    # The failed delta falls through to a full download of the period
+    assert provider.calls[-2:] == [(None, pd.Timestamp("2024-03-28", tz="UTC")), ("5d", None)]
+    assert recent.index.equals(bars.index[-5:])
+
+    # When the full download fails too, nothing is served or marked fresh
+    meta_path = tmp_path / "store" / "AAPL" / "1d.json"
+    meta = meta_path.read_text()
+    (tmp_path / "AAPL_1d.csv").unlink()
+    assert store.load("AAPL", "1d", "5d", now=now).empty
+    assert meta_path.read_text() == meta
+
+
+def test_split_or_old_download_replaces_stored_bars(tmp_path, bar_csv, monkeypatch) -> None:
+    from app import bar_store
+
+    bars = bar_csv("AAPL", "2024-01-01", "2024-06-28", until="2024-03-29")
+    provider = RecordingProvider(tmp_path)
+    store = BarStore(tmp_path / "store", provider)
+    store.load("AAPL", "1d", "6mo", now=pd.Timestamp("2024-03-29 22:00", tz="UTC"))
+
+    # A 2:1 split: Yahoo now serves the whole history halved
+    split = bars / [2, 2, 2, 2, 1]
+    split.to_csv(tmp_path / "AAPL_1d.csv")
+    now = pd.Timestamp("2024-06-28 22:00", tz="UTC")
+    loaded = store.load("AAPL", "1d", "6mo", now=now)
+    assert provider.calls[-2:] == [(None, pd.Timestamp("2024-03-28", tz="UTC")), ("6mo", None)]
+    assert np.array_equal(loaded["Close"].to_numpy(), split["Close"].to_numpy())
+    assert store.peek("AAPL", "1d", "6mo", max_age=60, now=now).index.equals(split.index)
+
+    # Without a split, history is still downloaded afresh once the last full download is old
+    store.load("AAPL", "1d", "6mo", now=now)
+    assert provider.calls[-1][0] is None
+    clock = time.time()
+    monkeypatch.setattr(bar_store.time, "time", lambda: clock + bar_store.DEFAULT_REFRESH_AFTER + 1)
+    store.load("AAPL", "1d", "6mo", now=now)
+    assert provider.calls[-1] == ("6mo", None)
+
+
+def test_prune_bounds_store_size_and_age(tmp_path, bar_csv, monkeypatch) -> None:
+    from app import bar_store
+
+    for offset, symbol in enumerate(("AAPL", "MSFT", "TSLA")):
+        bar_csv(symbol, "2024-01-01", "2024-06-28", offset=offset)
+    store = BarStore(tmp_path / "store", CsvProvider(tmp_path))
+    clock = time.time()
+    for offset, symbol in enumerate(("AAPL", "MSFT", "TSLA")):
+        monkeypatch.setattr(bar_store.time, "time", lambda offset=offset: clock + offset)
+        store.load(symbol, "1d", "6mo")
+    stored = lambda: sorted(path.parent.name for path in (tmp_path / "store").glob("*/*.npy"))
+
+    # Least recently topped up series go first once the store is over its size
+    size = sum(path.stat().st_size for path in (tmp_path / "store" / "TSLA").iterdir())
+    store.max_bytes = 2 * size
+    store.prune()
+    assert stored() == ["MSFT", "TSLA"]
+
+    # Series untouched for longer than max_age go regardless of size
+    monkeypatch.setattr(bar_store.time, "time", lambda: clock + store.max_age + 1.5)
+    store.max_bytes = bar_store.DEFAULT_MAX_BYTES
+    store.prune()
+    assert stored() == ["TSLA"]
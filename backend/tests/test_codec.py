@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from app.codec import decode_month, encode_month
+from app.swiss import compute_monthly_range
+
+MUMBAI = (19.0760, 72.8777, "Asia/Kolkata")
+
+
+def test_monthly_payloads_round_trip_packed() -> None:
+    months = ["2024-03-01", "2024-04-01"]
+    for data in compute_monthly_range(MUMBAI[2], months, "lahiri").values():
+        blob = encode_month(data)
+        assert blob[:2] == b"M1"
+        assert decode_month(blob) == data
+
+
+def test_unexpected_payloads_fall_back_to_json() -> None:
+    data = {"moonMonthlyRows": [{"timeISO": "2024-03-01T00:00:00+05:30", "nakshatra": "Swati", "pada": 4}]}
+    blob = encode_month(data)
+    assert blob[:2] == b"M0"
+    assert decode_month(blob) == data
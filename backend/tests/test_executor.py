@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from app import executor
+
+
+def test_default_worker_count_scales_with_cpus_and_memory(monkeypatch) -> None:
+    monkeypatch.delenv("COMPUTE_WORKERS", raising=False)
+    monkeypatch.setattr(executor, "_available_cpus", lambda: 64)
+    monkeypatch.setattr(executor, "_available_memory", lambda: 64 * 2**30)
+    assert executor.worker_count() == 64
+    monkeypatch.setattr(executor, "_available_memory", lambda: 2 * 2**30)
+    assert executor.worker_count() == 2**30 // executor.WORKER_MEMORY_BYTES
+    monkeypatch.setattr(executor, "_available_memory", lambda: None)
+    assert executor.worker_count() == 64
+    monkeypatch.setattr(executor, "_available_cpus", lambda: 1)
+    assert executor.worker_count() == 1
+    monkeypatch.setenv("COMPUTE_WORKERS", "8")
+    assert executor.worker_count() == 8
+
+
+def test_broken_pool_is_replaced_once(monkeypatch) -> None:
+    monkeypatch.setenv("COMPUTE_WORKERS", "1")
+    executor.shutdown_pool()
+    try:
+        broken = executor._get_pool()
+        replacement = executor._replace_broken_pool(broken)
+        assert replacement is not broken
+        # A second caller that saw the same broken pool keeps the healthy replacement
+        assert executor._replace_broken_pool(broken) is replacement
+        assert executor._get_pool() is replacement
+    finally:
+        executor.shutdown_pool()
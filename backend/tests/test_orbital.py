@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+from astropy.coordinates import GCRS, SkyCoord
+from astropy.time import Time
+
+from app import orbital
+from app.orbital import _body_position, compute_overlay_series
+
+
+def _overlay(**flags):
+    options = dict(
+        plot_speed=False,
+        plot_grav_force=False,
+        plot_geo_declination=False,
+        plot_helio_declination=False,
+        plot_weighted_geo=False,
+        plot_weighted_helio=False,
+    )
+    options.update(flags)
+    return compute_overlay_series(
+        objects=["Sun", "Mars"], start_iso="2024-01-01", duration_unit="days", duration_value=10, **options
+    )
+
+
+def test_overlay_series_match_per_timestamp_evaluation(monkeypatch) -> None:
+    monkeypatch.setattr(orbital, "EPHEMERIS_PATH", "missing.bsp")
+    series = _overlay(plot_grav_force=True, plot_geo_declination=True, plot_helio_declination=True)
+    by_key = {item.key: item for item in series}
+    assert set(by_key) == {
+        "sun_force", "mars_force", "sun_geo_dec", "mars_geo_dec", "sun_helio_dec", "mars_helio_dec"
+    }
+    assert len(by_key["mars_geo_dec"].values) == 11
+
+    position = _body_position("mars", Time("2024-01-06"))
+    expected = SkyCoord(position).transform_to(GCRS(obstime=position.obstime)).dec.degree
+    assert np.isclose(by_key["mars_geo_dec"].values[5], expected)
+
+
+def test_series_share_cached_positions(monkeypatch) -> None:
+    monkeypatch.setattr(orbital, "EPHEMERIS_PATH", "missing.bsp")
+    calls = []
+    original = orbital._body_position
+
+    def counting(name, time):
+        calls.append(name)
+        return original(name, time)
+
+    monkeypatch.setattr(orbital, "_body_position", counting)
+    orbital._position_cache.clear()
+    _overlay(plot_speed=True, plot_grav_force=True, plot_geo_declination=True)
+    _overlay(plot_geo_declination=True)
+    assert sorted(calls) == ["mars", "sun"]
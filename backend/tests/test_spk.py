@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.spk import J2000, SpkKernel
+
+
+def _write_kernel(path, segments) -> None:
+    """Minimal little-endian SPK: one summary record, then type 2 segments."""
+    data: list[np.ndarray] = []
+    summaries = []
+    address = 3 * 128 + 1  # after the file, summary and name records
+    for target, center, init, length, coefficients in segments:
+        count, _, degree = coefficients.shape
+        records = np.empty((count, 2 + 3 * degree))
+        records[:, 0] = init + length * (np.arange(count) + 0.5)
+        records[:, 1] = length / 2
+        records[:, 2:] = coefficients.reshape(count, -1)
+        words = np.concatenate([records.ravel(), [init, length, records.shape[1], count]])
+        summaries.append((init, init + count * length, target, center, address, address + len(words) - 1))
+        data.append(words)
+        address += len(words)
+
+    header = bytearray(1024)
+    header[:8] = b"DAF/SPK "
+    header[8:16] = np.array([2, 6], dtype="<i4").tobytes()
+    header[76:88] = np.array([2, 2, address], dtype="<i4").tobytes()
+    header[88:96] = b"LTL-IEEE"
+    summary = bytearray(1024)
+    summary[:24] = np.array([0.0, 0.0, len(summaries)]).tobytes()
+    for slot, (start, end, target, center, first, last) in enumerate(summaries):
+        offset = 24 + slot * 40
+        summary[offset : offset + 16] = np.array([start, end]).tobytes()
+        summary[offset + 16 : offset + 40] = np.array([target, center, 1, 2, first, last], dtype="<i4").tobytes()
+    path.write_bytes(bytes(header) + bytes(summary) + b" " * 1024 + np.concatenate(data).astype("<f8").tobytes())
+
+
+def test_kernel_evaluates_chebyshev_segments(tmp_path) -> None:
+    rng = np.random.default_rng(7)
+    day = 86400.0
+    sun = rng.normal(size=(4, 3, 5))
+    earth = rng.normal(size=(8, 3, 7))
+    _write_kernel(
+        tmp_path / "test.bsp",
+        [(10, 0, -2 * day, day, sun), (3, 0, -2 * day, day / 2, earth), (399, 3, -2 * day, 4 * day, earth[:1] * 0)],
+    )
+    kernel = SpkKernel(tmp_path / "test.bsp")
+
+    jd = J2000 + np.array([-1.75, -0.2, 0.0, 1.9])
+    position = kernel.barycentric("sun", jd, np.zeros_like(jd))
+    for column, days in enumerate(jd - J2000):
+        record = int(np.floor(days + 2))
+        s = (days + 2 - record) * 2 - 1
+        expected = [np.polynomial.chebyshev.chebval(s, sun[record, axis]) for axis in range(3)]
+        assert np.allclose(position[:, column], expected)
+
+    helio = kernel.heliocentric("earth", jd, np.zeros_like(jd))
+    assert np.allclose(helio, kernel.segment_position(0, 3, jd, 0 * jd) - position)
+    with pytest.raises(ValueError):
+        kernel.barycentric("sun", np.array([J2000 + 3.0]), np.zeros(1))
+    with pytest.raises(KeyError):
+        kernel.barycentric("mars", jd, np.zeros_like(jd))
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from app.swiss import (
+    COMBUSTION_ORBS,
+    _abs_sep,
+    EventCatalogue,
+    _ascendant_sidereal_deg,
+    _ascendant_speed_bounds,
+    _find_sign_changes,
+    _initialise_once,
+    _planet_lon_fn,
+    _set_ayanamsa,
+    _sign_index,
+    catalogue_chunk_keys,
+    compute_catalogue_chunks,
+    compute_monthly,
+    compute_monthly_range,
+    compute_monthly_systems,
+    localise_months,
+)
+
+MUMBAI = (19.0760, 72.8777, "Asia/Kolkata")
+
+
+def test_monthly_range_matches_single_months() -> None:
+    months = ["2024-03-01", "2024-04-01"]
+    batch = compute_monthly_range(MUMBAI[2], months, "lahiri")
+    assert set(batch) == set(months)
+    for month_iso in months:
+        assert batch[month_iso] == compute_monthly(*MUMBAI, month_iso, "lahiri")
+
+
+def test_catalogue_chunks_are_independent_of_scan_runs() -> None:
+    months = ["2024-03-01"]
+    keys = catalogue_chunk_keys(months, "America/New_York")
+    together = compute_catalogue_chunks(keys, "tropical")
+    separate = {}
+    for key in keys:
+        chunk = compute_catalogue_chunks([key], "tropical")[key]
+        separate[key] = EventCatalogue.from_dict(chunk.to_dict())
+    assert localise_months(together, "America/New_York", months) == localise_months(
+        separate, "America/New_York", months
+    )
+
+
+def test_shared_scan_matches_per_system_runs() -> None:
+    months = ["2024-03-01"]
+    systems = compute_monthly_systems(MUMBAI[2], months, ["lahiri", "tropical"])
+    for ayanamsa in ("lahiri", "tropical"):
+        assert systems[ayanamsa] == compute_monthly_range(MUMBAI[2], months, ayanamsa)
+
+
+def test_ascendant_skip_ahead_matches_fixed_steps() -> None:
+    _initialise_once()
+    _set_ayanamsa("lahiri")
+    lat, lon, _ = MUMBAI
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    end = start + timedelta(hours=48)
+    asc_fn = lambda dt: _ascendant_sidereal_deg(dt, lat, lon)
+    fixed = _find_sign_changes(asc_fn, start, end, 5)
+    skipped = _find_sign_changes(asc_fn, start, end, 5, speed_bounds=_ascendant_speed_bounds(lat))
+    assert len(fixed) == len(skipped) > 20
+    for a, b in zip(fixed, skipped):
+        assert (a.from_index, a.to_index) == (b.from_index, b.to_index)
+        assert abs((a.time_utc - b.time_utc).total_seconds()) <= 1.0
+
+
+def test_mixed_ayanamsa_threads_match_sequential_runs() -> None:
+    keys = ["2024-03"]
+    systems = ["lahiri", "raman", "tropical"] * 2
+    sequential = {ay: compute_catalogue_chunks(keys, ay)["2024-03"].to_dict() for ay in set(systems)}
+    # Switch threads as often as possible so any shared ephemeris state would interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=len(systems)) as pool:
+            results = list(
+                pool.map(lambda ay: compute_catalogue_chunks(keys, ay)["2024-03"].to_dict(), systems)
+            )
+    finally:
+        sys.setswitchinterval(interval)
+    for ay, result in zip(systems, results):
+        assert result == sequential[ay]
+
+
+def test_velocity_extrema_match_known_moon_and_mercury_turns() -> None:
+    # Times and speeds from the exact-ephemeris scan; Moon perigee speeds are maxima
+    expected = [
+        ("Mercury", "max", "2024-03-07 12:10:00", 1.94203),
+        ("Moon", "max", "2024-03-10 08:56:29", 15.26268),
+        ("Moon", "min", "2024-03-23 23:12:03", 11.80611),
+    ]
+    rows = compute_monthly(*MUMBAI, "2024-03-01", "lahiri")["velocityRows"]
+    found = [row for row in rows if row["planet"] in ("Moon", "Mercury")]
+    assert [(row["planet"], row["kind"]) for row in found] == [(planet, kind) for planet, kind, _, _ in expected]
+    for row, (_, _, time_iso, speed) in zip(found, expected):
+        drift = datetime.fromisoformat(row["timeISO"]) - datetime.fromisoformat(time_iso)
+        assert abs(drift.total_seconds()) <= 2
+        assert abs(row["speed"] - speed) < 1e-5
+
+
+def test_sign_changes_report_first_second_in_new_sign() -> None:
+    _initialise_once()
+    _set_ayanamsa("lahiri")
+    moon = _planet_lon_fn("Moon")
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    changes = _find_sign_changes(moon, start, start + timedelta(days=30), 60)
+    assert len(changes) > 10
+    for change in changes:
+        assert change.time_utc.microsecond == 0
+        assert _sign_index(moon(change.time_utc)) == change.to_index
+        assert _sign_index(moon(change.time_utc - timedelta(seconds=1))) == change.from_index
+
+
+def test_combustion_edges_are_exact_in_every_timezone() -> None:
+    def windows(lat: float, lon: float, tz_name: str) -> list[tuple[str, datetime, datetime]]:
+        rows = compute_monthly(lat, lon, tz_name, "2024-03-01", "lahiri")["combRows"]
+        tz = ZoneInfo(tz_name)
+        return [
+            (
+                row["planet"],
+                datetime.fromisoformat(row["startISO"]).replace(tzinfo=tz).astimezone(timezone.utc),
+                datetime.fromisoformat(row["endISO"]).replace(tzinfo=tz).astimezone(timezone.utc),
+            )
+            for row in rows
+        ]
+
+    # Kolkata is UTC+05:30, so an hourly UTC grid is half an hour off its local one
+    kolkata = windows(*MUMBAI)
+    assert kolkata and kolkata == windows(40.7128, -74.0060, "America/New_York")
+
+    _set_ayanamsa("lahiri")
+    sun = _planet_lon_fn("Sun")
+    second = timedelta(seconds=1)
+    for planet, start, end in kolkata:
+        body = _planet_lon_fn(planet)
+        offset = lambda dt: _abs_sep(sun(dt), body(dt)) - COMBUSTION_ORBS[planet]  # noqa: E731
+        assert offset(start - second) > 0 >= offset(start)
+        assert offset(end - second) <= 0 < offset(end)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from app.tiles import TILE_SIZES, cover_spans, grid_key, tile_points, tile_spans, window_slice
+
+
+def test_tiles_cover_window_on_its_grid() -> None:
+    step = timedelta(hours=6)
+    start = datetime(2031, 5, 4, 7, tzinfo=timezone.utc)
+    end = start + timedelta(days=100)
+    spans = tile_spans(start, end, step, points=64)
+
+    points = [
+        span.first + k * step
+        for span in spans
+        for k in range(span.count)[window_slice(span, start, end, step)]
+    ]
+    expected = [start + k * step for k in range((end - start) // step + 1)]
+    assert points == expected
+    assert [span.index for span in spans] == list(range(spans[0].index, spans[-1].index + 1))
+
+    panned = start + 37 * step
+    assert grid_key(panned, step) == grid_key(start, step)
+    assert grid_key(start + timedelta(hours=1), step) != grid_key(start, step)
+    assert tile_spans(panned, panned + timedelta(days=3), step, points=64)[0] in spans
+
+
+def test_tile_size_follows_window_length() -> None:
+    assert tile_points(1) == TILE_SIZES[0]
+    assert [tile_points(count) for count in (31, 255, 256, 3000)] == [32, 32, 256, 2048]
+    start = datetime(2024, 5, 11)
+    spans = tile_spans(start, start + timedelta(days=30), timedelta(days=1))
+    assert {span.count for span in spans} == {32} and len(spans) <= 2
+
+
+def test_cover_spans_reuse_cached_tiles_of_other_sizes() -> None:
+    step = timedelta(days=1)
+    start = datetime(2024, 5, 11)
+    cached = set(cover_spans(start, start + timedelta(days=30), step, lambda span: False))
+
+    # A year computes 256-point tiles, except where 32-point tiles are already cached
+    year = cover_spans(start - timedelta(days=100), start + timedelta(days=265), step, cached.__contains__)
+    assert cached <= set(year) and {span.count for span in year} == {32, 256}
+    assert all(later.first == earlier.first + earlier.count * step for earlier, later in zip(year, year[1:]))
+
+    # Zooming back in inside a cached 256-point tile reuses it whole
+    cached |= set(year)
+    week = start + timedelta(days=120)
+    assert all(span in cached for span in cover_spans(week, week + timedelta(days=7), step, cached.__contains__))
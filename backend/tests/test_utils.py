@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pandas as pd
+
+from app import utils
+from app.utils import (
+    FetchError,
+    ResponseCache,
+    SingleFlight,
+    approx_size,
+    dataframe_to_candles,
+    dataframe_to_columns,
+    fetch_bars_async,
+)
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(ttl_seconds=60, max_entries=2)
+    cache.set("a", [1])
+    cache.set("b", [2])
+    assert cache.get("a") == [1]
+    cache.set("c", [3])
+    assert cache.get("b") is None
+    assert cache.get("a") == [1] and cache.get("c") == [3]
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"], stats["hits"], stats["misses"]) == (2, 1, 3, 1)
+
+
+def test_response_cache_respects_byte_budget_and_expiry() -> None:
+    row = {"time": 1, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10}
+    rows = [dict(row) for _ in range(1000)]
+    cache = ResponseCache(ttl_seconds=0, max_bytes=approx_size(rows) * 2)
+    for key in "abc":
+        cache.set(key, rows)
+    assert len(cache) == 2 and cache.stats()["bytes"] <= cache.max_bytes
+    assert cache.prune() == 2 and len(cache) == 0 and cache.stats()["bytes"] == 0
+
+
+def test_single_flight_shares_one_computation() -> None:
+    flight = SingleFlight()
+    calls = []
+
+    async def load() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def main() -> list:
+        return await asyncio.gather(*(flight.run("key", load) for _ in range(5)))
+
+    assert asyncio.run(main()) == [42] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 4}
+
+
+def test_fetch_bars_async_hedges_slow_candidates(monkeypatch) -> None:
+    started = []
+
+    def download(symbol: str, candidate: str, target_interval: str, period: str) -> pd.DataFrame:
+        started.append(candidate)
+        if candidate == "1d":
+            time.sleep(0.3)
+            raise FetchError("slow and empty")
+        return pd.DataFrame({"Close": [1.0]}, index=[candidate])
+
+    monkeypatch.setattr(utils, "_download_candidate", download)
+    monkeypatch.setattr(utils, "MARKET_DATA_HEDGE_DELAY", 0.05)
+    frame = asyncio.run(fetch_bars_async("aapl", "1d", "1mo"))
+    # The fallback started while the preferred interval was still running, and won once it failed
+    assert started[:2] == ["1d", "60m"]
+    assert list(frame.index) == ["60m"]
+
+
+def test_dataframe_to_candles_skips_non_finite_rows() -> None:
+    index = pd.to_datetime(["2024-01-02", "2024-01-01", "1969-12-31 23:59:59.5"], utc=True, format="ISO8601")
+    frame = pd.DataFrame(
+        {
+            "Open": [1.0, 2.0, 3.0],
+            "High": [float("nan"), 2.5, 3.5],
+            "Low": [0.5, 1.5, 2.5],
+            "Close": [1.0, 2.0, 3.0],
+            "Volume": [10.0, 20.9, 30.0],
+        },
+        index=index,
+    )
+    candles = dataframe_to_candles(frame)
+    assert [row["time"] for row in candles] == [0, 1704067200]
+    assert candles[1] == {"time": 1704067200, "open": 2.0, "high": 2.5, "low": 1.5, "close": 2.0, "volume": 20}
+    columns = dataframe_to_columns(frame)
+    assert columns["time"] == [row["time"] for row in candles]
+    assert columns["volume"] == [30, 20]
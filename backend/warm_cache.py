@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """
 Cache warming script to pre-populate planetary events from 1990-2030.
-Populates data for major cities in India and USA.
+Populates data for major cities in India and USA. The underlying UTC event
+catalogue is location-independent, so one city's run warms it for every user;
+other cities only pay the cheap per-timezone localisation step.
 """
 import asyncio
 import aiohttp
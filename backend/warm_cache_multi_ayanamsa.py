@@ -3,6 +3,9 @@
 Multi-Ayanamsa Cache Warming Script
 Pre-populate planetary events for all 3 ayanamsa systems (Lahiri, BV Raman, Tropical)
 for Mumbai and New York from 1990-2030.
+
+Each batch asks for all three systems at once (``ayanamsas``), so the server
+runs one shared ephemeris scan per batch instead of one per system.
 """
 import asyncio
 import aiohttp
@@ -54,23 +57,21 @@ def generate_month_batches(start_year: int, end_year: int, batch_size: int) -> L
     return batches
 
 
-async def warm_cache_for_location_ayanamsa(
+async def warm_cache_for_location(
     session: aiohttp.ClientSession,
     location: dict,
     country: str,
-    ayanamsa: str,
-    ayanamsa_desc: str,
-    total_combos: int,
-    current_combo_idx: int
+    total_locations: int,
+    current_location_idx: int
 ) -> dict:
-    """Warm cache for a specific location and ayanamsa."""
+    """Warm cache for a specific location, all ayanamsa systems per request."""
     name = location["name"]
     lat = location["lat"]
     lon = location["lon"]
     tz = location["tz"]
 
     print(f"\n{'='*80}")
-    print(f"[{current_combo_idx}/{total_combos}] {country} - {name} - {ayanamsa_desc}")
+    print(f"[{current_location_idx}/{total_locations}] {country} - {name} - {', '.join(AYANAMSA_SYSTEMS)}")
     print(f"{'='*80}")
 
     batches = generate_month_batches(START_YEAR, END_YEAR, BATCH_SIZE)
@@ -88,21 +89,29 @@ async def warm_cache_for_location_ayanamsa(
             "lon": lon,
             "tz": tz,
             "monthStartISOs": month_batch,
-            "ayanamsa": ayanamsa  # Include ayanamsa in request
+            "ayanamsa": "lahiri",
+            "ayanamsas": list(AYANAMSA_SYSTEMS),  # All systems from one ephemeris scan
         }
 
         try:
             async with session.post(API_URL, json=payload, timeout=aiohttp.ClientTimeout(total=180)) as response:
                 if response.status == 200:
                     data = await response.json()
-                    if data.get("ok"):
+                    failed = [
+                        f"{ayanamsa} {month}"
+                        for ayanamsa, months in data.get("systems", {}).items()
+                        for month, result in months.items()
+                        if not result.get("ok")
+                    ]
+                    if data.get("ok") and not failed:
                         success_count += 1
                         year_start = month_batch[0][:4]
                         year_end = month_batch[-1][:4]
                         print(f"✅ Batch {batch_idx}/{total_batches}: {year_start}-{year_end} ({len(month_batch)} months)")
                     else:
                         error_count += 1
-                        print(f"❌ Batch {batch_idx}/{total_batches}: Failed - {data.get('error', 'Unknown error')}")
+                        error = data.get("error") or f"{len(failed)} months failed ({', '.join(failed[:3])})"
+                        print(f"❌ Batch {batch_idx}/{total_batches}: Failed - {error}")
                 else:
                     error_count += 1
                     print(f"❌ Batch {batch_idx}/{total_batches}: HTTP {response.status}")
@@ -113,10 +122,10 @@ async def warm_cache_for_location_ayanamsa(
             error_count += 1
             print(f"❌ Batch {batch_idx}/{total_batches}: {str(e)}")
 
-    print(f"\n✨ {name} ({ayanamsa}) Complete: {success_count} succeeded, {error_count} failed")
+    print(f"\n✨ {name} Complete: {success_count} succeeded, {error_count} failed")
 
     return {
-        "location": f"{country} - {name} - {ayanamsa}",
+        "location": f"{country} - {name}",
         "success": success_count,
         "errors": error_count,
         "total": total_batches
@@ -143,7 +152,6 @@ async def main():
     print(f"📍 Locations: {sum(len(locs) for locs in LOCATIONS.values())} cities")
     print(f"🔮 Ayanamsa Systems: {len(AYANAMSA_SYSTEMS)} (Lahiri, Raman, Tropical)")
     print(f"📦 Total combinations: {sum(len(locs) for locs in LOCATIONS.values()) * len(AYANAMSA_SYSTEMS)}")
-    print(f"⏱️  Estimated time: ~4-6 hours total")
     print("="*80 + "\n")
 
     async with aiohttp.ClientSession() as session:
@@ -155,22 +163,20 @@ async def main():
             print(f"   Months cached: {initial_stats.get('total_months_cached', 0)}")
             print(f"   Unique locations: {initial_stats.get('unique_locations', 0)}\n")
 
-        # Calculate total combinations
-        total_combos = sum(len(locs) for locs in LOCATIONS.values()) * len(AYANAMSA_SYSTEMS)
+        total_locations = sum(len(locs) for locs in LOCATIONS.values())
         current_idx = 0
 
-        # Warm cache for all location + ayanamsa combinations
+        # Warm cache for every location; each request covers all ayanamsa systems
         results = []
         start_time = datetime.now()
 
         for country, locations in LOCATIONS.items():
             for location in locations:
-                for ayanamsa, ayanamsa_desc in AYANAMSA_SYSTEMS.items():
-                    current_idx += 1
-                    result = await warm_cache_for_location_ayanamsa(
-                        session, location, country, ayanamsa, ayanamsa_desc, total_combos, current_idx
-                    )
-                    results.append(result)
+                current_idx += 1
+                result = await warm_cache_for_location(
+                    session, location, country, total_locations, current_idx
+                )
+                results.append(result)
 
         # Get final cache stats
         print("\n" + "="*80)
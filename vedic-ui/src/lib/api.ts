@@ -49,17 +49,23 @@ export async function fetchOHLC({
   symbol,
   interval,
   period = DEFAULT_PERIOD,
+  start,
+  end,
 }: {
   symbol: string;
   interval: Interval;
   period?: Period;
+  /** Unix seconds; overrides period, e.g. to load older history when panning left */
+  start?: number;
+  /** Unix seconds; only bars before this time */
+  end?: number;
 }): Promise<Candle[]> {
   const normalized = symbol.trim().toUpperCase();
   if (!normalized) {
     throw new Error("Symbol is required");
   }
 
-  const qs = toQuery({ symbol: normalized, interval, period });
+  const qs = toQuery({ symbol: normalized, interval, period, start, end });
   const response = await fetch(`${API_BASE}/api/ohlc?${qs}`, {
     headers: { Accept: "application/json" },
   });